@@ -4,36 +4,91 @@ import json
 import logging
 import os
 import sys
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 
-# Add src to path to allow imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
+import boto3  # noqa: F401  # Loaded during Lambda Init rather than on first invocation
+import botocore.session  # noqa: F401
+import orjson
 
-from src.cli import run_etl
+# Add src to path to allow imports (only once, to avoid an extra lookup per import)
+_SRC_DIR = os.path.join(os.path.dirname(__file__), "src")
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
+
+from src.application.etl_use_case import ETLUseCase
+from src.cli import build_etl_use_case, run_etl
 
 # Configure logging on module import
 _logger = logging.getLogger(__name__)
 
 
+# CloudWatch already timestamps every line, so the format skips %(asctime)s
+_LOG_FORMAT = "%(name)s - %(levelname)s - %(message)s"
+_NOISY_LOGGERS = ("urllib3", "botocore", "boto3", "s3transfer")
+
+
 def _configure_logging() -> None:
     """Configure logging for Lambda environment."""
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
-    
+    root_logger = logging.getLogger()
+    if root_logger.handlers:
+        # Lambda runtime already installs a root handler, so basicConfig would be a no-op
+        formatter = logging.Formatter(_LOG_FORMAT)
+        for handler in root_logger.handlers:
+            handler.setFormatter(formatter)
+    else:
+        logging.basicConfig(level=logging.INFO, format=_LOG_FORMAT)
+
     # Suppress noisy third-party logs
-    logging.getLogger("urllib3").setLevel(logging.WARNING)
-    logging.getLogger("botocore").setLevel(logging.WARNING)
-    logging.getLogger("boto3").setLevel(logging.WARNING)
-    logging.getLogger("s3transfer").setLevel(logging.WARNING)
+    for name in _NOISY_LOGGERS:
+        logging.getLogger(name).setLevel(logging.WARNING)
 
 
 # Initialize logging
 _configure_logging()
 logger = _logger
 
+# Lambda environment variables do not change after Init
+_ENV_DATASET_ID = os.environ.get("DATASET_ID")
+
+_NO_DATASET_ERR = (
+    "dataset_id not found in event. Expected one of: "
+    "event['dataset_id'], event['detail']['dataset_id'], "
+    "event['Records'][0]['body']['dataset_id'], or DATASET_ID env var"
+)
+
+# Fixed fragments of the success response body, byte-identical to orjson output
+_OK_BODY_PREFIX = '{"message":"ETL completed successfully for dataset: '
+_OK_BODY_MIDDLE = '","dataset_id":"'
+_OK_BODY_SUFFIX = '"}'
+
+# ETL pipelines built once per container and reused across warm invocations
+_ETL_PIPELINES: Dict[str, Tuple[ETLUseCase, Dict[str, Any]]] = {}
+
+
+def _prebuild_etl_pipeline() -> None:
+    """Build the ETL pipeline for DATASET_ID during Lambda Init, if configured."""
+    dataset_id = _ENV_DATASET_ID
+    if not dataset_id:
+        return
+
+    try:
+        _ETL_PIPELINES[dataset_id] = build_etl_use_case(dataset_id)
+    except Exception as e:  # noqa: BLE001
+        # Defer to the invocation path, which reports the error properly
+        _logger.warning("Could not prebuild ETL pipeline for %s: %s", dataset_id, e)
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize an object to a JSON string using orjson.
+
+    Args:
+        obj: Object to serialize.
+
+    Returns:
+        JSON string.
+    """
+    return orjson.dumps(obj).decode()
+
 
 # ============================================================================
 # Event Parsing Functions
@@ -51,6 +106,34 @@ def _extract_from_direct_invocation(event: Dict[str, Any]) -> Optional[str]:
     return event.get("dataset_id")
 
 
+def _dataset_id_from_detail(detail: Any) -> Optional[str]:
+    """Extract dataset_id from an EventBridge 'detail' value.
+
+    Args:
+        detail: Value of event['detail'].
+
+    Returns:
+        Dataset identifier if found, None otherwise.
+    """
+    if isinstance(detail, dict):
+        return detail.get("dataset_id")
+    return None
+
+
+def _dataset_id_from_records(records: Any) -> Optional[str]:
+    """Extract dataset_id from an SQS 'Records' value.
+
+    Args:
+        records: Value of event['Records'].
+
+    Returns:
+        Dataset identifier if found, None otherwise.
+    """
+    if isinstance(records, list) and records:
+        return _extract_from_sqs_record(records[0])
+    return None
+
+
 def _extract_from_eventbridge(event: Dict[str, Any]) -> Optional[str]:
     """Extract dataset_id from EventBridge event.
     
@@ -60,10 +143,7 @@ def _extract_from_eventbridge(event: Dict[str, Any]) -> Optional[str]:
     Returns:
         Dataset identifier if found, None otherwise.
     """
-    detail = event.get("detail")
-    if isinstance(detail, dict):
-        return detail.get("dataset_id")
-    return None
+    return _dataset_id_from_detail(event.get("detail"))
 
 
 def _extract_from_sqs_record(record: Dict[str, Any]) -> Optional[str]:
@@ -80,22 +160,15 @@ def _extract_from_sqs_record(record: Dict[str, Any]) -> Optional[str]:
         return None
     
     try:
-        # Try parsing body as JSON
-        parsed_body = json.loads(body)
-        
-        # If it's a dict, check for dataset_id
-        if isinstance(parsed_body, dict):
-            return parsed_body.get("dataset_id")
-        
-        # If it's a string, try parsing again (double-encoded case)
+        parsed_body = orjson.loads(body)
+        # Double-encoded case: the outer JSON string holds the payload document
         if isinstance(parsed_body, str):
-            double_parsed = json.loads(parsed_body)
-            if isinstance(double_parsed, dict):
-                return double_parsed.get("dataset_id")
-    
-    except (json.JSONDecodeError, TypeError):
-        pass
-    
+            parsed_body = orjson.loads(parsed_body)
+    except (orjson.JSONDecodeError, json.JSONDecodeError, TypeError):
+        return None
+
+    if isinstance(parsed_body, dict):
+        return parsed_body.get("dataset_id")
     return None
 
 
@@ -108,11 +181,7 @@ def _extract_from_sqs(event: Dict[str, Any]) -> Optional[str]:
     Returns:
         Dataset identifier if found, None otherwise.
     """
-    records = event.get("Records")
-    if not isinstance(records, list) or len(records) == 0:
-        return None
-    
-    return _extract_from_sqs_record(records[0])
+    return _dataset_id_from_records(event.get("Records"))
 
 
 def _extract_from_environment() -> Optional[str]:
@@ -121,7 +190,15 @@ def _extract_from_environment() -> Optional[str]:
     Returns:
         Dataset identifier if found, None otherwise.
     """
-    return os.environ.get("DATASET_ID")
+    return _ENV_DATASET_ID
+
+
+# Event keys in order of precedence, each mapped to the extractor for its value
+_EVENT_SOURCES: Tuple[Tuple[str, Callable[[Any], Optional[str]]], ...] = (
+    ("dataset_id", lambda value: value),
+    ("detail", _dataset_id_from_detail),
+    ("Records", _dataset_id_from_records),
+)
 
 
 def extract_dataset_id(event: Dict[str, Any]) -> str:
@@ -142,31 +219,19 @@ def extract_dataset_id(event: Dict[str, Any]) -> str:
     Raises:
         ValueError: If dataset_id cannot be extracted from event.
     """
-    # Try direct invocation
-    dataset_id = _extract_from_direct_invocation(event)
-    if dataset_id:
-        return dataset_id
-    
-    # Try EventBridge
-    dataset_id = _extract_from_eventbridge(event)
-    if dataset_id:
-        return dataset_id
-    
-    # Try SQS
-    dataset_id = _extract_from_sqs(event)
+    for key, extract in _EVENT_SOURCES:
+        value = event.get(key)
+        if value:
+            dataset_id = extract(value)
+            if dataset_id:
+                return dataset_id
+
+    # Environment variable
+    dataset_id = _ENV_DATASET_ID
     if dataset_id:
         return dataset_id
-    
-    # Try environment variable
-    dataset_id = _extract_from_environment()
-    if dataset_id:
-        return dataset_id
-    
-    raise ValueError(
-        "dataset_id not found in event. Expected one of: "
-        "event['dataset_id'], event['detail']['dataset_id'], "
-        "event['Records'][0]['body']['dataset_id'], or DATASET_ID env var"
-    )
+
+    raise ValueError(_NO_DATASET_ERR)
 
 
 # ============================================================================
@@ -200,11 +265,12 @@ def _create_response(
     if error:
         body["error"] = error
     
-    body.update(extra_fields)
+    if extra_fields:
+        body.update(extra_fields)
     
     return {
         "statusCode": status_code,
-        "body": json.dumps(body),
+        "body": _dumps(body),
     }
 
 
@@ -217,11 +283,18 @@ def _create_success_response(dataset_id: str) -> Dict[str, Any]:
     Returns:
         Lambda response dictionary with status 200.
     """
-    return _create_response(
-        status_code=200,
-        message=f"ETL completed successfully for dataset: {dataset_id}",
-        dataset_id=dataset_id,
-    )
+    if '"' in dataset_id or "\\" in dataset_id or not dataset_id.isprintable():
+        # Needs JSON escaping, let the serializer handle it
+        body = _dumps(
+            {
+                "message": f"ETL completed successfully for dataset: {dataset_id}",
+                "dataset_id": dataset_id,
+            }
+        )
+    else:
+        body = _OK_BODY_PREFIX + dataset_id + _OK_BODY_MIDDLE + dataset_id + _OK_BODY_SUFFIX
+
+    return {"statusCode": 200, "body": body}
 
 
 def _create_failure_response(dataset_id: str, exit_code: int) -> Dict[str, Any]:
@@ -288,7 +361,7 @@ def _process_etl_pipeline(dataset_id: str) -> int:
         Exit code (0 for success, non-zero for failure).
     """
     logger.info("Processing dataset: %s", dataset_id)
-    exit_code = run_etl(dataset_id)
+    exit_code = run_etl(dataset_id, _ETL_PIPELINES)
     
     if exit_code == 0:
         logger.info("ETL completed successfully for dataset: %s", dataset_id)
@@ -298,6 +371,12 @@ def _process_etl_pipeline(dataset_id: str) -> int:
     return exit_code
 
 
+# The missing-dataset response is fully deterministic, so build it once
+_BAD_REQUEST_NO_DATASET = _create_bad_request_response(_NO_DATASET_ERR)
+
+_prebuild_etl_pipeline()
+
+
 # ============================================================================
 # Lambda Handler
 # ============================================================================
@@ -313,7 +392,14 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         Response dictionary with statusCode and body.
     """
     try:
-        logger.info("Received event: %s", json.dumps(event))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Received event: %s", _dumps(event))
+        else:
+            logger.info(
+                "Received event: keys=%s records=%d",
+                list(event.keys()),
+                len(event.get("Records") or ()),
+            )
         
         # Extract dataset_id from event
         dataset_id = extract_dataset_id(event)
@@ -329,13 +415,11 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     
     except ValueError as e:
         logger.error("Invalid event: %s", e)
-        return _create_bad_request_response(str(e))
-    
-    except (RuntimeError, OSError, TypeError) as e:
-        logger.exception("Error processing event: %s", e)
-        return _create_internal_error_response(str(e))
+        error_message = str(e)
+        if error_message == _NO_DATASET_ERR:
+            return dict(_BAD_REQUEST_NO_DATASET)
+        return _create_bad_request_response(error_message)
     
     except Exception as e:  # noqa: BLE001
-        # Catch-all for any other unexpected errors
-        logger.exception("Unexpected error processing event: %s", e)
+        logger.exception("Error processing event: %s", e)
         return _create_internal_error_response(str(e))
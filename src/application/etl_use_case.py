@@ -2,7 +2,9 @@
 
 import logging
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+from botocore.exceptions import BotoCoreError, ClientError
 
 from ..domain.interfaces import (
     Extractor,
@@ -14,6 +16,7 @@ from ..domain.interfaces import (
     Transformer,
 )
 from ..infrastructure.utils.date_utils import get_window_start_date
+from ..infrastructure.versioning import VersionManager
 from .projection_use_case import ProjectionUseCase
 
 logger = logging.getLogger(__name__)
@@ -51,8 +54,11 @@ class ETLUseCase:
         self._transformer = transformer
         self._loader = loader
         self._state_manager = state_manager
+        self._has_state = state_manager is not None
         self._lock_manager = lock_manager
         self._projection_use_case = projection_use_case
+        self._version_managers: Dict[Tuple[str, str], VersionManager] = {}
+        self._steps = self._build_step_plan()
 
     @property
     def extractor(self):
@@ -129,91 +135,117 @@ class ETLUseCase:
                 logger.info("Releasing lock: %s", lock_key)
                 self._lock_manager.release(lock_key)
 
+    def close(self) -> None:
+        """Release resources held by the pipeline, such as the projection worker pool."""
+        if self._projection_use_case:
+            self._projection_use_case.close()
+
     def _execute_etl(self, config: dict):
         """Execute ETL steps without lock management."""
-        total_steps = self._calculate_total_steps()
-        step_number = 1
-
-        raw_data = self._execute_extract(step_number, total_steps)
-        step_number += 1
-
-        series_last_dates = self._load_state(config)
-        data = self._execute_parse(raw_data, config, series_last_dates, step_number, total_steps)
-        step_number += 1
-
-        data = self._execute_normalize(data, config, step_number, total_steps)
-        step_number += 1
-
-        data = self._execute_transform(data, config, step_number, total_steps)
-        step_number += 1
+        raw_data = self._execute_extract()
 
+        series_last_dates = self._load_state(config) if self._has_state else None
+        data = self._execute_parse(raw_data, config, series_last_dates)
+        data = self._execute_normalize(data, config)
+        data = self._execute_transform(data, config)
         data = self._apply_window_filter(data, config)
 
-        self._execute_load(data, config, step_number, total_steps)
+        self._execute_load(data, config)
 
         logger.info("ETL pipeline completed. Total data points processed: %d", len(data))
         return data
 
-    def _calculate_total_steps(self) -> int:
-        """Calculate total number of ETL steps."""
-        steps = 5  # Extract, Parse, Normalize, Transform, Load
-        if self._projection_use_case:
-            steps += 1
-        return steps
+    def _build_step_plan(self) -> Dict[str, Tuple[int, int]]:
+        """Map each configured ETL step to its (step_number, total_steps) position."""
+        step_names = ["Extract"]
+        if self._parser:
+            step_names.append("Parse")
+        if self._normalizer:
+            step_names.append("Normalize")
+        if self._transformer:
+            step_names.append("Transform")
+        if self._loader:
+            step_names.append("Load")
+            if self._projection_use_case:
+                step_names.append("Project")
+
+        total_steps = len(step_names)
+        return {name: (number, total_steps) for number, name in enumerate(step_names, 1)}
+
+    def _log_step(self, name: str, description: str, *args: Any) -> None:
+        """Log the start of a configured ETL step.
 
-    def _execute_extract(self, step_number: int, total_steps: int) -> bytes:
+        Args:
+            name: Step name.
+            description: Step description, may contain %-style placeholders.
+            *args: Arguments for the description placeholders, formatted lazily.
+        """
+        if logger.isEnabledFor(logging.INFO):
+            step_number, total_steps = self._steps[name]
+            logger.info(
+                "Step %d/%d: %s - " + description, step_number, total_steps, name, *args
+            )
+
+    def _execute_extract(self) -> bytes:
         """Execute extract step."""
-        logger.info("Step %d/%d: Extract - Retrieving raw data from source", step_number, total_steps)
+        self._log_step("Extract", "Retrieving raw data from source")
         raw_data = self._extractor.extract()
         logger.info("Extracted %d bytes of raw data", len(raw_data))
         return raw_data
 
     def _load_state(self, config: dict) -> Optional[dict]:
-        """Load state for incremental processing."""
-        if not self._state_manager:
-            return None
+        """Load state for incremental processing.
 
+        Only called when a state manager is configured. Storage errors are logged and
+        processing continues without state; any other error propagates.
+        """
         logger.info("Loading state for incremental processing")
         try:
-            series_last_dates = self._state_manager.get_series_last_dates(config)
+            series_last_dates = self._state_manager.get_series_last_dates(config)  # type: ignore[union-attr]
             if series_last_dates:
                 logger.info("Found state for %d series", len(series_last_dates))
             else:
                 logger.info("No previous state found, processing all data")
             return series_last_dates
-        except Exception as e:
+        except (OSError, ValueError, ClientError, BotoCoreError) as e:
             logger.error("Error loading state: %s", e, exc_info=True)
             logger.warning("Continuing without state (will process all data)")
             return None
 
-    def _execute_parse(self, raw_data: bytes, config: dict, series_last_dates: Optional[dict], step_number: int, total_steps: int) -> list:
+    def _execute_parse(self, raw_data: bytes, config: dict, series_last_dates: Optional[dict]) -> list:
         """Execute parse step."""
-        logger.info("Step %d/%d: Parse - Converting raw data to structured format", step_number, total_steps)
-        data = self._parser.parse(raw_data, config, series_last_dates) if self._parser else []
+        if not self._parser:
+            logger.debug("Parse - Skipped (no parser configured)")
+            return []
+
+        self._log_step("Parse", "Converting raw data to structured format")
+        data = self._parser.parse(raw_data, config, series_last_dates)
         logger.info("Parsed %d data points", len(data))
         return data
 
-    def _execute_normalize(self, data: list, config: dict, step_number: int, total_steps: int) -> list:
+    def _execute_normalize(self, data: list, config: dict) -> list:
         """Execute normalize step."""
-        if self._normalizer:
-            logger.info("Step %d/%d: Normalize - Standardizing data structure", step_number, total_steps)
-            data = self._normalizer.normalize(data, config)
-            logger.info("Normalized %d data points", len(data))
-            if self._state_manager:
-                logger.info("Saving state after normalization")
-                self._state_manager.save_dates_from_data(data)
-        else:
-            logger.info("Step %d/%d: Normalize - Skipped (no normalizer configured)", step_number, total_steps)
+        if not self._normalizer:
+            logger.debug("Normalize - Skipped (no normalizer configured)")
+            return data
+
+        self._log_step("Normalize", "Standardizing data structure")
+        data = self._normalizer.normalize(data, config)
+        logger.info("Normalized %d data points", len(data))
+        if self._has_state:
+            logger.info("Saving state after normalization")
+            self._state_manager.save_dates_from_data(data)  # type: ignore[union-attr]
         return data
 
-    def _execute_transform(self, data: list, config: dict, step_number: int, total_steps: int) -> list:
+    def _execute_transform(self, data: list, config: dict) -> list:
         """Execute transform step."""
-        if self._transformer:
-            logger.info("Step %d/%d: Transform - Enriching data with metadata", step_number, total_steps)
-            data = self._transformer.transform(data, config)
-            logger.info("Transformed %d data points", len(data))
-        else:
-            logger.info("Step %d/%d: Transform - Skipped (no transformer configured)", step_number, total_steps)
+        if not self._transformer:
+            logger.debug("Transform - Skipped (no transformer configured)")
+            return data
+
+        self._log_step("Transform", "Enriching data with metadata")
+        data = self._transformer.transform(data, config)
+        logger.info("Transformed %d data points", len(data))
         return data
 
     def _apply_window_filter(self, data: List[Dict[str, Any]], config: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -259,26 +291,24 @@ class ETLUseCase:
                    len(filtered_data), len(data), len(data) - len(filtered_data))
         return filtered_data
 
-    def _execute_load(self, data: list, config: dict, step_number: int, total_steps: int) -> None:
+    def _execute_load(self, data: list, config: dict) -> None:
         """Execute load step and projection if configured."""
-        if self._loader:
-            logger.info("Step %d/%d: Load - Persisting data to destination", step_number, total_steps)
-            self._loader.load(data, config)
-            logger.info("Data loaded successfully")
+        if not self._loader:
+            logger.debug("Load - Skipped (no loader configured)")
+            return
 
-            if self._projection_use_case:
-                projection_step = step_number + 1
-                self._execute_projection(config, projection_step, total_steps)
-        else:
-            logger.info("Step %d/%d: Load - Skipped (no loader configured)", step_number, total_steps)
+        self._log_step("Load", "Persisting data to destination")
+        self._loader.load(data, config)
+        logger.info("Data loaded successfully")
+
+        if self._projection_use_case:
+            self._execute_projection(config)
 
-    def _execute_projection(self, config: dict, step_number: int, total_steps: int) -> None:
+    def _execute_projection(self, config: dict) -> None:
         """Execute projection after successful load.
 
         Args:
             config: Configuration dictionary containing dataset_id and bucket.
-            step_number: Current step number for logging.
-            total_steps: Total number of steps for logging.
         """
         dataset_id = config.get("dataset_id", "default")
         load_config = config.get("load", {})
@@ -289,7 +319,7 @@ class ETLUseCase:
             logger.warning("Cannot execute projection: bucket not found in config")
             return
 
-        logger.info("Step %d/%d: Project - Executing projection for dataset %s", step_number, total_steps, dataset_id)
+        self._log_step("Project", "Executing projection for dataset %s", dataset_id)
 
         try:
             version_id = self._get_current_version_id(bucket, aws_region, dataset_id)
@@ -318,13 +348,7 @@ class ETLUseCase:
         Returns:
             Version ID or None if not found.
         """
-        from src.infrastructure.versioning import VersionManager
-
-        # Reuse the S3 client from the loader if available, otherwise create a new one
-        s3_client = getattr(self._loader, "_s3_client", None)
-        version_manager = VersionManager(
-            bucket=bucket, s3_client=s3_client, aws_region=aws_region
-        )
+        version_manager = self._get_version_manager(bucket, aws_region)
         version_id = version_manager.get_current_version(dataset_id)
 
         if not version_id:
@@ -335,3 +359,25 @@ class ETLUseCase:
             return None
 
         return version_id
+
+    def _get_version_manager(self, bucket: str, aws_region: str) -> VersionManager:
+        """Get a cached VersionManager for a bucket and region.
+
+        Args:
+            bucket: S3 bucket name.
+            aws_region: AWS region.
+
+        Returns:
+            VersionManager instance, created on first use.
+        """
+        key = (bucket, aws_region)
+        version_manager = self._version_managers.get(key)
+        if version_manager is None:
+            # Reuse the S3 client from the loader if it implements SupportsS3Client,
+            # otherwise create a new one
+            s3_client = getattr(self._loader, "s3_client", None)
+            version_manager = VersionManager(
+                bucket=bucket, s3_client=s3_client, aws_region=aws_region
+            )
+            self._version_managers[key] = version_manager
+        return version_manager
@@ -1,65 +1,142 @@
 """Plugin registry for managing plugins."""
 
-from typing import Any, Dict, Optional, Type
+import importlib
+import threading
+from typing import Any, Dict, Optional, Type, TypeVar, Union
 
 from ..domain.interfaces import Extractor, Loader, Normalizer, Parser, Transformer
 
+_T = TypeVar("_T")
+
+# How each plugin interface is instantiated by PluginRegistry.get
+_OPTIONAL_CONFIG = "optional_config"  # plugin_class(config) or plugin_class()
+_SHARED = "shared"  # one shared plugin_class() instance
+_CONFIG_KEYWORD = "config_keyword"  # plugin_class(config=config)
+
 
 class PluginRegistry:
-    """Registry for managing and retrieving plugins."""
+    """Registry for managing and retrieving plugins.
+
+    Plugins can be registered by class or by a "package.module:ClassName" import
+    path; path registrations are imported on first use so that heavy plugin
+    dependencies are only loaded for the plugins a pipeline actually uses.
+
+    Parsers, normalizers and transformers take no configuration and are shared: each
+    name is instantiated once and the same instance is returned on every call, so
+    those plugins must be stateless and thread-safe. Extractors and loaders are
+    created per call because their configuration differs.
+    """
+
+    __slots__ = ("_bins", "_instances", "_instances_lock")
+
+    _CONSTRUCTION: Dict[type, str] = {
+        Extractor: _OPTIONAL_CONFIG,
+        Parser: _SHARED,
+        Normalizer: _SHARED,
+        Transformer: _SHARED,
+        Loader: _CONFIG_KEYWORD,
+    }
 
     def __init__(self):
         """Initialize plugin registry."""
-        self._extractors: Dict[str, Type[Extractor]] = {}
-        self._parsers: Dict[str, Type[Parser]] = {}
-        self._normalizers: Dict[str, Type[Normalizer]] = {}
-        self._transformers: Dict[str, Type[Transformer]] = {}
-        self._loaders: Dict[str, Type[Loader]] = {}
+        self._bins: Dict[type, Dict[str, Union[Type[Any], str]]] = {
+            interface: {} for interface in self._CONSTRUCTION
+        }
+        self._instances: Dict[Type[Any], Any] = {}
+        self._instances_lock = threading.Lock()
+
+    def register(
+        self, interface: Type[_T], name: str, plugin_class: Union[Type[_T], str]
+    ) -> None:
+        """Register a plugin for an interface.
 
-    def register_extractor(self, name: str, plugin_class: Type[Extractor]) -> None:
+        Args:
+            interface: Plugin interface (Extractor, Parser, Normalizer, Transformer or Loader).
+            name: Plugin name identifier.
+            plugin_class: Plugin class to register, or its "package.module:ClassName"
+                import path to import on first use.
+        """
+        self._bins[interface][name] = plugin_class
+
+    def get(
+        self, interface: Type[_T], name: str, config: Optional[Dict[str, Any]] = None
+    ) -> _T:
+        """Get a plugin instance for an interface by name.
+
+        Args:
+            interface: Plugin interface (Extractor, Parser, Normalizer, Transformer or Loader).
+            name: Plugin name identifier.
+            config: Optional configuration for plugin initialization. Ignored by
+                shared (configuration-free) plugins.
+
+        Returns:
+            Plugin instance.
+
+        Raises:
+            ValueError: If plugin not found or config is required but not provided.
+        """
+        plugin_class = self._resolve(interface, name)
+
+        construction = self._CONSTRUCTION[interface]
+        if construction == _SHARED:
+            return self._get_shared_instance(plugin_class)
+        if construction == _CONFIG_KEYWORD:
+            return plugin_class(config=config)  # type: ignore[call-arg]
+
+        if config is not None:
+            return plugin_class(config)  # type: ignore[call-arg]
+        # Try to instantiate without config, but this may fail for plugins that require config
+        try:
+            return plugin_class()
+        except TypeError:
+            raise ValueError(
+                f"{interface.__name__} plugin '{name}' requires configuration but none was provided"
+            ) from None
+
+    def register_extractor(self, name: str, plugin_class: Union[Type[Extractor], str]) -> None:
         """Register an extractor plugin.
 
         Args:
             name: Plugin name identifier.
-            plugin_class: Extractor class to register.
+            plugin_class: Extractor class to register, or its import path.
         """
-        self._extractors[name] = plugin_class
+        self.register(Extractor, name, plugin_class)
 
-    def register_parser(self, name: str, plugin_class: Type[Parser]) -> None:
+    def register_parser(self, name: str, plugin_class: Union[Type[Parser], str]) -> None:
         """Register a parser plugin.
 
         Args:
             name: Plugin name identifier.
-            plugin_class: Parser class to register.
+            plugin_class: Parser class to register, or its import path.
         """
-        self._parsers[name] = plugin_class
+        self.register(Parser, name, plugin_class)
 
-    def register_normalizer(self, name: str, plugin_class: Type[Normalizer]) -> None:
+    def register_normalizer(self, name: str, plugin_class: Union[Type[Normalizer], str]) -> None:
         """Register a normalizer plugin.
 
         Args:
             name: Plugin name identifier.
-            plugin_class: Normalizer class to register.
+            plugin_class: Normalizer class to register, or its import path.
         """
-        self._normalizers[name] = plugin_class
+        self.register(Normalizer, name, plugin_class)
 
-    def register_transformer(self, name: str, plugin_class: Type[Transformer]) -> None:
+    def register_transformer(self, name: str, plugin_class: Union[Type[Transformer], str]) -> None:
         """Register a transformer plugin.
 
         Args:
             name: Plugin name identifier.
-            plugin_class: Transformer class to register.
+            plugin_class: Transformer class to register, or its import path.
         """
-        self._transformers[name] = plugin_class
+        self.register(Transformer, name, plugin_class)
 
-    def register_loader(self, name: str, plugin_class: Type[Loader]) -> None:
+    def register_loader(self, name: str, plugin_class: Union[Type[Loader], str]) -> None:
         """Register a loader plugin.
 
         Args:
             name: Plugin name identifier.
-            plugin_class: Loader class to register.
+            plugin_class: Loader class to register, or its import path.
         """
-        self._loaders[name] = plugin_class
+        self.register(Loader, name, plugin_class)
 
     def get_extractor(self, name: str, config: Optional[Dict[str, Any]] = None) -> Extractor:
         """Get an extractor plugin by name.
@@ -74,18 +151,7 @@ class PluginRegistry:
         Raises:
             ValueError: If plugin not found or config is required but not provided.
         """
-        if name not in self._extractors:
-            raise ValueError(f"Extractor plugin '{name}' not found")
-        plugin_class = self._extractors[name]
-        if config is not None:
-            return plugin_class(config)  # type: ignore[call-arg]
-        # Try to instantiate without config, but this may fail for extractors that require config
-        try:
-            return plugin_class()  # type: ignore[call-arg]
-        except TypeError:
-            raise ValueError(
-                f"Extractor plugin '{name}' requires configuration but none was provided"
-            ) from None
+        return self.get(Extractor, name, config)
 
     def get_parser(self, name: str) -> Parser:
         """Get a parser plugin by name.
@@ -99,9 +165,7 @@ class PluginRegistry:
         Raises:
             ValueError: If plugin not found.
         """
-        if name not in self._parsers:
-            raise ValueError(f"Parser plugin '{name}' not found")
-        return self._parsers[name]()
+        return self.get(Parser, name)
 
     def get_normalizer(self, name: str) -> Normalizer:
         """Get a normalizer plugin by name.
@@ -115,9 +179,7 @@ class PluginRegistry:
         Raises:
             ValueError: If plugin not found.
         """
-        if name not in self._normalizers:
-            raise ValueError(f"Normalizer plugin '{name}' not found")
-        return self._normalizers[name]()
+        return self.get(Normalizer, name)
 
     def get_transformer(self, name: str) -> Transformer:
         """Get a transformer plugin by name.
@@ -131,9 +193,7 @@ class PluginRegistry:
         Raises:
             ValueError: If plugin not found.
         """
-        if name not in self._transformers:
-            raise ValueError(f"Transformer plugin '{name}' not found")
-        return self._transformers[name]()
+        return self.get(Transformer, name)
 
     def get_loader(self, name: str, config: Optional[Dict[str, Any]] = None) -> Loader:
         """Get a loader plugin by name.
@@ -148,7 +208,46 @@ class PluginRegistry:
         Raises:
             ValueError: If plugin not found.
         """
-        if name not in self._loaders:
-            raise ValueError(f"Loader plugin '{name}' not found")
-        plugin_class = self._loaders[name]
-        return plugin_class(config=config)  # type: ignore[call-arg]
+        return self.get(Loader, name, config)
+
+    def _resolve(self, interface: Type[_T], name: str) -> Type[_T]:
+        """Get the class registered under a name, importing it if registered by path.
+
+        Args:
+            interface: Plugin interface.
+            name: Plugin name identifier.
+
+        Returns:
+            Plugin class.
+
+        Raises:
+            ValueError: If plugin not found.
+        """
+        plugin_class = self._bins[interface].get(name)
+        if plugin_class is None:
+            raise ValueError(f"{interface.__name__} plugin '{name}' not found")
+
+        if isinstance(plugin_class, str):
+            module_name, _, class_name = plugin_class.partition(":")
+            plugin_class = getattr(importlib.import_module(module_name), class_name)
+            self._bins[interface][name] = plugin_class
+
+        return plugin_class  # type: ignore[return-value]
+
+    def _get_shared_instance(self, plugin_class: Type[_T]) -> _T:
+        """Get the pooled instance of a configuration-free plugin class.
+
+        Args:
+            plugin_class: Plugin class to instantiate on first use.
+
+        Returns:
+            Shared plugin instance.
+        """
+        instance = self._instances.get(plugin_class)
+        if instance is None:
+            with self._instances_lock:
+                instance = self._instances.get(plugin_class)
+                if instance is None:
+                    instance = plugin_class()
+                    self._instances[plugin_class] = instance
+        return instance
@@ -1,13 +1,15 @@
 """Projection use case for executing projections."""
 
 import logging
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 
-from src.infrastructure.notifications.projection_notification_service import (
-    ProjectionNotificationService,
-)
 from src.infrastructure.projections.projection_manager import ProjectionManager
 
+if TYPE_CHECKING:
+    from src.infrastructure.notifications.projection_notification_service import (
+        ProjectionNotificationService,
+    )
+
 logger = logging.getLogger(__name__)
 
 
@@ -17,7 +19,7 @@ class ProjectionUseCase:
     def __init__(
         self,
         projection_manager: ProjectionManager,
-        notification_service: Optional[ProjectionNotificationService] = None,
+        notification_service: Optional["ProjectionNotificationService"] = None,
         bucket: Optional[str] = None,
     ):
         """Initialize ProjectionUseCase.
@@ -30,6 +32,8 @@ class ProjectionUseCase:
         self._projection_manager = projection_manager
         self._notification_service = notification_service
         self._bucket = bucket
+        # dataset_id -> ("datasets/{dataset_id}/", "datasets/{dataset_id}/projections/")
+        self._dataset_paths: Dict[str, Tuple[str, str]] = {}
 
     def execute_projection(self, version_id: str, dataset_id: str) -> None:
         """Execute projection for a version.
@@ -64,6 +68,10 @@ class ProjectionUseCase:
             )
             raise
 
+    def close(self) -> None:
+        """Shut down the projection manager's worker pool."""
+        self._projection_manager.close()
+
     def _notify_if_configured(self, version_id: str, dataset_id: str) -> None:
         """Notify that a projection was updated if notification service is configured.
 
@@ -74,10 +82,17 @@ class ProjectionUseCase:
         if not self._notification_service or not self._bucket:
             return
 
+        dataset_paths = self._dataset_paths.get(dataset_id)
+        if dataset_paths is None:
+            prefix = f"datasets/{dataset_id}/"
+            dataset_paths = (prefix, f"{prefix}projections/")
+            self._dataset_paths[dataset_id] = dataset_paths
+        prefix, projections_path = dataset_paths
+
         self._notification_service.notify_projection_update(
             dataset_id=dataset_id,
             bucket=self._bucket,
-            version_manifest_path=f"datasets/{dataset_id}/versions/{version_id}/manifest.json",
-            projections_path=f"datasets/{dataset_id}/projections/",
+            version_manifest_path=f"{prefix}versions/{version_id}/manifest.json",
+            projections_path=projections_path,
         )
 
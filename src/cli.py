@@ -8,16 +8,17 @@ env_path = Path(__file__).parent.parent.parent / ".env"
 if env_path.exists():
     load_dotenv(env_path, override=True)
 
-import argparse
 import logging
 import os
 import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Tuple
 
 import requests
 import yaml
 
-from typing import Any, Dict, Optional
-
 from src.application.etl_use_case import ETLUseCase
 from src.application.plugin_registry import PluginRegistry
 from src.application.projection_use_case import ProjectionUseCase
@@ -32,90 +33,143 @@ from src.domain.interfaces import (
 )
 from src.infrastructure.config_loader import YamlConfigLoader
 from src.infrastructure.lock_managers.lock_manager_factory import LockManagerFactory
-from src.infrastructure.notifications.projection_notification_service import (
-    ProjectionNotificationService,
-)
 from src.infrastructure.plugins import create_plugin_registry
 from src.infrastructure.projections.projection_manager import ProjectionManager
 from src.infrastructure.state_managers.state_manager_factory import StateManagerFactory
 
+if TYPE_CHECKING:
+    from src.infrastructure.notifications.projection_notification_service import (
+        ProjectionNotificationService,
+    )
+
+# Shared read-only fallback for optional config sections that are only read from
+_EMPTY_MAP: Mapping[str, Any] = MappingProxyType({})
+
+
+@dataclass(frozen=True)
+class PipelineSpec:
+    """Plugin selection for a dataset, resolved once from its configuration."""
+
+    __slots__ = (
+        "extractor_kind",
+        "source_config",
+        "parser_name",
+        "normalizer_name",
+        "transformer_name",
+        "loader_name",
+    )
+
+    extractor_kind: str
+    source_config: Dict[str, Any]
+    parser_name: Optional[str]
+    normalizer_name: Optional[str]
+    transformer_name: Optional[str]
+    loader_name: Optional[str]
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "PipelineSpec":
+        """Build a pipeline spec from a dataset configuration.
+
+        Args:
+            config: Configuration dictionary.
+
+        Returns:
+            PipelineSpec instance.
+        """
+        source_config = config.get("source", {})
+        return cls(
+            extractor_kind=source_config.get("kind", "http"),
+            source_config=source_config,
+            parser_name=config.get("parse", _EMPTY_MAP).get("plugin"),
+            normalizer_name=config.get("normalize", _EMPTY_MAP).get("plugin"),
+            transformer_name=config.get("transform", _EMPTY_MAP).get("plugin"),
+            loader_name=config.get("load", _EMPTY_MAP).get("plugin"),
+        )
+
+
+@lru_cache(maxsize=1)
+def _get_plugin_registry() -> PluginRegistry:
+    """Get the process-wide plugin registry, creating it on first use.
+
+    Returns:
+        PluginRegistry instance with all plugins registered.
+    """
+    return create_plugin_registry()
+
 
-def _get_extractor(registry: PluginRegistry, config: Dict[str, Any]) -> Extractor:
-    """Get extractor from registry based on config.
+def _get_extractor(registry: PluginRegistry, spec: PipelineSpec) -> Extractor:
+    """Get extractor from registry based on the pipeline spec.
 
     Args:
         registry: Plugin registry instance.
-        config: Configuration dictionary.
+        spec: Pipeline spec.
 
     Returns:
         Extractor instance.
     """
-    source_config = config.get("source", {})
-    extractor_kind = source_config.get("kind", "http")
-    return registry.get_extractor(extractor_kind, source_config)
+    return registry.get_extractor(spec.extractor_kind, spec.source_config)
 
 
-def _get_parser(registry: PluginRegistry, config: Dict[str, Any]) -> Optional[Parser]:
-    """Get parser from registry based on config.
+def _get_parser(registry: PluginRegistry, spec: PipelineSpec) -> Optional[Parser]:
+    """Get parser from registry based on the pipeline spec.
 
     Args:
         registry: Plugin registry instance.
-        config: Configuration dictionary.
+        spec: Pipeline spec.
 
     Returns:
         Parser instance or None if not configured.
     """
-    parse_config = config.get("parse", {})
-    if parse_config.get("plugin"):
-        return registry.get_parser(parse_config["plugin"])
+    if spec.parser_name:
+        return registry.get_parser(spec.parser_name)
     return None
 
 
-def _get_normalizer(registry: PluginRegistry, config: Dict[str, Any]) -> Optional[Normalizer]:
-    """Get normalizer from registry based on config.
+def _get_normalizer(registry: PluginRegistry, spec: PipelineSpec) -> Optional[Normalizer]:
+    """Get normalizer from registry based on the pipeline spec.
 
     Args:
         registry: Plugin registry instance.
-        config: Configuration dictionary.
+        spec: Pipeline spec.
 
     Returns:
         Normalizer instance or None if not configured.
     """
-    normalize_config = config.get("normalize", {})
-    if normalize_config.get("plugin"):
-        return registry.get_normalizer(normalize_config["plugin"])
+    if spec.normalizer_name:
+        return registry.get_normalizer(spec.normalizer_name)
     return None
 
 
-def _get_transformer(registry: PluginRegistry, config: Dict[str, Any]) -> Optional[Transformer]:
-    """Get transformer from registry based on config.
+def _get_transformer(registry: PluginRegistry, spec: PipelineSpec) -> Optional[Transformer]:
+    """Get transformer from registry based on the pipeline spec.
 
     Args:
         registry: Plugin registry instance.
-        config: Configuration dictionary.
+        spec: Pipeline spec.
 
     Returns:
         Transformer instance or None if not configured.
     """
-    transform_config = config.get("transform", {})
-    if transform_config.get("plugin"):
-        return registry.get_transformer(transform_config["plugin"])
+    if spec.transformer_name:
+        return registry.get_transformer(spec.transformer_name)
     return None
 
 
-def _get_loader(registry: PluginRegistry, config: Dict[str, Any]) -> Optional[Loader]:
-    """Get loader from registry based on config.
+def _get_loader(
+    registry: PluginRegistry, spec: PipelineSpec, config: Dict[str, Any]
+) -> Optional[Loader]:
+    """Get loader from registry based on the pipeline spec.
 
     Args:
         registry: Plugin registry instance.
-        config: Configuration dictionary.
+        spec: Pipeline spec.
+        config: Configuration dictionary passed to the loader.
 
     Returns:
         Loader instance or None if not configured.
     """
-    load_config = config.get("load", {})
-    if load_config.get("plugin"):
-        return registry.get_loader(load_config["plugin"], config=config)
+    if spec.loader_name:
+        return registry.get_loader(spec.loader_name, config=config)
     return None
 
 
@@ -145,7 +199,7 @@ def _get_state_manager(config: Dict[str, Any]) -> Optional[StateManager]:
     return StateManagerFactory.create(state_config)
 
 
-def _create_notification_service(aws_region: str) -> Optional[ProjectionNotificationService]:
+def _create_notification_service(aws_region: str) -> Optional["ProjectionNotificationService"]:
     """Create notification service if SNS topic ARN is configured.
 
     Args:
@@ -158,6 +212,11 @@ def _create_notification_service(aws_region: str) -> Optional[ProjectionNotifica
     if not topic_arn:
         return None
 
+    # Deferred so runs without SNS never import the notification stack
+    from src.infrastructure.notifications.projection_notification_service import (
+        ProjectionNotificationService,
+    )
+
     return ProjectionNotificationService(
         topic_arn=topic_arn,
         sns_client=None,
@@ -193,63 +252,53 @@ def _get_projection_use_case(
     if not loader:
         return None
 
-    load_config = config.get("load", {})
+    load_config = config.get("load", _EMPTY_MAP)
     bucket = load_config.get("bucket")
     aws_region = load_config.get("aws_region", "us-east-1")
 
     if not bucket:
         return None
 
-    projection_config = load_config.get("projection", {})
+    projection_config = load_config.get("projection", _EMPTY_MAP)
     copy_workers = projection_config.get("copy_workers", 1)
     merge_workers = projection_config.get("merge_workers", 1)
 
-    try:
-        s3_client = getattr(loader, "_s3_client", None)
-        projection_manager = ProjectionManager(
-            bucket=bucket,
-            s3_client=s3_client,
-            aws_region=aws_region,
-            copy_workers=copy_workers,
-            merge_workers=merge_workers,
-        )
+    # Loaders implementing SupportsS3Client share their client with the projection
+    s3_client = getattr(loader, "s3_client", None)
+    projection_manager = ProjectionManager(
+        bucket=bucket,
+        s3_client=s3_client,
+        aws_region=aws_region,
+        copy_workers=copy_workers,
+        merge_workers=merge_workers,
+    )
 
-        notification_service = _create_notification_service(aws_region)
+    notification_service = _create_notification_service(aws_region)
 
-        return ProjectionUseCase(
-            projection_manager=projection_manager,
-            notification_service=notification_service,
-            bucket=bucket,
-        )
-    except AttributeError:
-        return None
+    return ProjectionUseCase(
+        projection_manager=projection_manager,
+        notification_service=notification_service,
+        bucket=bucket,
+    )
 
 
-def _execute_etl_pipeline(dataset_id: str) -> int:
-    """Execute ETL pipeline for a dataset without error handling.
+def build_etl_use_case(dataset_id: str) -> Tuple[ETLUseCase, Dict[str, Any]]:
+    """Build a fully wired ETL use case for a dataset.
 
     Args:
         dataset_id: Dataset identifier.
 
     Returns:
-        Exit code (0 for success).
-
-    Raises:
-        FileNotFoundError: If configuration file not found.
-        yaml.YAMLError: If YAML parsing fails.
-        ValueError: If configuration is invalid.
-        RuntimeError: If ETL execution fails.
-        requests.RequestException: If HTTP extraction fails.
-        OSError: If I/O operations fail.
-        TypeError: If type errors occur.
+        Tuple of (ETLUseCase instance, configuration dictionary).
     """
-    registry = create_plugin_registry()
+    registry = _get_plugin_registry()
     config = _get_config(dataset_id)
-    extractor = _get_extractor(registry, config)
-    parser = _get_parser(registry, config)
-    normalizer = _get_normalizer(registry, config)
-    transformer = _get_transformer(registry, config)
-    loader = _get_loader(registry, config)
+    spec = PipelineSpec.from_config(config)
+    extractor = _get_extractor(registry, spec)
+    parser = _get_parser(registry, spec)
+    normalizer = _get_normalizer(registry, spec)
+    transformer = _get_transformer(registry, spec)
+    loader = _get_loader(registry, spec, config)
     state_manager = _get_state_manager(config)
     lock_manager = _get_lock_manager(config)
     projection_use_case = _get_projection_use_case(config, loader)
@@ -265,13 +314,105 @@ def _execute_etl_pipeline(dataset_id: str) -> int:
         lock_manager=lock_manager,
         projection_use_case=projection_use_case,
     )
+    return etl, config
 
+
+def _run_etl_use_case(etl: ETLUseCase, config: Dict[str, Any]) -> int:
+    """Execute a built ETL use case.
+
+    Args:
+        etl: ETLUseCase instance.
+        config: Configuration dictionary.
+
+    Returns:
+        Exit code (0 for success).
+    """
     data = etl.execute(config)
 
     print(f"✓ ETL completed successfully. Processed {len(data)} data points.")
     return 0
 
 
+def _execute_etl_pipeline(dataset_id: str) -> int:
+    """Execute ETL pipeline for a dataset without error handling.
+
+    Args:
+        dataset_id: Dataset identifier.
+
+    Returns:
+        Exit code (0 for success).
+
+    Raises:
+        FileNotFoundError: If configuration file not found.
+        yaml.YAMLError: If YAML parsing fails.
+        ValueError: If configuration is invalid.
+        RuntimeError: If ETL execution fails.
+        requests.RequestException: If HTTP extraction fails.
+        OSError: If I/O operations fail.
+        TypeError: If type errors occur.
+    """
+    etl, config = build_etl_use_case(dataset_id)
+    try:
+        return _run_etl_use_case(etl, config)
+    finally:
+        # One-shot runs own the pipeline; cached pipelines stay open for reuse
+        etl.close()
+
+
+def _execute_cached_etl_pipeline(
+    dataset_id: str, pipelines: Dict[str, Tuple[ETLUseCase, Dict[str, Any]]]
+) -> int:
+    """Execute ETL pipeline for a dataset, building it only on first use.
+
+    Args:
+        dataset_id: Dataset identifier.
+        pipelines: Cache of built pipelines keyed by dataset_id.
+
+    Returns:
+        Exit code (0 for success).
+    """
+    pipeline = pipelines.get(dataset_id)
+    if pipeline is None:
+        pipeline = build_etl_use_case(dataset_id)
+        pipelines[dataset_id] = pipeline
+    return _run_etl_use_case(*pipeline)
+
+
+# Handled exception types mapped to (message template, exit code), checked in order
+_ERROR_HANDLERS: Mapping[type, Tuple[str, int]] = MappingProxyType(
+    {
+        FileNotFoundError: ("✗ Configuration file not found: {}", 1),
+        yaml.YAMLError: ("✗ Invalid YAML configuration: {}", 1),
+        ValueError: ("✗ Configuration error: {}", 1),
+        RuntimeError: ("✗ Runtime error: {}", 1),
+        requests.RequestException: ("✗ Network error during extraction: {}", 1),
+        OSError: ("✗ I/O error: {}", 1),
+        TypeError: ("✗ Type error: {}", 1),
+        KeyboardInterrupt: ("\n✗ Operation cancelled by user", 130),  # 130: standard SIGINT code
+    }
+)
+_HANDLED_ERRORS = tuple(_ERROR_HANDLERS)
+
+
+def _find_error_handler(error: BaseException) -> Optional[Tuple[str, int]]:
+    """Find the handler for the first matching exception type.
+
+    Types are checked in declaration order, so an error matching several of them
+    (e.g. requests.InvalidURL is both a RequestException and a ValueError) gets the
+    handler declared first.
+
+    Args:
+        error: Exception that was raised.
+
+    Returns:
+        Tuple of (message template, exit code), or None if the error is not handled.
+    """
+    for error_type, handler in _ERROR_HANDLERS.items():
+        if isinstance(error, error_type):
+            return handler
+    return None
+
+
 def _handle_error(error: BaseException) -> int:
     """Handle errors and return appropriate exit code.
 
@@ -281,75 +422,82 @@ def _handle_error(error: BaseException) -> int:
     Returns:
         Exit code (1 for errors, 130 for KeyboardInterrupt).
     """
-    if isinstance(error, FileNotFoundError):
-        print(f"✗ Configuration file not found: {error}", file=sys.stderr)
-        return 1
-    if isinstance(error, yaml.YAMLError):
-        print(f"✗ Invalid YAML configuration: {error}", file=sys.stderr)
-        return 1
-    if isinstance(error, ValueError):
-        print(f"✗ Configuration error: {error}", file=sys.stderr)
-        return 1
-    if isinstance(error, RuntimeError):
-        print(f"✗ Runtime error: {error}", file=sys.stderr)
+    handler = _find_error_handler(error)
+    if handler is None:
+        # Fallback for unexpected errors
+        print(f"✗ Unexpected error: {error}", file=sys.stderr)
         return 1
-    if isinstance(error, requests.RequestException):
-        print(f"✗ Network error during extraction: {error}", file=sys.stderr)
-        return 1
-    if isinstance(error, OSError):
-        print(f"✗ I/O error: {error}", file=sys.stderr)
-        return 1
-    if isinstance(error, TypeError):
-        print(f"✗ Type error: {error}", file=sys.stderr)
-        return 1
-    if isinstance(error, KeyboardInterrupt):
-        print("\n✗ Operation cancelled by user", file=sys.stderr)
-        return 130  # Standard exit code for SIGINT
 
-    # Fallback for unexpected errors
-    print(f"✗ Unexpected error: {error}", file=sys.stderr)
-    return 1
+    message, exit_code = handler
+    print(message.format(error), file=sys.stderr)
+    return exit_code
 
 
-def run_etl(dataset_id: str) -> int:
+def run_etl(
+    dataset_id: str,
+    pipelines: Optional[Dict[str, Tuple[ETLUseCase, Dict[str, Any]]]] = None,
+) -> int:
     """Run ETL pipeline for a dataset with error handling.
 
     Args:
         dataset_id: Dataset identifier.
+        pipelines: Optional cache of built pipelines keyed by dataset_id. When provided,
+            the pipeline is built once and reused by subsequent calls (e.g. warm Lambda
+            invocations).
 
     Returns:
         Exit code (0 for success, 1 for error, 130 for KeyboardInterrupt).
     """
     try:
-        return _execute_etl_pipeline(dataset_id)
-    except KeyboardInterrupt as error:
-        return _handle_error(error)
-    except (
-        FileNotFoundError,
-        yaml.YAMLError,
-        ValueError,
-        RuntimeError,
-        requests.RequestException,
-        OSError,
-        TypeError,
-    ) as error:
+        if pipelines is None:
+            return _execute_etl_pipeline(dataset_id)
+        return _execute_cached_etl_pipeline(dataset_id, pipelines)
+    except _HANDLED_ERRORS as error:
         return _handle_error(error)
 
 
-def main():
-    """Main entry point for CLI."""
-    # Configure logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
-
+_LOGGING_CONFIG: Dict[str, Any] = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {
+        "default": {
+            "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+            "datefmt": "%Y-%m-%d %H:%M:%S",
+        }
+    },
+    "handlers": {"console": {"class": "logging.StreamHandler", "formatter": "default"}},
+    "root": {"level": "INFO", "handlers": ["console"]},
     # Suppress noisy third-party logs
-    logging.getLogger("urllib3").setLevel(logging.WARNING)
-    logging.getLogger("botocore").setLevel(logging.WARNING)
-    logging.getLogger("boto3").setLevel(logging.WARNING)
-    logging.getLogger("s3transfer").setLevel(logging.WARNING)
+    "loggers": {
+        name: {"level": "WARNING"} for name in ("urllib3", "botocore", "boto3", "s3transfer")
+    },
+}
+
+
+def _configure_logging() -> None:
+    """Configure root and third-party loggers in a single pass."""
+    # Imported here: logging.config pulls in socketserver, which only the CLI needs
+    import logging.config
+
+    logging.config.dictConfig(_LOGGING_CONFIG)
+
+
+def _parse_args(argv: List[str]) -> Tuple[str, bool]:
+    """Parse CLI arguments.
+
+    A single positional dataset id is handled directly; anything else (flags, help,
+    errors) goes through argparse, which is only imported in that case.
+
+    Args:
+        argv: Command-line arguments, excluding the program name.
+
+    Returns:
+        Tuple of (dataset_id, verbose).
+    """
+    if len(argv) == 1 and not argv[0].startswith("-"):
+        return argv[0], False
+
+    import argparse
 
     parser = argparse.ArgumentParser(
         description="Run ETL pipeline for a dataset",
@@ -367,13 +515,21 @@ def main():
         help="Enable verbose logging (DEBUG level)",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    return args.dataset_id, args.verbose
+
+
+def main():
+    """Main entry point for CLI."""
+    _configure_logging()
+
+    dataset_id, verbose = _parse_args(sys.argv[1:])
 
-    if args.verbose:
+    if verbose:
         logging.getLogger().setLevel(logging.DEBUG)
         logging.info("Verbose logging enabled")
 
-    exit_code = run_etl(args.dataset_id)
+    exit_code = run_etl(dataset_id)
     sys.exit(exit_code)
 
 
@@ -2,7 +2,7 @@
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Protocol
 
 
 class Extractor(ABC):
@@ -84,6 +84,14 @@ class Loader(ABC):
         """
 
 
+class SupportsS3Client(Protocol):
+    """Protocol for components that expose the S3 client they use."""
+
+    @property
+    def s3_client(self) -> Any:
+        """Boto3 S3 client used by this component."""
+
+
 class StateManager(ABC):
     """Interface for state management (incremental updates)."""
 
@@ -121,6 +129,8 @@ class StateManager(ABC):
 class ConfigLoader(ABC):
     """Interface for configuration loading."""
 
+    __slots__ = ()
+
     @abstractmethod
     def load_dataset_config(self, dataset_id: str) -> Dict[str, Any]:
         """Load configuration for a dataset.
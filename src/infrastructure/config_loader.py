@@ -1,5 +1,7 @@
 """Concrete implementation of config loader."""
 
+import copy
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
@@ -7,10 +9,31 @@ import yaml
 
 from ..domain.interfaces import ConfigLoader
 
+# libyaml-backed loader when available, pure-Python SafeLoader otherwise
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=128)
+def _parse_yaml_file(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a YAML file, memoized by path, modification time and size.
+
+    Args:
+        path: Path to the YAML file.
+        mtime_ns: File modification time in nanoseconds (cache key only).
+        size: File size in bytes (cache key only).
+
+    Returns:
+        Parsed YAML content, or an empty dict for empty files.
+    """
+    with open(path, encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YAML_LOADER) or {}  # noqa: S506 - safe loader
+
 
 class YamlConfigLoader(ConfigLoader):
     """Loads configurations from YAML files."""
 
+    __slots__ = ("_config_dir",)
+
     def __init__(self, config_dir: str = "config/datasets") -> None:
         """Initialize YAML config loader.
 
@@ -38,5 +61,6 @@ class YamlConfigLoader(ConfigLoader):
         if not config_file.exists():
             raise FileNotFoundError(f"Configuration file not found for dataset: {dataset_id}")
 
-        with open(config_file, encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
+        stat = config_file.stat()
+        # Callers may mutate the returned config, so never hand out the cached object
+        return copy.deepcopy(_parse_yaml_file(str(config_file), stat.st_mtime_ns, stat.st_size))
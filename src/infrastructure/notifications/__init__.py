@@ -1,8 +1,16 @@
 """Notifications infrastructure."""
 
-from src.infrastructure.notifications.projection_notification_service import (
-    ProjectionNotificationService,
-)
+from typing import Any
 
 __all__ = ["ProjectionNotificationService"]
 
+
+def __getattr__(name: str) -> Any:
+    """Import notification services on first access to defer loading boto3."""
+    if name == "ProjectionNotificationService":
+        from src.infrastructure.notifications.projection_notification_service import (
+            ProjectionNotificationService,
+        )
+
+        return ProjectionNotificationService
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
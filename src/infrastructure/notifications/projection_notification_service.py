@@ -1,10 +1,10 @@
 """Projection notification service for SNS."""
 
-import json
 import logging
 from typing import Any
 
 import boto3
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -12,6 +12,8 @@ logger = logging.getLogger(__name__)
 class ProjectionNotificationService:
     """Service for publishing projection update notifications to SNS."""
 
+    __slots__ = ("_topic_arn", "_sns_client", "_aws_region")
+
     def __init__(
         self, topic_arn: str, sns_client: Any = None, aws_region: str = "us-east-1"
     ):
@@ -23,7 +25,15 @@ class ProjectionNotificationService:
             aws_region: AWS region (default: us-east-1).
         """
         self._topic_arn = topic_arn
-        self._sns_client = sns_client or boto3.client("sns", region_name=aws_region)
+        self._sns_client = sns_client
+        self._aws_region = aws_region
+
+    def _get_client(self) -> Any:
+        """Get or create SNS client (created on first publish)."""
+        if self._sns_client is None:
+            self._sns_client = boto3.client("sns", region_name=self._aws_region)
+
+        return self._sns_client
 
     def notify_projection_update(
         self,
@@ -49,9 +59,9 @@ class ProjectionNotificationService:
         }
 
         try:
-            self._sns_client.publish(
+            self._get_client().publish(
                 TopicArn=self._topic_arn,
-                Message=json.dumps(event),
+                Message=orjson.dumps(event).decode(),
                 Subject=f"projection_update:{dataset_id}",
             )
             logger.info(
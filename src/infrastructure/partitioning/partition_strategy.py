@@ -19,17 +19,28 @@ class PartitionStrategy(ABC):
         """
         raise NotImplementedError
 
-    @abstractmethod
     def group_by_partition(self, data: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
         """Group data points by partition path.
 
+        Default implementation calls get_partition_path once per data point, so
+        strategies only need to override this when they can group more cheaply.
+
         Args:
             data: List of data point dictionaries.
 
         Returns:
             Dictionary mapping partition paths to lists of data points.
         """
-        raise NotImplementedError
+        grouped: Dict[str, List[Dict[str, Any]]] = {}
+        get_partition_path = self.get_partition_path
+        for data_point in data:
+            path = get_partition_path(data_point)
+            group = grouped.get(path)
+            if group is None:
+                grouped[path] = [data_point]
+            else:
+                group.append(data_point)
+        return grouped
 
     @abstractmethod
     def parse_partition_path(self, partition_path: str) -> Dict[str, str]:
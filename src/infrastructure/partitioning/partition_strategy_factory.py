@@ -13,6 +13,11 @@ class PartitionStrategyFactory:
 
     DEFAULT_STRATEGY = "series_year_month"
 
+    # Strategies are stateless, so one shared instance per name is enough
+    _STRATEGIES: Dict[str, PartitionStrategy] = {
+        "series_year_month": SeriesYearMonthPartitionStrategy(),
+    }
+
     @staticmethod
     def create(config: Optional[Dict[str, Any]] = None) -> PartitionStrategy:
         """Create PartitionStrategy instance from configuration.
@@ -26,7 +31,7 @@ class PartitionStrategyFactory:
                 - None  # defaults to series_year_month
 
         Returns:
-            PartitionStrategy instance (defaults to SeriesYearMonthPartitionStrategy).
+            Shared PartitionStrategy instance (defaults to SeriesYearMonthPartitionStrategy).
 
         Raises:
             ValueError: If partition_strategy is unknown.
@@ -39,7 +44,8 @@ class PartitionStrategyFactory:
             "partition_strategy", PartitionStrategyFactory.DEFAULT_STRATEGY
         )
 
-        if strategy_name == "series_year_month":
-            return SeriesYearMonthPartitionStrategy()
+        strategy = PartitionStrategyFactory._STRATEGIES.get(strategy_name)
+        if strategy is None:
+            raise ValueError(f"Unknown partition strategy: {strategy_name}")
 
-        raise ValueError(f"Unknown partition strategy: {strategy_name}")
+        return strategy
@@ -1,9 +1,8 @@
 """Series-year-month partition strategy implementation."""
 
 import re
-from collections import defaultdict
 from datetime import datetime
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, List, Set, Tuple
 
 from src.infrastructure.partitioning.partition_strategy import PartitionStrategy
 
@@ -11,9 +10,14 @@ from src.infrastructure.partitioning.partition_strategy import PartitionStrategy
 class SeriesYearMonthPartitionStrategy(PartitionStrategy):
     """Partition strategy: {internal_series_code}/year={YYYY}/month={MM}/"""
 
-    # Regex patterns for parsing partition paths
+    # Regex patterns for parsing partition paths. The lookbehind only lets a search
+    # start at a path segment boundary, so the engine does not retry from every
+    # character of each key; matches are the same as without it.
     PARTITION_PATH_PATTERN = re.compile(r"([^/]+)/year=(\d+)/month=(\d+)/?")
-    PARTITION_IN_PATH_PATTERN = re.compile(r"([^/]+)/year=(\d+)/month=(\d+)/")
+    PARTITION_IN_PATH_PATTERN = re.compile(r"(?<![^/])([^/]+)/year=(\d+)/month=(\d+)/")
+
+    # Zero-padded month strings, indexed by month - 1
+    _MONTHS = tuple(f"{month:02d}" for month in range(1, 13))
 
     def get_partition_path(self, data_point: Dict[str, Any]) -> str:
         """Get partition path for a data point.
@@ -33,21 +37,39 @@ class SeriesYearMonthPartitionStrategy(PartitionStrategy):
         if not isinstance(obs_time, datetime):
             raise ValueError("obs_time must be a datetime object")
 
-        return f"{series_code}/year={obs_time.year}/month={obs_time.month:02d}/"
+        return f"{series_code}/year={obs_time.year}/month={self._MONTHS[obs_time.month - 1]}/"
 
     def group_by_partition(self, data: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
         """Group data points by partition path.
 
+        Rows are keyed by (series code, year, month), so each partition path is
+        formatted and validated once rather than once per data point.
+
         Args:
             data: List of data point dictionaries.
 
         Returns:
             Dictionary mapping partition paths to lists of data points.
+
+        Raises:
+            ValueError: If a data point lacks a series code or a datetime obs_time.
         """
-        grouped = defaultdict(list)
+        grouped: Dict[str, List[Dict[str, Any]]] = {}
+        groups: Dict[Tuple[Any, int, int], List[Dict[str, Any]]] = {}
+        get_partition_path = self.get_partition_path
         for data_point in data:
-            grouped[self.get_partition_path(data_point)].append(data_point)
-        return dict(grouped)
+            obs_time = data_point.get("obs_time")
+            if not isinstance(obs_time, datetime):
+                get_partition_path(data_point)  # raises the validation error
+
+            key = (data_point.get("internal_series_code"), obs_time.year, obs_time.month)
+            group = groups.get(key)
+            if group is None:
+                group = grouped.setdefault(get_partition_path(data_point), [])
+                groups[key] = group
+            group.append(data_point)
+
+        return grouped
 
     def parse_partition_path(self, partition_path: str) -> Dict[str, str]:
         """Parse a partition path to extract components.
@@ -77,10 +99,8 @@ class SeriesYearMonthPartitionStrategy(PartitionStrategy):
         Returns:
             Set of unique partition paths (e.g., {"SERIES/year=2024/month=01/"}).
         """
-        partitions = set()
-        for path in paths:
-            match = self.PARTITION_IN_PATH_PATTERN.search(path)
-            if match:
-                partitions.add(f"{match.group(1)}/year={match.group(2)}/month={match.group(3)}/")
+        # Deduplicate on the matched components so each partition string is built once
+        search = self.PARTITION_IN_PATH_PATTERN.search
+        components = {match.groups() for path in paths if (match := search(path))}
 
-        return partitions
+        return {f"{code}/year={year}/month={month}/" for code, year, month in components}
@@ -1,10 +1,9 @@
 """Extractor plugins."""
 
 from src.application.plugin_registry import PluginRegistry
-from src.infrastructure.plugins.extractors.http_extractor import HttpExtractor
-from src.infrastructure.plugins.extractors.indec_ipc_http_extractor import (
-    IndecIpcHttpExtractor,
-)
+
+# Plugins are registered by import path so their modules load on first use
+_PACKAGE = "src.infrastructure.plugins.extractors"
 
 
 def register_extractors(registry: PluginRegistry) -> None:
@@ -13,5 +12,7 @@ def register_extractors(registry: PluginRegistry) -> None:
     Args:
         registry: PluginRegistry instance to register plugins in.
     """
-    registry.register_extractor("http", HttpExtractor)
-    registry.register_extractor("indec_ipc_http", IndecIpcHttpExtractor)
+    registry.register_extractor("http", f"{_PACKAGE}.http_extractor:HttpExtractor")
+    registry.register_extractor(
+        "indec_ipc_http", f"{_PACKAGE}.indec_ipc_http_extractor:IndecIpcHttpExtractor"
+    )
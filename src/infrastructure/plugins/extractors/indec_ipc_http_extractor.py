@@ -1,12 +1,33 @@
 """INDEC IPC-specific HTTP extractor with dynamic file naming."""
 
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict
 
-import pytz
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from src.domain.interfaces import Extractor
+from src.infrastructure.utils.date_utils import get_timezone
+
+
+@lru_cache(maxsize=1)
+def _get_session() -> requests.Session:
+    """Get the shared HTTP session, creating it on first use.
+
+    The session keeps connections alive between downloads and retries transient
+    server errors with backoff.
+
+    Returns:
+        requests.Session instance.
+    """
+    retry = Retry(total=3, backoff_factor=0.5, status_forcelist=(502, 503, 504))
+    adapter = HTTPAdapter(pool_maxsize=8, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
 
 class IndecIpcHttpExtractor(Extractor):
@@ -30,20 +51,32 @@ class IndecIpcHttpExtractor(Extractor):
             raise ValueError("source_config must contain 'url_template' key")
 
         timezone_str = source_config.get("timezone", self.DEFAULT_TIMEZONE)
-        timezone = pytz.timezone(timezone_str)
-        now = datetime.now(timezone)
+
+        self._url_template = url_template
+        self._timezone = get_timezone(timezone_str)
+        self._timeout = source_config.get("timeout", self.DEFAULT_TIMEOUT)
+        self._verify_ssl = source_config.get("verify_ssl", False)
+
+    def _build_url(self) -> str:
+        """Build the file URL for the current month.
+
+        The date is read on every call rather than at construction, since the
+        extractor may be reused across invocations that span a month boundary.
+
+        Returns:
+            URL with {MM} and {YY} replaced by the current month and two-digit year.
+        """
+        now = datetime.now(self._timezone)
 
         month = f"{now.month:02d}"
         year_short = f"{now.year % 100:02d}"
 
-        self._url = url_template.format(MM=month, YY=year_short)
-        self._timeout = source_config.get("timeout", self.DEFAULT_TIMEOUT)
-        self._verify_ssl = source_config.get("verify_ssl", False)
+        return self._url_template.format(MM=month, YY=year_short)
 
     def extract(self) -> bytes:
-        """Download the file."""
-        response = requests.get(
-            self._url,
+        """Download the file for the current month."""
+        response = _get_session().get(
+            self._build_url(),
             timeout=self._timeout,
             verify=self._verify_ssl,
         )
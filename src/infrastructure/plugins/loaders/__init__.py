@@ -1,7 +1,9 @@
 """Loader plugins."""
 
 from src.application.plugin_registry import PluginRegistry
-from src.infrastructure.plugins.loaders.s3_versioned_loader import S3VersionedLoader
+
+# Plugins are registered by import path so their modules load on first use
+_PACKAGE = "src.infrastructure.plugins.loaders"
 
 
 def register_loaders(registry: PluginRegistry) -> None:
@@ -10,4 +12,4 @@ def register_loaders(registry: PluginRegistry) -> None:
     Args:
         registry: PluginRegistry instance to register plugins in.
     """
-    registry.register_loader("s3_versioned", S3VersionedLoader)
+    registry.register_loader("s3_versioned", f"{_PACKAGE}.s3_versioned_loader:S3VersionedLoader")
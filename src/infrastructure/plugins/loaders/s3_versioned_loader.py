@@ -1,11 +1,13 @@
 """S3 versioned loader plugin."""
 
+import hashlib
 import logging
-import os
-import tempfile
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import boto3
+from botocore.config import Config
 
 from src.domain.interfaces import Loader
 from src.infrastructure.partitioning import PartitionStrategyFactory
@@ -14,6 +16,34 @@ from src.infrastructure.versioning import ManifestManager, VersionManager
 
 logger = logging.getLogger(__name__)
 
+# Minimum pooled connections for parallel uploads (botocore defaults to 10)
+_MIN_POOL_CONNECTIONS = 50
+
+
+@lru_cache(maxsize=None)
+def _get_default_s3_client(aws_region: str, max_pool_connections: int) -> Any:
+    """Get the shared S3 client for a region and pool size, creating it on first use.
+
+    Boto3 clients are thread-safe, so loaders in the same process share one client
+    and its connection pool per region.
+
+    Args:
+        aws_region: AWS region.
+        max_pool_connections: Size of the client's HTTP connection pool.
+
+    Returns:
+        Boto3 S3 client.
+    """
+    return boto3.client(
+        "s3",
+        region_name=aws_region,
+        config=Config(
+            max_pool_connections=max_pool_connections,
+            retries={"max_attempts": 10, "mode": "adaptive"},
+            tcp_keepalive=True,
+        ),
+    )
+
 
 class S3VersionedLoader(Loader):
     """Loader that persists data to S3 with versioning."""
@@ -28,6 +58,9 @@ class S3VersionedLoader(Loader):
                 - load.partition_strategy: Partition strategy (optional, default: "series_year_month")
                 - load.compression: Compression codec (optional, default: "snappy")
                 - load.aws_region: AWS region (optional, default: "us-east-1")
+                - load.upload_workers: Parallel S3 uploads (optional, default: 1, sequential)
+                - load.skip_unchanged_files: Copy files whose checksum matches the current
+                  version server-side instead of uploading them (optional, default: False)
             s3_client: Boto3 S3 client (optional, for testing).
         """
         self._validate_config(config)
@@ -37,8 +70,24 @@ class S3VersionedLoader(Loader):
 
         load_config = config.get("load", {})  # type: ignore[union-attr]
         aws_region = load_config.get("aws_region", "us-east-1")
-
-        self._s3_client = s3_client or boto3.client("s3", region_name=aws_region)
+        self._upload_workers: int = load_config.get("upload_workers", 1)
+        self._skip_unchanged_files: bool = load_config.get("skip_unchanged_files", False)
+        self._partition_strategy_name: str = load_config.get(
+            "partition_strategy", "series_year_month"
+        )
+        self._versions_key_prefix = f"datasets/{self._dataset_id}/versions/"
+
+        # The client is also shared with the projection phase, so size its pool for
+        # whichever of the loader's or the projection's workers is largest
+        projection_config = load_config.get("projection", {})
+        workers = max(
+            self._upload_workers,
+            projection_config.get("copy_workers", 1),
+            projection_config.get("merge_workers", 1),
+        )
+        self._s3_client = s3_client or _get_default_s3_client(
+            aws_region, max(workers, _MIN_POOL_CONNECTIONS)
+        )
 
         # Initialize components
         self._partition_strategy = PartitionStrategyFactory.create(config)
@@ -50,6 +99,11 @@ class S3VersionedLoader(Loader):
             bucket=self._bucket, s3_client=self._s3_client, aws_region=aws_region
         )
 
+    @property
+    def s3_client(self) -> Any:
+        """Boto3 S3 client used by this loader."""
+        return self._s3_client
+
     def load(self, data: List[Dict[str, Any]], config: Dict[str, Any]) -> None:
         """Load data to S3 with versioning.
 
@@ -69,11 +123,11 @@ class S3VersionedLoader(Loader):
         logger.info("Created version: %s", version_id)
 
         logger.info("Writing JSON files and uploading to S3")
-        json_files = self._write_and_upload_json_files(data, version_id)
-        logger.info("Uploaded %d JSON file(s) to S3", len(json_files))
+        file_checksums = self._write_and_upload_json_files(data, version_id)
+        logger.info("Uploaded %d JSON file(s) to S3", len(file_checksums))
 
         logger.info("Creating and saving manifest")
-        self._create_and_save_manifest(data, json_files, version_id)
+        self._create_and_save_manifest(data, file_checksums, version_id)
         logger.info("Manifest saved successfully")
 
         logger.info("Updating current version pointer to: %s", version_id)
@@ -101,28 +155,153 @@ class S3VersionedLoader(Loader):
 
     def _write_and_upload_json_files(
         self, data: List[Dict[str, Any]], version_id: str
-    ) -> List[str]:
-        """Write JSON files to temporary directory and upload to S3.
+    ) -> Dict[str, Optional[str]]:
+        """Serialize JSON files in memory and upload them to S3.
 
         Args:
             data: List of data point dictionaries.
             version_id: Version identifier.
 
         Returns:
-            List of relative JSON file paths.
+            Dictionary mapping relative JSON file paths to their MD5 checksums (None when
+            skip_unchanged_files is disabled).
+        """
+        previous_version_id, previous_checksums = self._get_previous_file_checksums()
+        json_documents = self._json_writer.iter_json_files(data)
+
+        if self._upload_workers > 1:
+            file_checksums = self._upload_files_parallel(
+                json_documents, version_id, previous_version_id, previous_checksums
+            )
+        else:
+            file_checksums = {}
+            for rel_path, content in json_documents:
+                checksum = self._file_checksum(content)
+                logger.info("Uploading file %d: %s", len(file_checksums) + 1, rel_path)
+                self._store_json(
+                    rel_path,
+                    content,
+                    version_id,
+                    previous_version_id if previous_checksums.get(rel_path) == checksum else None,
+                )
+                file_checksums[rel_path] = checksum
+
+        logger.info("Generated %d JSON file(s)", len(file_checksums))
+        return file_checksums
+
+    def _upload_files_parallel(
+        self,
+        json_documents: Iterable[Tuple[str, bytes]],
+        version_id: str,
+        previous_version_id: Optional[str],
+        previous_checksums: Dict[str, str],
+    ) -> Dict[str, Optional[str]]:
+        """Upload JSON documents to S3 in parallel using ThreadPoolExecutor.
+
+        Uploads are submitted as documents are serialized, so serialization overlaps
+        with the network transfers.
+
+        Args:
+            json_documents: Iterable of (relative file path, JSON document) tuples.
+            version_id: Version identifier.
+            previous_version_id: Version to copy unchanged files from, if any.
+            previous_checksums: Checksums of the files in the previous version.
+
+        Returns:
+            Dictionary mapping relative JSON file paths to their MD5 checksums (None when
+            skip_unchanged_files is disabled).
+
+        Raises:
+            Exception: The first upload error, after all submitted uploads finish.
+        """
+        logger.info("Uploading JSON files in parallel with %d workers", self._upload_workers)
+
+        file_checksums = {}
+        futures = []
+        with ThreadPoolExecutor(max_workers=self._upload_workers) as executor:
+            for rel_path, content in json_documents:
+                checksum = self._file_checksum(content)
+                source_version_id = (
+                    previous_version_id if previous_checksums.get(rel_path) == checksum else None
+                )
+                futures.append(
+                    executor.submit(
+                        self._store_json, rel_path, content, version_id, source_version_id
+                    )
+                )
+                file_checksums[rel_path] = checksum
+
+        for future in futures:
+            future.result()
+
+        return file_checksums
+
+    def _file_checksum(self, content: bytes) -> Optional[str]:
+        """Get the checksum used to detect files unchanged since the previous version.
+
+        MD5 only detects changes here, so it is flagged as not used for security,
+        which FIPS-enabled hosts require.
+
+        Args:
+            content: UTF-8 encoded JSON document.
+
+        Returns:
+            MD5 hex digest, or None when skip_unchanged_files is disabled.
+        """
+        if not self._skip_unchanged_files:
+            return None
+        return hashlib.md5(content, usedforsecurity=False).hexdigest()
+
+    def _get_previous_file_checksums(self) -> Tuple[Optional[str], Dict[str, str]]:
+        """Get the file checksums recorded in the current version's manifest.
+
+        Returns:
+            Tuple of (current version id, checksums by relative file path). Empty when
+            skip_unchanged_files is disabled or there is no previous version.
         """
-        with tempfile.TemporaryDirectory() as tmpdir:
-            base_path = os.path.join(tmpdir, "data")
-            json_files = self._json_writer.write_to_json(data, base_path)
-            logger.info("Generated %d JSON file(s)", len(json_files))
+        if not self._skip_unchanged_files:
+            return None, {}
+
+        previous_version_id = self._version_manager.get_current_version(self._dataset_id)
+        if previous_version_id is None:
+            return None, {}
+
+        manifest = self._manifest_manager.load_manifest(self._dataset_id, previous_version_id)
+        if manifest is None:
+            return None, {}
+
+        return previous_version_id, manifest.get("file_checksums", {})
+
+    def _store_json(
+        self,
+        rel_path: str,
+        content: bytes,
+        version_id: str,
+        source_version_id: Optional[str] = None,
+    ) -> None:
+        """Store a serialized JSON document in S3.
 
-            for idx, rel_path in enumerate(json_files, 1):
-                local_path = os.path.join(base_path, rel_path)
-                s3_key = self._build_s3_key(rel_path, version_id)
-                logger.info("Uploading file %d/%d: %s", idx, len(json_files), s3_key)
-                self._s3_client.upload_file(local_path, self._bucket, s3_key)
+        Args:
+            rel_path: Relative JSON file path.
+            content: UTF-8 encoded JSON document.
+            version_id: Version identifier.
+            source_version_id: Version holding an identical copy of the file. When
+                given, the file is copied server-side instead of uploaded.
+        """
+        s3_key = self._build_s3_key(rel_path, version_id)
+        if source_version_id is None:
+            self._s3_client.put_object(Bucket=self._bucket, Key=s3_key, Body=content)
+            return
 
-            return json_files
+        logger.debug("Copying unchanged file %s from version %s", rel_path, source_version_id)
+        self._s3_client.copy_object(
+            Bucket=self._bucket,
+            Key=s3_key,
+            CopySource={
+                "Bucket": self._bucket,
+                "Key": self._build_s3_key(rel_path, source_version_id),
+            },
+        )
 
     def _build_s3_key(self, rel_path: str, version_id: str) -> str:
         """Build S3 key for a JSON file.
@@ -134,19 +313,25 @@ class S3VersionedLoader(Loader):
         Returns:
             S3 key string.
         """
-        return f"datasets/{self._dataset_id}/versions/{version_id}/data/{rel_path}"
+        return f"{self._versions_key_prefix}{version_id}/data/{rel_path}"
 
     def _create_and_save_manifest(
-        self, data: List[Dict[str, Any]], json_files: List[str], version_id: str
+        self,
+        data: List[Dict[str, Any]],
+        file_checksums: Dict[str, Optional[str]],
+        version_id: str,
     ) -> None:
         """Create and save manifest to S3.
 
+        Checksums are recorded only when skip_unchanged_files is enabled, since that is
+        the only reader of them.
+
         Args:
             data: List of data point dictionaries.
-            json_files: List of relative JSON file paths.
+            file_checksums: Dictionary mapping relative JSON file paths to MD5 checksums.
             version_id: Version identifier.
         """
-        partition_strategy_name = self._get_partition_strategy_name()
+        json_files = list(file_checksums)
         partitions = self._extract_partitions_from_paths(json_files)
 
         manifest = self._manifest_manager.create_manifest(
@@ -155,22 +340,14 @@ class S3VersionedLoader(Loader):
             data=data,
             json_files=json_files,
             partitions=partitions,
-            partition_strategy=partition_strategy_name,
+            partition_strategy=self._partition_strategy_name,
+            file_checksums=file_checksums if self._skip_unchanged_files else None,
         )
 
         self._manifest_manager.save_manifest(
             dataset_id=self._dataset_id, version_id=version_id, manifest=manifest
         )
 
-    def _get_partition_strategy_name(self) -> str:
-        """Get partition strategy name from configuration.
-
-        Returns:
-            Partition strategy name.
-        """
-        load_config = self._config.get("load", {})  # type: ignore[union-attr]
-        return load_config.get("partition_strategy", "series_year_month")
-
     def _extract_partitions_from_paths(self, json_files: List[str]) -> List[str]:
         """Extract partition paths from JSON file paths.
 
@@ -1,12 +1,9 @@
 """Normalizer plugins."""
 
 from src.application.plugin_registry import PluginRegistry
-from src.infrastructure.plugins.normalizers.bcra_infomondia_normalizer import (
-    BcraInfomondiaNormalizer,
-)
-from src.infrastructure.plugins.normalizers.indec_ipc_normalizer import (
-    IndecIpcNormalizer,
-)
+
+# Plugins are registered by import path so their modules load on first use
+_PACKAGE = "src.infrastructure.plugins.normalizers"
 
 
 def register_normalizers(registry: PluginRegistry) -> None:
@@ -15,5 +12,7 @@ def register_normalizers(registry: PluginRegistry) -> None:
     Args:
         registry: PluginRegistry instance to register plugins in.
     """
-    registry.register_normalizer("bcra_infomondia", BcraInfomondiaNormalizer)
-    registry.register_normalizer("indec_ipc", IndecIpcNormalizer)
+    registry.register_normalizer(
+        "bcra_infomondia", f"{_PACKAGE}.bcra_infomondia_normalizer:BcraInfomondiaNormalizer"
+    )
+    registry.register_normalizer("indec_ipc", f"{_PACKAGE}.indec_ipc_normalizer:IndecIpcNormalizer")
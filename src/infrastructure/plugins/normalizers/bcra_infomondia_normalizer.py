@@ -1,5 +1,6 @@
 """BCRA Infomondia normalizer plugin."""
 
+import math
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
@@ -90,21 +91,23 @@ class BcraInfomondiaNormalizer(Normalizer):
             value: Value to normalize (float, int, string, or None).
             
         Returns:
-            Float value or None if invalid.
+            Float value or None if invalid or not finite (NaN, infinity).
         """
         if value is None:
             return None
         
         if isinstance(value, (int, float)):
-            return float(value)
-        
-        if isinstance(value, str):
+            number = float(value)
+        elif isinstance(value, str):
             cleaned = value.replace(",", ".").replace(" ", "").strip()
             if not cleaned:
                 return None
             try:
-                return float(cleaned)
+                number = float(cleaned)
             except ValueError:
                 return None
+        else:
+            return None
         
-        return None
+        # NaN and infinity are not valid JSON and carry no observation
+        return number if math.isfinite(number) else None
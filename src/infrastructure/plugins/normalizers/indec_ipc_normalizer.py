@@ -1,16 +1,19 @@
 """INDEC IPC normalizer plugin."""
 
-from datetime import datetime
-from typing import Any, Dict, List, Optional
-
-import pytz
+import math
+from datetime import datetime, tzinfo
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from src.domain.interfaces import Normalizer
+from src.infrastructure.utils.date_utils import get_timezone
 
 
 class IndecIpcNormalizer(Normalizer):
     """Normalizer for INDEC IPC parsed data."""
 
+    # Decimal comma to point, drop spaces used as thousands separators
+    _VALUE_TRANSLATION = str.maketrans({",": ".", " ": None})
+
     def normalize(
         self, 
         data: List[Dict[str, Any]], 
@@ -29,9 +32,9 @@ class IndecIpcNormalizer(Normalizer):
         timezone_str = normalize_config.get("timezone", "UTC")
         primary_keys = normalize_config.get("primary_keys", [])
         
-        timezone = pytz.timezone(timezone_str)
-        normalized = []
-        seen = set()
+        timezone = get_timezone(timezone_str)
+        # Rows keyed by (obs_time, internal_series_code); first occurrence wins
+        normalized: Dict[Union[Tuple[datetime, Any], int], Dict[str, Any]] = {}
         
         for data_point in data:
             internal_series_code = data_point.get("internal_series_code")
@@ -46,26 +49,25 @@ class IndecIpcNormalizer(Normalizer):
             if value is None:
                 continue
             
-            dedup_key = (obs_time, internal_series_code) if primary_keys else None
-            if dedup_key and dedup_key in seen:
+            # Without primary keys every row is kept, so key by position instead
+            dedup_key = (obs_time, internal_series_code) if primary_keys else len(normalized)
+            if dedup_key in normalized:
                 continue
-            if dedup_key:
-                seen.add(dedup_key)
             
-            normalized.append({
+            normalized[dedup_key] = {
                 "obs_time": obs_time,
                 "internal_series_code": str(internal_series_code),
                 "value": value,
                 "unit": data_point.get("unit"),
                 "frequency": data_point.get("frequency"),
-            })
+            }
         
-        return normalized
+        return list(normalized.values())
     
     def _parse_datetime(
         self, 
         value: Any, 
-        timezone: pytz.BaseTzInfo
+        timezone: tzinfo
     ) -> Optional[datetime]:
         """Parse datetime value and apply timezone.
         
@@ -80,7 +82,7 @@ class IndecIpcNormalizer(Normalizer):
             return None
         
         if value.tzinfo is None:
-            return timezone.localize(value)
+            return value.replace(tzinfo=timezone)
         return value.astimezone(timezone)
     
     def _normalize_value(self, value: Any) -> Optional[float]:
@@ -90,22 +92,22 @@ class IndecIpcNormalizer(Normalizer):
             value: Value to normalize (float, int, string, or None).
             
         Returns:
-            Float value or None if invalid.
+            Float value or None if invalid or not finite (NaN, infinity).
         """
         if value is None:
             return None
         
         if isinstance(value, (int, float)):
-            return float(value)
-        
-        if isinstance(value, str):
-            cleaned = value.replace(",", ".").replace(" ", "").strip()
-            if not cleaned:
-                return None
+            number = float(value)
+        elif isinstance(value, str):
+            # float() ignores surrounding whitespace and rejects empty strings
             try:
-                return float(cleaned)
+                number = float(value.translate(self._VALUE_TRANSLATION))
             except ValueError:
                 return None
+        else:
+            return None
         
-        return None
+        # NaN and infinity are not valid JSON and carry no observation
+        return number if math.isfinite(number) else None
 
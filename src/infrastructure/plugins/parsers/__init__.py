@@ -1,8 +1,9 @@
 """Parser plugins."""
 
 from src.application.plugin_registry import PluginRegistry
-from src.infrastructure.plugins.parsers.bcra_infomondia_parser import BcraInfomondiaParser
-from src.infrastructure.plugins.parsers.indec_ipc_parser import IndecIpcParser
+
+# Plugins are registered by import path so their modules load on first use
+_PACKAGE = "src.infrastructure.plugins.parsers"
 
 
 def register_parsers(registry: PluginRegistry) -> None:
@@ -11,5 +12,7 @@ def register_parsers(registry: PluginRegistry) -> None:
     Args:
         registry: PluginRegistry instance to register plugins in.
     """
-    registry.register_parser("bcra_infomondia", BcraInfomondiaParser)
-    registry.register_parser("indec_ipc", IndecIpcParser)
+    registry.register_parser(
+        "bcra_infomondia", f"{_PACKAGE}.bcra_infomondia_parser:BcraInfomondiaParser"
+    )
+    registry.register_parser("indec_ipc", f"{_PACKAGE}.indec_ipc_parser:IndecIpcParser")
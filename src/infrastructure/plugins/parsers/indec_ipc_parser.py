@@ -1,6 +1,7 @@
 """INDEC IPC parser plugin."""
 
 import io
+from contextlib import ExitStack
 from datetime import datetime
 from typing import Dict, List, Optional, Union
 
@@ -41,32 +42,93 @@ class IndecIpcParser(Parser):
         series_map = parse_config.get("series_map", [])
         
         parsed_data: List[SeriesDataPoint] = []
+        if not series_map:
+            return parsed_data
         
-        for series_config in series_map:
-            series_code = str(series_config.get("internal_series_code", ""))
-            last_date = series_last_dates.get(series_code) if series_last_dates else None
-            series_data = self._extract_series(raw_data, series_config, last_date)
-            parsed_data.extend(series_data)
+        # Open the workbook once per engine and parse each referenced sheet at most once
+        with ExitStack() as stack:
+            workbooks: Dict[str, pd.ExcelFile] = {}
+            sheets: Dict[Union[str, int], pd.DataFrame] = {}
+            for series_config in series_map:
+                sheet_name = series_config["sheet"]
+                df = sheets.get(sheet_name)
+                if df is None:
+                    df = self._read_sheet(raw_data, sheet_name, workbooks, stack)
+                    sheets[sheet_name] = df
+                
+                series_code = str(series_config.get("internal_series_code", ""))
+                last_date = series_last_dates.get(series_code) if series_last_dates else None
+                series_data = self._extract_series(df, series_config, last_date)
+                parsed_data.extend(series_data)
         
         return parsed_data
     
+    def _read_sheet(
+        self,
+        raw_data: bytes,
+        sheet_name: Union[str, int],
+        workbooks: Dict[str, pd.ExcelFile],
+        stack: ExitStack,
+    ) -> pd.DataFrame:
+        """Read a worksheet with xlrd (.xls files), falling back to openpyxl.
+        
+        Args:
+            raw_data: Raw bytes of the Excel file.
+            sheet_name: Name or index of the sheet to read.
+            workbooks: Workbooks already opened, keyed by engine.
+            stack: Exit stack that closes the opened workbooks.
+            
+        Returns:
+            Sheet contents (header=None).
+        """
+        try:
+            workbook = self._open_workbook(raw_data, "xlrd", workbooks, stack)
+            return workbook.parse(sheet_name=sheet_name, header=None)
+        except Exception:
+            # Try with openpyxl if xlrd fails
+            workbook = self._open_workbook(raw_data, "openpyxl", workbooks, stack)
+            return workbook.parse(sheet_name=sheet_name, header=None)
+    
+    def _open_workbook(
+        self,
+        raw_data: bytes,
+        engine: str,
+        workbooks: Dict[str, pd.ExcelFile],
+        stack: ExitStack,
+    ) -> pd.ExcelFile:
+        """Open an Excel workbook from raw bytes, reusing it if already open.
+        
+        Args:
+            raw_data: Raw bytes of the Excel file.
+            engine: pandas Excel engine to read with.
+            workbooks: Workbooks already opened, keyed by engine.
+            stack: Exit stack the new workbook is registered on.
+            
+        Returns:
+            pandas ExcelFile read with the given engine.
+        """
+        workbook = workbooks.get(engine)
+        if workbook is None:
+            workbook = stack.enter_context(pd.ExcelFile(io.BytesIO(raw_data), engine=engine))
+            workbooks[engine] = workbook
+        return workbook
+    
     def _extract_series(
         self, 
-        raw_data: bytes,
+        df: pd.DataFrame,
         series_config: Dict[str, Union[str, int, bool]],
         last_date: Optional[datetime] = None
     ) -> List[SeriesDataPoint]:
-        """Extract data for a single series from the Excel file.
+        """Extract data for a single series from a worksheet.
         
         Args:
-            raw_data: Raw bytes of the Excel file.
+            df: Sheet contents (header=None) the series is read from.
             series_config: Configuration for the series to extract.
             last_date: Last processed date for this series (filters dates <= last_date).
             
         Returns:
             List of dictionaries containing series data points.
         """
-        sheet_name = series_config["sheet"]
         fecha_row = series_config["fecha_row"]  # Row number (1-indexed)
         fecha_start_col = series_config["fecha_start_col"]  # Column letter (e.g., "B")
         valor_row = series_config["valor_row"]  # Row number (1-indexed)
@@ -77,25 +139,6 @@ class IndecIpcParser(Parser):
         fecha_start_col_idx = excel_column_to_index(fecha_start_col)
         valor_start_col_idx = excel_column_to_index(valor_start_col)
         
-        # Load Excel file using pandas with xlrd engine for .xls files
-        excel_file = io.BytesIO(raw_data)
-        try:
-            df = pd.read_excel(
-                excel_file, 
-                sheet_name=sheet_name, 
-                engine='xlrd', 
-                header=None
-            )
-        except Exception:
-            # Try with openpyxl if xlrd fails
-            excel_file.seek(0)
-            df = pd.read_excel(
-                excel_file, 
-                sheet_name=sheet_name, 
-                engine='openpyxl', 
-                header=None
-            )
-        
         # Convert to 0-based row indices
         fecha_row_idx = fecha_row - 1
         valor_row_idx = valor_row - 1
@@ -104,6 +147,12 @@ class IndecIpcParser(Parser):
         fecha_row_data = df.iloc[fecha_row_idx, fecha_start_col_idx:]
         valor_row_data = df.iloc[valor_row_idx, valor_start_col_idx:]
         
+        # Values shared by every data point of the series
+        last_date = to_naive(last_date)
+        internal_series_code = str(series_config["internal_series_code"])
+        unit = series_config.get("unit")
+        frequency = series_config.get("frequency")
+        
         # Build series data points
         series_data: List[SeriesDataPoint] = []
         
@@ -129,7 +178,7 @@ class IndecIpcParser(Parser):
             fecha_val = to_naive(fecha_val)
             
             # Filter by last_date if provided
-            if last_date and fecha_val <= to_naive(last_date):
+            if last_date and fecha_val <= last_date:
                 continue
             
             # Skip if value is None and drop_na is True
@@ -152,9 +201,9 @@ class IndecIpcParser(Parser):
                 continue
             
             series_data.append({
-                "internal_series_code": str(series_config["internal_series_code"]),
-                "unit": series_config.get("unit"),
-                "frequency": series_config.get("frequency"),
+                "internal_series_code": internal_series_code,
+                "unit": unit,
+                "frequency": frequency,
                 "obs_time": fecha_val,
                 "value": valor_val,
             })
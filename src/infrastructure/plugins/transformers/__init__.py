@@ -1,12 +1,9 @@
 """Transformer plugins."""
 
 from src.application.plugin_registry import PluginRegistry
-from src.infrastructure.plugins.transformers.bcra_infomondia_transformer import (
-    BcraInfomondiaTransformer,
-)
-from src.infrastructure.plugins.transformers.indec_ipc_transformer import (
-    IndecIpcTransformer,
-)
+
+# Plugins are registered by import path so their modules load on first use
+_PACKAGE = "src.infrastructure.plugins.transformers"
 
 
 def register_transformers(registry: PluginRegistry) -> None:
@@ -15,5 +12,9 @@ def register_transformers(registry: PluginRegistry) -> None:
     Args:
         registry: PluginRegistry instance to register transformers in.
     """
-    registry.register_transformer("bcra_infomondia", BcraInfomondiaTransformer)
-    registry.register_transformer("indec_ipc", IndecIpcTransformer)
+    registry.register_transformer(
+        "bcra_infomondia", f"{_PACKAGE}.bcra_infomondia_transformer:BcraInfomondiaTransformer"
+    )
+    registry.register_transformer(
+        "indec_ipc", f"{_PACKAGE}.indec_ipc_transformer:IndecIpcTransformer"
+    )
@@ -1,10 +1,13 @@
 """INDEC IPC transformer plugin."""
 
 from datetime import UTC, datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 from src.domain.interfaces import Transformer
 
+# (unit, frequency) for series missing from the series map
+_MISSING_METADATA: Tuple[None, None] = (None, None)
+
 
 class IndecIpcTransformer(Transformer):
     """Transformer for INDEC IPC normalized data.
@@ -28,31 +31,23 @@ class IndecIpcTransformer(Transformer):
         parse_config = config.get("parse_config", {})
         series_map = parse_config.get("series_map", [])
 
-        # Create lookup dict: series_code -> {unit, frequency}
-        series_metadata = {}
+        # Create lookup dict: series_code -> (unit, frequency)
+        series_metadata: Dict[str, Tuple[Any, Any]] = {}
         for series_config in series_map:
             series_code = str(series_config.get("internal_series_code", ""))
             if series_code:
-                series_metadata[series_code] = {
-                    "unit": series_config.get("unit"),
-                    "frequency": series_config.get("frequency"),
-                }
+                series_metadata[series_code] = (
+                    series_config.get("unit"),
+                    series_config.get("frequency"),
+                )
 
         # Get collection date (when ETL is executed)
         collection_date = datetime.now(UTC)
 
-        # Transform each data point
-        transformed = []
-        for data_point in data:
-            series_code = data_point.get("internal_series_code")
-
-            # Get unit and frequency from config (not from parser)
-            metadata = series_metadata.get(series_code, {})
-            unit = metadata.get("unit")
-            frequency = metadata.get("frequency")
-
-            # Create transformed data point
-            transformed_point = {
+        # Transform each data point; unit and frequency come from config (not from parser)
+        get_metadata = series_metadata.get
+        return [
+            {
                 "obs_time": data_point["obs_time"],
                 "internal_series_code": series_code,
                 "value": data_point["value"],
@@ -60,8 +55,7 @@ class IndecIpcTransformer(Transformer):
                 "frequency": frequency,  # From config
                 "collection_date": collection_date,  # When ETL was executed
             }
-
-            transformed.append(transformed_point)
-
-        return transformed
-
+            for data_point in data
+            for series_code in (data_point.get("internal_series_code"),)
+            for unit, frequency in (get_metadata(series_code, _MISSING_METADATA),)
+        ]
@@ -1,7 +1,9 @@
 """Atomic mover for staging to projections."""
 
 import logging
-from typing import Any, List
+from concurrent.futures import Executor, ThreadPoolExecutor, as_completed, wait
+from contextlib import nullcontext
+from typing import Any, ContextManager, List, Optional
 
 from botocore.exceptions import ClientError
 
@@ -9,20 +11,35 @@ from src.infrastructure.utils.aws_utils import create_s3_client
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of keys S3 accepts in one DeleteObjects request
+_DELETE_BATCH_SIZE = 1000
+
 
 class AtomicProjectionMover:
     """Moves staging data to projections atomically."""
 
-    def __init__(self, bucket: str, s3_client: Any = None, aws_region: str = "us-east-1"):
+    def __init__(
+        self,
+        bucket: str,
+        s3_client: Any = None,
+        aws_region: str = "us-east-1",
+        copy_workers: int = 1,
+        executor: Optional[Executor] = None,
+    ):
         """Initialize AtomicProjectionMover.
 
         Args:
             bucket: S3 bucket name.
             s3_client: Boto3 S3 client (optional, for testing).
             aws_region: AWS region (default: us-east-1).
+            copy_workers: Number of parallel workers for copying files (default: 1, sequential).
+            executor: Shared executor to run copies and listings on instead of a private pool of
+                copy_workers threads (optional). It is not shut down by this class.
         """
         self._bucket = bucket
         self._s3_client = create_s3_client(aws_region=aws_region, s3_client=s3_client)
+        self._copy_workers = copy_workers
+        self._executor = executor
 
     def move_staging_to_projections(self, dataset_id: str) -> None:
         """Move all files from staging to projections atomically.
@@ -50,72 +67,113 @@ class AtomicProjectionMover:
     def _get_staging_files(self, dataset_id: str) -> List[str]:
         """Get all staging files for a dataset."""
         staging_prefix = f"datasets/{dataset_id}/staging/"
+        if self._copy_workers > 1:
+            return self._list_s3_files_parallel(staging_prefix)
         return self._list_s3_files(staging_prefix)
 
     def _list_s3_files(self, prefix: str) -> List[str]:
         """List all S3 files with given prefix, handling pagination."""
-        all_keys = []
-        continuation_token = None
+        all_keys: List[str] = []
+        paginator = self._s3_client.get_paginator("list_objects_v2")
 
         try:
-            while True:
-                params = {"Bucket": self._bucket, "Prefix": prefix}
-                if continuation_token:
-                    params["ContinuationToken"] = continuation_token
-
-                response = self._s3_client.list_objects_v2(**params)
+            for page in paginator.paginate(
+                Bucket=self._bucket, Prefix=prefix, PaginationConfig={"PageSize": 1000}
+            ):
+                all_keys.extend(obj["Key"] for obj in page.get("Contents", ()))
 
-                if "Contents" in response:
-                    all_keys.extend([obj["Key"] for obj in response["Contents"]])
+            return all_keys
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "NoSuchKey":
+                return []
+            raise
 
-                if not response.get("IsTruncated", False):
-                    break
+    def _list_s3_files_parallel(self, prefix: str) -> List[str]:
+        """List all S3 files with given prefix, listing each top-level sub-prefix concurrently.
 
-                continuation_token = response.get("NextContinuationToken")
+        Sub-prefixes (one per series code under staging) are discovered with a
+        delimited listing. Falls back to a single paginated listing when there are
+        fewer than two of them.
+        """
+        paginator = self._s3_client.get_paginator("list_objects_v2")
+        sub_prefixes: List[str] = []
+        all_keys: List[str] = []
 
-            return all_keys
+        try:
+            for page in paginator.paginate(Bucket=self._bucket, Prefix=prefix, Delimiter="/"):
+                sub_prefixes.extend(common["Prefix"] for common in page.get("CommonPrefixes", ()))
+                all_keys.extend(obj["Key"] for obj in page.get("Contents", ()))
         except ClientError as e:
             if e.response["Error"]["Code"] == "NoSuchKey":
                 return []
             raise
 
+        if len(sub_prefixes) < 2:
+            return self._list_s3_files(prefix)
+
+        logger.info(
+            "Listing %d sub-prefixes in parallel with %d workers",
+            len(sub_prefixes),
+            self._copy_workers,
+        )
+        with self._executor_scope() as executor:
+            for keys in executor.map(self._list_s3_files, sub_prefixes):
+                all_keys.extend(keys)
+
+        return all_keys
+
     def _copy_all_to_projections(self, dataset_id: str, staging_files: List[str]) -> List[str]:
-        """Copy all staging files to projections with automatic rollback on failure."""
+        """Copy all staging files to projections in parallel with automatic rollback on failure."""
         staging_prefix = f"datasets/{dataset_id}/staging/"
         projections_prefix = f"datasets/{dataset_id}/projections/"
 
         total_files = len(staging_files)
-        copied_files = []
-        try:
-            for idx, staging_key in enumerate(staging_files, 1):
+        # Log progress every 100 files or at milestones (10%, 25%, 50%, 75%, 90%)
+        progress_milestones = {
+            int(total_files * fraction) for fraction in (0.1, 0.25, 0.5, 0.75, 0.9)
+        }
+        logger.info("Copying %d files in parallel with %d workers", total_files, self._copy_workers)
+
+        with self._executor_scope() as executor:
+            future_to_key = {}
+            for staging_key in staging_files:
                 projections_key = self._convert_to_projections_key(
                     staging_key, staging_prefix, projections_prefix
                 )
-                self._copy_s3_file(staging_key, projections_key)
-                copied_files.append(projections_key)
-                
-                # Log progress every 100 files or at milestones (10%, 25%, 50%, 75%, 90%)
-                if idx % 100 == 0 or idx in [
-                    int(total_files * 0.1),
-                    int(total_files * 0.25),
-                    int(total_files * 0.5),
-                    int(total_files * 0.75),
-                    int(total_files * 0.9),
-                ]:
-                    progress_pct = (idx / total_files) * 100
-                    logger.info(
-                        "Copying progress: %d/%d files (%.1f%%)",
-                        idx,
-                        total_files,
-                        progress_pct,
-                    )
-            
-            logger.info("Successfully copied all %d file(s) to projections", total_files)
-            return copied_files
-        except Exception:  # noqa: BLE001
-            logger.error("Copy failed, rolling back %d copied file(s)", len(copied_files))
-            self._delete_files(copied_files)
-            raise
+                future = executor.submit(self._copy_s3_file, staging_key, projections_key)
+                future_to_key[future] = projections_key
+
+            try:
+                for idx, future in enumerate(as_completed(future_to_key), 1):
+                    future.result()
+                    if idx % 100 == 0 or idx in progress_milestones:
+                        logger.info(
+                            "Copying progress: %d/%d files (%.1f%%)",
+                            idx,
+                            total_files,
+                            (idx / total_files) * 100,
+                        )
+            except Exception:  # noqa: BLE001
+                for pending in future_to_key:
+                    pending.cancel()
+                wait(future_to_key)
+                copied_files = [
+                    key
+                    for future, key in future_to_key.items()
+                    if not future.cancelled() and future.exception() is None
+                ]
+                logger.error("Copy failed, rolling back %d copied file(s)", len(copied_files))
+                self._delete_files(copied_files)
+                raise
+
+        logger.info("Successfully copied all %d file(s) to projections", total_files)
+        return list(future_to_key.values())
+
+    def _executor_scope(self) -> ContextManager[Executor]:
+        """Get the shared executor, or a private pool that is shut down on exit."""
+        if self._executor is not None:
+            return nullcontext(self._executor)
+        return ThreadPoolExecutor(max_workers=self._copy_workers)
 
     def _convert_to_projections_key(
         self, staging_key: str, staging_prefix: str, projections_prefix: str
@@ -148,28 +206,31 @@ class AtomicProjectionMover:
             )
 
     def _delete_files(self, keys: List[str]) -> None:
-        """Delete multiple S3 files, continuing even if individual deletes fail."""
+        """Delete multiple S3 files in batches, continuing even if individual deletes fail."""
         total_files = len(keys)
-        for idx, key in enumerate(keys, 1):
-            self._delete_single_file(key)
-            # Log progress every 500 files or at milestones
-            if idx % 500 == 0 or idx in [
-                int(total_files * 0.25),
-                int(total_files * 0.5),
-                int(total_files * 0.75),
-            ]:
-                progress_pct = (idx / total_files) * 100
+        for start in range(0, total_files, _DELETE_BATCH_SIZE):
+            batch = keys[start : start + _DELETE_BATCH_SIZE]
+            self._delete_batch(batch)
+            if total_files > _DELETE_BATCH_SIZE:
+                deleted = start + len(batch)
                 logger.info(
                     "Deleting progress: %d/%d files (%.1f%%)",
-                    idx,
+                    deleted,
                     total_files,
-                    progress_pct,
+                    (deleted / total_files) * 100,
                 )
 
-    def _delete_single_file(self, key: str) -> None:
-        """Delete a single S3 file, logging errors but not raising."""
+    def _delete_batch(self, keys: List[str]) -> None:
+        """Delete up to 1000 S3 files in one request, logging errors but not raising."""
         try:
-            logger.debug("Deleting file %s", key)
-            self._s3_client.delete_object(Bucket=self._bucket, Key=key)
+            logger.debug("Deleting %d file(s)", len(keys))
+            response = self._s3_client.delete_objects(
+                Bucket=self._bucket,
+                Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True},
+            )
         except Exception as e:  # pylint: disable=broad-except  # noqa: BLE001
-            logger.error("Failed to delete file %s: %s", key, e)
+            logger.error("Failed to delete %d file(s): %s", len(keys), e)
+            return
+
+        for error in response.get("Errors", ()):
+            logger.error("Failed to delete file %s: %s", error.get("Key"), error.get("Message"))
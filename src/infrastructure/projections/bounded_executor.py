@@ -0,0 +1,50 @@
+"""Executor that caps in-flight tasks on a shared executor."""
+
+import threading
+from concurrent.futures import Executor, Future
+from typing import Any, Callable
+
+
+class BoundedExecutor(Executor):
+    """Submits to a shared executor with at most a fixed number of tasks in flight.
+
+    Lets several callers share one thread pool while each keeps its own concurrency
+    limit. submit() blocks until one of the caller's earlier tasks has finished.
+    """
+
+    def __init__(self, executor: Executor, max_in_flight: int):
+        """Initialize BoundedExecutor.
+
+        Args:
+            executor: Shared executor that runs the tasks. It is not shut down by this class.
+            max_in_flight: Maximum number of submitted tasks not yet finished.
+        """
+        self._executor = executor
+        self._slots = threading.BoundedSemaphore(max_in_flight)
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        """Submit a task, waiting for a free slot first.
+
+        Args:
+            fn: Callable to run.
+            *args: Positional arguments for fn.
+            **kwargs: Keyword arguments for fn.
+
+        Returns:
+            Future of the task on the shared executor.
+        """
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(fn, *args, **kwargs)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(self._release_slot)
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """Do nothing: the shared executor is shut down by its owner."""
+
+    def _release_slot(self, _future: Future) -> None:
+        """Free the slot held by a finished task."""
+        self._slots.release()
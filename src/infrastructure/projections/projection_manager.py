@@ -1,11 +1,14 @@
 """Projection manager for orchestrating the projection process."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
 import boto3
+from botocore.config import Config
 
 from src.infrastructure.projections.atomic_mover import AtomicProjectionMover
+from src.infrastructure.projections.bounded_executor import BoundedExecutor
 from src.infrastructure.projections.projection_merger import ProjectionMerger
 from src.infrastructure.projections.projection_manifest_manager import (
     ProjectionManifestManager,
@@ -15,6 +18,9 @@ from src.infrastructure.versioning.manifest_manager import ManifestManager
 
 logger = logging.getLogger(__name__)
 
+# Minimum pooled S3 connections for clients created here (botocore defaults to 10)
+_MIN_POOL_CONNECTIONS = 50
+
 
 class ProjectionManager:
     """Orchestrates the complete projection process."""
@@ -35,11 +41,59 @@ class ProjectionManager:
             aws_region: AWS region (default: us-east-1).
             copy_workers: Number of parallel workers for copying files (default: 1).
             merge_workers: Number of parallel workers for merging partitions (default: 1).
+                Copies and merges share one pool of max(copy_workers, merge_workers)
+                threads, but never run more than copy_workers copies or merge_workers
+                merges at a time. Call close() to shut the pool down.
         """
         self._bucket = bucket
-        self._s3_client = s3_client or boto3.client("s3", region_name=aws_region)
-        self._copy_workers = copy_workers
-        self._merge_workers = merge_workers
+        workers = max(copy_workers, merge_workers)
+        # Each worker issues one request at a time, so one connection per worker
+        # keeps threads from queueing on the pool; boto3 clients are thread-safe
+        self._s3_client = s3_client or boto3.client(
+            "s3",
+            region_name=aws_region,
+            config=Config(
+                max_pool_connections=max(workers, _MIN_POOL_CONNECTIONS),
+                retries={"max_attempts": 10, "mode": "adaptive"},
+                tcp_keepalive=True,
+            ),
+        )
+
+        # One pool serves staging copies, merges and the atomic move, so worker
+        # threads (and their pooled S3 connections) are reused across phases
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="projection")
+        logger.debug("Projection worker pool: %d thread(s)", workers)
+        copy_executor = BoundedExecutor(self._executor, copy_workers)
+        merge_executor = BoundedExecutor(self._executor, merge_workers)
+
+        # Collaborators share the S3 client and are reused across projections
+        self._manifest_manager = ManifestManager(bucket=bucket, s3_client=self._s3_client)
+        self._projection_manifest_manager = ProjectionManifestManager(
+            bucket=bucket, s3_client=self._s3_client
+        )
+        self._staging_manager = StagingManager(
+            bucket=bucket,
+            s3_client=self._s3_client,
+            copy_workers=copy_workers,
+            executor=copy_executor,
+        )
+        self._merger = ProjectionMerger(
+            bucket=bucket,
+            s3_client=self._s3_client,
+            merge_workers=merge_workers,
+            executor=merge_executor,
+            staging_manager=self._staging_manager,
+        )
+        self._mover = AtomicProjectionMover(
+            bucket=bucket,
+            s3_client=self._s3_client,
+            copy_workers=copy_workers,
+            executor=copy_executor,
+        )
+
+    def close(self) -> None:
+        """Shut down the worker pool shared by the projection phases."""
+        self._executor.shutdown(wait=True)
 
     def project_version(self, version_id: str, dataset_id: str) -> bool:
         """Project a version to projections.
@@ -64,7 +118,9 @@ class ProjectionManager:
         """
         logger.info("Starting projection for version %s, dataset %s", version_id, dataset_id)
 
-        if self._is_version_already_projected(version_id, dataset_id):
+        # Read once: checked here and updated after the projection succeeds
+        projection_manifest = self._projection_manifest_manager.load_or_empty(dataset_id)
+        if self._is_version_already_projected(version_id, projection_manifest):
             logger.info(
                 "Version %s already projected for dataset %s, skipping", version_id, dataset_id
             )
@@ -83,7 +139,7 @@ class ProjectionManager:
         self._copy_version_to_staging(version_id, dataset_id, json_files)
         self._merge_staging_with_projections(dataset_id)
         self._atomic_move_to_projections(dataset_id)
-        self._record_projected_version(version_id, dataset_id)
+        self._record_projected_version(version_id, dataset_id, projection_manifest)
 
         logger.info("Successfully projected version %s for dataset %s", version_id, dataset_id)
         return True
@@ -98,10 +154,7 @@ class ProjectionManager:
         Returns:
             Manifest dictionary or None if not found.
         """
-        manifest_manager = ManifestManager(
-            bucket=self._bucket, s3_client=self._s3_client
-        )
-        return manifest_manager.load_manifest(dataset_id, version_id)
+        return self._manifest_manager.load_manifest(dataset_id, version_id)
 
     def _copy_version_to_staging(
         self, version_id: str, dataset_id: str, json_files: List[str]
@@ -114,10 +167,7 @@ class ProjectionManager:
             json_files: List of JSON file paths.
         """
         logger.info("Copying version %s to staging", version_id)
-        staging_manager = StagingManager(
-            bucket=self._bucket, s3_client=self._s3_client, copy_workers=self._copy_workers
-        )
-        staging_manager.copy_from_version(version_id, dataset_id, json_files)
+        self._staging_manager.copy_from_version(version_id, dataset_id, json_files)
 
     def _merge_staging_with_projections(self, dataset_id: str) -> None:
         """Merge staging data with existing projections.
@@ -126,10 +176,7 @@ class ProjectionManager:
             dataset_id: Dataset identifier.
         """
         logger.info("Merging staging with projections for dataset %s", dataset_id)
-        merger = ProjectionMerger(
-            bucket=self._bucket, s3_client=self._s3_client, merge_workers=self._merge_workers
-        )
-        merger.merge_all_partitions(dataset_id)
+        self._merger.merge_all_partitions(dataset_id)
 
     def _atomic_move_to_projections(self, dataset_id: str) -> None:
         """Move staging to projections atomically.
@@ -138,8 +185,7 @@ class ProjectionManager:
             dataset_id: Dataset identifier.
         """
         logger.info("Moving staging to projections for dataset %s", dataset_id)
-        mover = AtomicProjectionMover(bucket=self._bucket, s3_client=self._s3_client)
-        mover.move_staging_to_projections(dataset_id)
+        self._mover.move_staging_to_projections(dataset_id)
 
     def _cleanup_staging(self, dataset_id: str) -> None:
         """Cleanup staging area.
@@ -148,33 +194,33 @@ class ProjectionManager:
             dataset_id: Dataset identifier.
         """
         logger.info("Cleaning up staging for dataset %s", dataset_id)
-        staging_manager = StagingManager(bucket=self._bucket, s3_client=self._s3_client)
-        staging_manager.clear_staging(dataset_id)
+        self._staging_manager.clear_staging(dataset_id)
 
-    def _is_version_already_projected(self, version_id: str, dataset_id: str) -> bool:
+    def _is_version_already_projected(
+        self, version_id: str, projection_manifest: Dict[str, Any]
+    ) -> bool:
         """Check if version has already been projected.
 
         Args:
             version_id: Version identifier.
-            dataset_id: Dataset identifier.
+            projection_manifest: Projection manifest of the dataset.
 
         Returns:
             True if version is already projected, False otherwise.
         """
-        manifest_manager = ProjectionManifestManager(
-            bucket=self._bucket, s3_client=self._s3_client
-        )
-        return manifest_manager.is_version_projected(dataset_id, version_id)
+        return version_id in projection_manifest.get("projected_versions", ())
 
-    def _record_projected_version(self, version_id: str, dataset_id: str) -> None:
+    def _record_projected_version(
+        self, version_id: str, dataset_id: str, projection_manifest: Dict[str, Any]
+    ) -> None:
         """Record that a version has been successfully projected.
 
         Args:
             version_id: Version identifier.
             dataset_id: Dataset identifier.
+            projection_manifest: Projection manifest loaded at the start of the projection.
         """
-        manifest_manager = ProjectionManifestManager(
-            bucket=self._bucket, s3_client=self._s3_client
+        self._projection_manifest_manager.add_projected_version(
+            dataset_id, version_id, projection_manifest
         )
-        manifest_manager.add_projected_version(dataset_id, version_id)
 
@@ -1,9 +1,10 @@
 """Projection manifest manager for tracking projected versions."""
 
+import copy
 import json
 import logging
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from botocore.exceptions import ClientError
 
@@ -13,7 +14,12 @@ logger = logging.getLogger(__name__)
 
 
 class ProjectionManifestManager:
-    """Manages projection manifest to track projected versions."""
+    """Manages projection manifest to track projected versions.
+
+    Manifests are cached per dataset with their ETag. Every read revalidates the
+    cached copy with a conditional GET, so S3 answers 304 Not Modified without a body
+    while the manifest is unchanged and writes by other runs are still picked up.
+    """
 
     def __init__(self, bucket: str, s3_client: Any = None, aws_region: str = "us-east-1"):
         """Initialize ProjectionManifestManager.
@@ -25,6 +31,8 @@ class ProjectionManifestManager:
         """
         self._bucket = bucket
         self._s3_client = create_s3_client(aws_region=aws_region, s3_client=s3_client)
+        # dataset_id -> (ETag, manifest) as last read or saved
+        self._manifests: Dict[str, Tuple[str, Dict[str, Any]]] = {}
 
     def is_version_projected(self, dataset_id: str, version_id: str) -> bool:
         """Check if a version has already been projected.
@@ -43,14 +51,30 @@ class ProjectionManifestManager:
         projected_versions = manifest.get("projected_versions", [])
         return version_id in projected_versions
 
-    def add_projected_version(self, dataset_id: str, version_id: str) -> None:
+    def load_or_empty(self, dataset_id: str) -> Dict[str, Any]:
+        """Load the projection manifest, or an empty one if none exists yet.
+
+        Args:
+            dataset_id: Dataset identifier.
+
+        Returns:
+            Manifest dictionary.
+        """
+        return self._load_manifest(dataset_id) or self._create_empty_manifest()
+
+    def add_projected_version(
+        self, dataset_id: str, version_id: str, manifest: Optional[Dict[str, Any]] = None
+    ) -> None:
         """Add a version to the list of projected versions.
 
         Args:
             dataset_id: Dataset identifier.
             version_id: Version identifier.
+            manifest: Manifest previously returned by load_or_empty to update, instead of
+                reading it from S3 again (optional).
         """
-        manifest = self._load_manifest(dataset_id) or self._create_empty_manifest()
+        if manifest is None:
+            manifest = self.load_or_empty(dataset_id)
 
         projected_versions = manifest.get("projected_versions", [])
         if version_id not in projected_versions:
@@ -66,6 +90,18 @@ class ProjectionManifestManager:
     def _load_manifest(self, dataset_id: str) -> Optional[Dict[str, Any]]:
         """Load projection manifest from S3.
 
+        Args:
+            dataset_id: Dataset identifier.
+
+        Returns:
+            Manifest dictionary or None if not found. Callers get their own copy and
+            may modify it.
+        """
+        return copy.deepcopy(self._fetch_manifest(dataset_id))
+
+    def _fetch_manifest(self, dataset_id: str) -> Optional[Dict[str, Any]]:
+        """Read projection manifest from S3, revalidating the cached copy if there is one.
+
         Args:
             dataset_id: Dataset identifier.
 
@@ -73,17 +109,28 @@ class ProjectionManifestManager:
             Manifest dictionary or None if not found.
         """
         key = f"datasets/{dataset_id}/projections/manifest.json"
+        cached = self._manifests.get(dataset_id)
+        params = {"Bucket": self._bucket, "Key": key}
+        if cached is not None:
+            params["IfNoneMatch"] = cached[0]
 
         try:
-            response = self._s3_client.get_object(Bucket=self._bucket, Key=key)
-            with response["Body"] as body:
-                manifest_json = body.read().decode("utf-8")
-                return json.loads(manifest_json)
+            response = self._s3_client.get_object(**params)
         except ClientError as e:
-            if e.response["Error"]["Code"] == "NoSuchKey":
+            error_code = e.response["Error"]["Code"]
+            if cached is not None and error_code in ("304", "NotModified"):
+                return cached[1]
+            if error_code == "NoSuchKey":
+                self._manifests.pop(dataset_id, None)
                 return None
             raise
 
+        with response["Body"] as body:
+            manifest = json.loads(body.read().decode("utf-8"))
+
+        self._cache_manifest(dataset_id, response.get("ETag"), manifest)
+        return manifest
+
     def _save_manifest(self, dataset_id: str, manifest: Dict[str, Any]) -> None:
         """Save projection manifest to S3.
 
@@ -94,12 +141,28 @@ class ProjectionManifestManager:
         key = f"datasets/{dataset_id}/projections/manifest.json"
         manifest_json = json.dumps(manifest, indent=2)
 
-        self._s3_client.put_object(
+        response = self._s3_client.put_object(
             Bucket=self._bucket,
             Key=key,
             Body=manifest_json.encode("utf-8"),
             ContentType="application/json",
         )
+        self._cache_manifest(dataset_id, response.get("ETag"), copy.deepcopy(manifest))
+
+    def _cache_manifest(
+        self, dataset_id: str, etag: Optional[str], manifest: Dict[str, Any]
+    ) -> None:
+        """Remember a manifest and its ETag for conditional reads.
+
+        Args:
+            dataset_id: Dataset identifier.
+            etag: ETag S3 returned for the manifest object (nothing is cached without one).
+            manifest: Manifest dictionary, owned by the cache.
+        """
+        if isinstance(etag, str):
+            self._manifests[dataset_id] = (etag, manifest)
+        else:
+            self._manifests.pop(dataset_id, None)
 
     def _create_empty_manifest(self) -> Dict[str, Any]:
         """Create an empty manifest structure.
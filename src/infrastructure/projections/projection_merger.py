@@ -2,12 +2,13 @@
 
 import json
 import logging
-import tempfile
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import math
+from concurrent.futures import Executor, ThreadPoolExecutor, as_completed, wait
+from contextlib import nullcontext
 from datetime import datetime
-from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+import orjson
 from botocore.exceptions import ClientError
 
 from src.infrastructure.projections.staging_manager import StagingManager
@@ -26,6 +27,8 @@ class ProjectionMerger:
         aws_region: str = "us-east-1",
         compression: str = "snappy",
         merge_workers: int = 1,
+        executor: Optional[Executor] = None,
+        staging_manager: Optional[StagingManager] = None,
     ):
         """Initialize ProjectionMerger.
 
@@ -35,11 +38,17 @@ class ProjectionMerger:
             aws_region: AWS region (default: us-east-1).
             compression: Compression codec (default: "snappy").
             merge_workers: Number of parallel workers for merging partitions (default: 1, sequential).
+            executor: Shared executor to run merges on instead of a private pool of
+                merge_workers threads (optional). It is not shut down by this class.
+            staging_manager: Staging manager used to list staging partitions (optional).
+                A sequential one sharing the S3 client is created per merge if omitted.
         """
         self._bucket = bucket
         self._s3_client = create_s3_client(aws_region=aws_region, s3_client=s3_client)
         self._compression = compression
         self._merge_workers = merge_workers
+        self._executor = executor
+        self._staging_manager = staging_manager
 
     def merge_partition(self, dataset_id: str, partition_path: str) -> None:
         """Merge a single partition from staging with projections.
@@ -53,19 +62,20 @@ class ProjectionMerger:
         staging_key = self._build_staging_file_key(dataset_id, partition_path)
         projections_key = self._build_projections_file_key(dataset_id, partition_path)
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Download files if they exist
-            staging_data = self._download_and_read_json(staging_key, tmpdir)
-            projections_data = self._download_and_read_json(projections_key, tmpdir)
+        projections_data = self._download_and_read_json(projections_key)
+        if projections_data is None:
+            # New partition: the staging file already is the merged result
+            logger.info("New partition %s, no merge needed", partition_path)
+            return
+
+        staging_data = self._download_and_read_json(staging_key)
 
-            # Merge data
-            merged_data = self._merge_json_data(projections_data, staging_data)
+        # Merge data
+        merged_data = self._merge_json_data(projections_data, staging_data)
 
-            # Write merged data back to staging
-            if merged_data:
-                output_file = Path(tmpdir) / "merged.json"
-                self._write_json(merged_data, output_file)
-                self._upload_to_staging(staging_key, output_file)
+        # Write merged data back to staging
+        if merged_data:
+            self._upload_to_staging(staging_key, self._serialize_json(merged_data))
 
         logger.info("Successfully merged partition %s", partition_path)
 
@@ -75,7 +85,9 @@ class ProjectionMerger:
         Args:
             dataset_id: Dataset identifier.
         """
-        staging_manager = StagingManager(bucket=self._bucket, s3_client=self._s3_client)
+        staging_manager = self._staging_manager or StagingManager(
+            bucket=self._bucket, s3_client=self._s3_client
+        )
         partitions = staging_manager.list_staging_partitions(dataset_id)
 
         logger.info("Merging %d partition(s) for dataset %s", len(partitions), dataset_id)
@@ -91,7 +103,12 @@ class ProjectionMerger:
         completed_count = 0
         total_partitions = len(partitions)
 
-        with ThreadPoolExecutor(max_workers=self._merge_workers) as executor:
+        executor_scope = (
+            nullcontext(self._executor)
+            if self._executor is not None
+            else ThreadPoolExecutor(max_workers=self._merge_workers)
+        )
+        with executor_scope as executor:
             future_to_partition = {
                 executor.submit(self.merge_partition, dataset_id, partition_path): partition_path
                 for partition_path in partitions
@@ -105,6 +122,7 @@ class ProjectionMerger:
                     future.result()
                 except Exception as e:
                     logger.error("Failed to merge partition %s: %s", partition_path, e)
+                    wait(future_to_partition)
                     raise
 
     def _build_staging_file_key(self, dataset_id: str, partition_path: str) -> str:
@@ -131,46 +149,68 @@ class ProjectionMerger:
         """
         return f"datasets/{dataset_id}/projections/{partition_path}/data.json"
 
-    def _download_and_read_json(self, s3_key: str, tmpdir: str) -> Optional[List[Dict[str, Any]]]:
-        """Download JSON file from S3 and read it.
+    def _download_and_read_json(self, s3_key: str) -> Optional[List[Dict[str, Any]]]:
+        """Download JSON file from S3 into memory and parse it.
 
         Args:
             s3_key: S3 object key.
-            tmpdir: Temporary directory path.
 
         Returns:
             List of data dictionaries, or None if file doesn't exist.
         """
-        if not self._s3_object_exists(s3_key):
-            return None
+        try:
+            response = self._s3_client.get_object(Bucket=self._bucket, Key=s3_key)
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("404", "NoSuchKey"):
+                return None
+            raise
 
-        local_file = Path(tmpdir) / Path(s3_key).name
-        self._s3_client.download_file(self._bucket, s3_key, str(local_file))
+        with response["Body"] as body:
+            content = body.read()
 
-        with open(local_file, encoding="utf-8") as f:
-            data = json.load(f)
-            # Handle both list and dict formats
-            if isinstance(data, dict):
-                # If it's a dict, assume it has a 'data' key or convert to list
-                return data.get("data", [data])
-            return data if isinstance(data, list) else []
+        try:
+            data = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            data = self._read_legacy_json(content, s3_key)
+
+        # Handle both list and dict formats
+        if isinstance(data, dict):
+            # If it's a dict, assume it has a 'data' key or convert to list
+            return data.get("data", [data])
+        return data if isinstance(data, list) else []
+
+    def _read_legacy_json(self, content: bytes, s3_key: str) -> Any:
+        """Parse a document with NaN/Infinity literals, dropping the rows that hold them.
 
-    def _s3_object_exists(self, s3_key: str) -> bool:
-        """Check if S3 object exists.
+        Files written with the standard json module before the switch to orjson may
+        contain these non-standard literals, which orjson rejects. Their rows carry no
+        usable value, and orjson would write them back as null, so they are dropped.
 
         Args:
-            s3_key: S3 object key.
+            content: JSON document bytes.
+            s3_key: S3 object key, for logging.
 
         Returns:
-            True if object exists, False otherwise.
+            Parsed JSON data.
         """
-        try:
-            self._s3_client.head_object(Bucket=self._bucket, Key=s3_key)
-            return True
-        except ClientError as e:
-            if e.response["Error"]["Code"] in ("404", "NoSuchKey"):
-                return False
-            raise
+        data = json.loads(content)
+        if not isinstance(data, list):
+            return data
+
+        finite_data = [
+            item
+            for item in data
+            if not isinstance(item, dict)
+            or not isinstance(item.get("value"), float)
+            or math.isfinite(item["value"])
+        ]
+        if len(finite_data) != len(data):
+            logger.warning(
+                "Dropped %d row(s) with non-finite values from %s",
+                len(data) - len(finite_data),
+                s3_key,
+            )
+        return finite_data
 
     def _merge_json_data(
         self, projections_data: Optional[List[Dict[str, Any]]], staging_data: Optional[List[Dict[str, Any]]]
@@ -198,63 +238,45 @@ class ProjectionMerger:
 
         # Remove duplicates based on (obs_time, internal_series_code)
         # Keep first occurrence (projections data takes precedence since it comes first)
-        seen = set()
-        merged = []
+        merged: Dict[Tuple[Optional[str], Optional[str]], Dict[str, Any]] = {}
         for item in combined:
             obs_time = item.get("obs_time")
             internal_series_code = item.get("internal_series_code")
-            
-            # Convert obs_time to string for comparison if it's a datetime
-            if isinstance(obs_time, datetime):
-                obs_time_key = obs_time.isoformat()
-            else:
-                obs_time_key = str(obs_time) if obs_time else None
-            
-            key = (obs_time_key, str(internal_series_code) if internal_series_code else None)
-            if key not in seen:
-                seen.add(key)
-                merged.append(item)
-
-        return merged
-
-    def _write_json(self, data: List[Dict[str, Any]], output_file: Path) -> None:
-        """Write data to JSON file.
 
-        Args:
-            data: List of data dictionaries to write.
-            output_file: Output file path.
-        """
-        # Convert datetime objects to ISO format strings for JSON serialization
-        json_data = self._serialize_datetimes(data)
-        
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(json_data, f, indent=2, ensure_ascii=False)
+            # Values read back from JSON are already strings; only other types need
+            # converting (datetimes to ISO format so they match their serialized form)
+            if obs_time.__class__ is not str:
+                if isinstance(obs_time, datetime):
+                    obs_time = obs_time.isoformat()
+                else:
+                    obs_time = str(obs_time) if obs_time else None
+            if internal_series_code.__class__ is not str:
+                internal_series_code = str(internal_series_code) if internal_series_code else None
+
+            merged.setdefault((obs_time or None, internal_series_code or None), item)
+
+        return list(merged.values())
 
-    def _serialize_datetimes(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Serialize datetime objects to ISO format strings for JSON.
+    def _serialize_json(self, data: List[Dict[str, Any]]) -> bytes:
+        """Serialize data to a UTF-8 encoded JSON document.
+
+        orjson writes datetime values in ISO 8601 format, matching datetime.isoformat().
 
         Args:
-            data: List of data dictionaries.
+            data: List of data dictionaries to serialize.
 
         Returns:
-            List with datetime objects converted to ISO strings.
+            JSON document bytes.
         """
-        serialized = []
-        for item in data:
-            serialized_item = {}
-            for key, value in item.items():
-                if isinstance(value, datetime):
-                    serialized_item[key] = value.isoformat()
-                else:
-                    serialized_item[key] = value
-            serialized.append(serialized_item)
-        return serialized
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
 
-    def _upload_to_staging(self, s3_key: str, local_file: Path) -> None:
-        """Upload file to staging in S3.
+    def _upload_to_staging(self, s3_key: str, content: bytes) -> None:
+        """Upload a JSON document to staging in S3.
 
         Args:
             s3_key: S3 destination key.
-            local_file: Local file path.
+            content: UTF-8 encoded JSON document.
         """
-        self._s3_client.upload_file(str(local_file), self._bucket, s3_key)
+        self._s3_client.put_object(
+            Bucket=self._bucket, Key=s3_key, Body=content, ContentType="application/json"
+        )
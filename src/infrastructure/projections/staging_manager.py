@@ -1,8 +1,9 @@
 """Staging manager for projection operations."""
 
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Any, List, Set
+from concurrent.futures import Executor, ThreadPoolExecutor, as_completed, wait
+from contextlib import nullcontext
+from typing import Any, ContextManager, List, Optional, Set
 
 from botocore.exceptions import ClientError
 
@@ -10,6 +11,9 @@ from src.infrastructure.utils.aws_utils import create_s3_client
 
 logger = logging.getLogger(__name__)
 
+# S3 DeleteObjects accepts at most 1000 keys per request
+_DELETE_BATCH_SIZE = 1000
+
 
 class StagingManager:
     """Manages the staging area for projection operations."""
@@ -20,6 +24,7 @@ class StagingManager:
         s3_client: Any = None,
         aws_region: str = "us-east-1",
         copy_workers: int = 1,
+        executor: Optional[Executor] = None,
     ):
         """Initialize StagingManager.
 
@@ -28,10 +33,13 @@ class StagingManager:
             s3_client: Boto3 S3 client (optional, for testing).
             aws_region: AWS region (default: us-east-1).
             copy_workers: Number of parallel workers for copying files (default: 1, sequential).
+            executor: Shared executor to run copies on instead of a private pool of
+                copy_workers threads (optional). It is not shut down by this class.
         """
         self._bucket = bucket
         self._s3_client = create_s3_client(aws_region=aws_region, s3_client=s3_client)
         self._copy_workers = copy_workers
+        self._executor = executor
 
     def copy_from_version(
         self, version_id: str, dataset_id: str, json_files: List[str]
@@ -88,7 +96,7 @@ class StagingManager:
             self._copy_s3_object(source_key, dest_key)
             return dest_key
 
-        with ThreadPoolExecutor(max_workers=self._copy_workers) as executor:
+        with self._executor_scope() as executor:
             future_to_file = {
                 executor.submit(copy_single_file, json_file): json_file
                 for json_file in json_files
@@ -103,6 +111,7 @@ class StagingManager:
                 except Exception as e:
                     json_file = future_to_file[future]
                     logger.error("Failed to copy file %s: %s", json_file, e)
+                    wait(future_to_file)
                     raise
 
         return staging_paths
@@ -143,7 +152,7 @@ class StagingManager:
         logger.debug("Listing staging partitions for dataset %s", dataset_id)
 
         staging_prefix = self._build_staging_prefix(dataset_id)
-        s3_keys = self._list_s3_keys(staging_prefix)
+        s3_keys = self._list_staging_keys(staging_prefix)
 
         if not s3_keys:
             logger.debug("No files found in staging for dataset %s", dataset_id)
@@ -162,7 +171,7 @@ class StagingManager:
         logger.info("Clearing staging area for dataset %s", dataset_id)
 
         staging_prefix = self._build_staging_prefix(dataset_id)
-        s3_keys = self._list_s3_keys(staging_prefix)
+        s3_keys = self._list_staging_keys(staging_prefix)
 
         if not s3_keys:
             logger.info("Staging area is already empty for dataset %s", dataset_id)
@@ -173,17 +182,73 @@ class StagingManager:
         logger.info("Cleared %d file(s) from staging", len(s3_keys))
 
     def _delete_all_objects(self, s3_keys: List[str]) -> None:
-        """Delete all S3 objects.
+        """Delete all S3 objects in batches of up to 1000 keys per request.
+
+        Batches run on the executor when there is more than one of them.
 
         Args:
             s3_keys: List of S3 object keys to delete.
+
+        Raises:
+            RuntimeError: If S3 reports that any key could not be deleted.
         """
         total_files = len(s3_keys)
-        for idx, key in enumerate(s3_keys, start=1):
-            if idx % 100 == 0 or idx == total_files:
-                logger.info("Deleting progress: %d/%d files (%.1f%%)", idx, total_files, (idx / total_files) * 100)
-            logger.debug("Deleting: %s", key)
-            self._delete_s3_object(key)
+        batches = [
+            s3_keys[start : start + _DELETE_BATCH_SIZE]
+            for start in range(0, total_files, _DELETE_BATCH_SIZE)
+        ]
+        if len(batches) == 1:
+            failed_keys = self._delete_batch(batches[0])
+        else:
+            failed_keys = []
+            deleted = 0
+            with self._executor_scope() as executor:
+                future_to_batch = {
+                    executor.submit(self._delete_batch, batch): batch for batch in batches
+                }
+                for future in as_completed(future_to_batch):
+                    try:
+                        failed_keys.extend(future.result())
+                    except Exception:
+                        wait(future_to_batch)
+                        raise
+                    deleted += len(future_to_batch[future])
+                    logger.info(
+                        "Deleting progress: %d/%d files (%.1f%%)",
+                        deleted,
+                        total_files,
+                        (deleted / total_files) * 100,
+                    )
+
+        if failed_keys:
+            raise RuntimeError(f"Failed to delete {len(failed_keys)} file(s) from staging")
+
+    def _delete_batch(self, keys: List[str]) -> List[str]:
+        """Delete up to 1000 S3 objects in one request.
+
+        Args:
+            keys: S3 object keys to delete.
+
+        Returns:
+            Keys that S3 reported as not deleted.
+        """
+        logger.debug("Deleting %d file(s)", len(keys))
+        response = self._s3_client.delete_objects(
+            Bucket=self._bucket,
+            Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True},
+        )
+
+        failed_keys = []
+        for error in response.get("Errors", ()):
+            logger.error("Failed to delete file %s: %s", error.get("Key"), error.get("Message"))
+            failed_keys.append(error.get("Key"))
+        return failed_keys
+
+    def _executor_scope(self) -> ContextManager[Executor]:
+        """Get the shared executor, or a private pool that is shut down on exit."""
+        if self._executor is not None:
+            return nullcontext(self._executor)
+        return ThreadPoolExecutor(max_workers=self._copy_workers)
 
     def _build_version_file_path(self, dataset_id: str, version_id: str, json_file: str) -> str:
         """Build S3 key path for a file in a version.
@@ -234,6 +299,19 @@ class StagingManager:
             Key=dest_key,
         )
 
+    def _list_staging_keys(self, staging_prefix: str) -> List[str]:
+        """List all keys in staging, fanning out per sub-prefix when running in parallel.
+
+        Args:
+            staging_prefix: S3 prefix of the staging area.
+
+        Returns:
+            List of S3 object keys.
+        """
+        if self._copy_workers > 1:
+            return self._list_s3_keys_parallel(staging_prefix)
+        return self._list_s3_keys(staging_prefix)
+
     def _list_s3_keys(self, prefix: str) -> List[str]:
         """List all S3 object keys with the given prefix, handling pagination.
 
@@ -243,35 +321,62 @@ class StagingManager:
         Returns:
             List of S3 object keys.
         """
-        all_keys = []
-        continuation_token = None
+        all_keys: List[str] = []
+        paginator = self._s3_client.get_paginator("list_objects_v2")
 
         try:
-            while True:
-                params = {"Bucket": self._bucket, "Prefix": prefix}
-                if continuation_token:
-                    params["ContinuationToken"] = continuation_token
+            for page in paginator.paginate(
+                Bucket=self._bucket, Prefix=prefix, PaginationConfig={"PageSize": 1000}
+            ):
+                all_keys.extend(self._extract_keys_from_response(page))
 
-                response = self._s3_client.list_objects_v2(**params)
-                keys = self._extract_keys_from_response(response)
-                all_keys.extend(keys)
+            return all_keys
+        except ClientError as e:
+            if self._is_nosuchkey_error(e):
+                return []
+            raise
 
-                if not response.get("IsTruncated", False):
-                    break
+    def _list_s3_keys_parallel(self, prefix: str) -> List[str]:
+        """List all S3 object keys with the given prefix, one listing per sub-prefix.
 
-                continuation_token = response.get("NextContinuationToken")
+        Sub-prefixes (one per series code under staging) are discovered with a
+        delimited listing. Falls back to a single paginated listing when there are
+        fewer than two of them.
 
-            return all_keys
+        Args:
+            prefix: S3 key prefix.
+
+        Returns:
+            List of S3 object keys.
+        """
+        paginator = self._s3_client.get_paginator("list_objects_v2")
+        sub_prefixes: List[str] = []
+        all_keys: List[str] = []
+
+        try:
+            for page in paginator.paginate(Bucket=self._bucket, Prefix=prefix, Delimiter="/"):
+                sub_prefixes.extend(common["Prefix"] for common in page.get("CommonPrefixes", ()))
+                all_keys.extend(self._extract_keys_from_response(page))
         except ClientError as e:
             if self._is_nosuchkey_error(e):
                 return []
             raise
 
+        if len(sub_prefixes) < 2:
+            return self._list_s3_keys(prefix)
+
+        logger.debug("Listing %d staging sub-prefixes in parallel", len(sub_prefixes))
+        with self._executor_scope() as executor:
+            for keys in executor.map(self._list_s3_keys, sub_prefixes):
+                all_keys.extend(keys)
+
+        return all_keys
+
     def _extract_keys_from_response(self, response: dict) -> List[str]:
-        """Extract keys from S3 list_objects_v2 response.
+        """Extract keys from an S3 list_objects_v2 response page.
 
         Args:
-            response: S3 list_objects_v2 response.
+            response: S3 list_objects_v2 response page.
 
         Returns:
             List of S3 object keys.
@@ -306,46 +411,9 @@ class StagingManager:
             Prefix: datasets/test/staging/
             Result: SERIES_1/year=2024/month=01
         """
-        partitions = set()
-        for key in s3_keys:
-            partition_path = self._extract_partition_from_key(key, prefix)
-            if partition_path:
-                partitions.add(partition_path)
+        prefix_len = len(prefix)
+        partitions = {
+            key[prefix_len:].rpartition("/")[0] for key in s3_keys if key.startswith(prefix)
+        }
+        partitions.discard("")
         return partitions
-
-    def _extract_partition_from_key(self, s3_key: str, prefix: str) -> str:
-        """Extract partition path from a single S3 key.
-
-        Args:
-            s3_key: Full S3 key.
-            prefix: Prefix to remove.
-
-        Returns:
-            Partition path (empty string if extraction fails).
-        """
-        if not s3_key.startswith(prefix):
-            return ""
-
-        relative_path = s3_key[len(prefix) :]
-        return self._get_partition_path_from_relative(relative_path)
-
-    def _get_partition_path_from_relative(self, relative_path: str) -> str:
-        """Get partition path from relative file path.
-
-        Args:
-            relative_path: Relative path (e.g., "SERIES_1/year=2024/month=01/data.json").
-
-        Returns:
-            Partition path without filename (e.g., "SERIES_1/year=2024/month=01").
-        """
-        path_parts = relative_path.split("/")
-        partition_parts = path_parts[:-1]  # Remove filename (last part)
-        return "/".join(partition_parts)
-
-    def _delete_s3_object(self, key: str) -> None:
-        """Delete an S3 object.
-
-        Args:
-            key: S3 object key to delete.
-        """
-        self._s3_client.delete_object(Bucket=self._bucket, Key=key)
@@ -1,10 +1,9 @@
 """JSON writer for writing partitioned data."""
 
-import json
-import os
-from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Tuple
+
+import orjson
 
 from src.infrastructure.partitioning.partition_strategy import PartitionStrategy
 
@@ -30,35 +29,42 @@ class JSONWriter:
         Returns:
             List of relative file paths (from base_output_path) of created JSON files.
         """
-        if not data:
-            return []
-
-        # Group data by partition
-        grouped = self._partition_strategy.group_by_partition(data)
-
         file_paths = []
         base_path = Path(base_output_path)
 
-        for partition_path, partition_data in grouped.items():
-            # Create partition directory
-            partition_dir = base_path / partition_path
-            partition_dir.mkdir(parents=True, exist_ok=True)
+        for relative_path, content in self.iter_json_files(data):
+            json_file = base_path / relative_path
+            json_file.parent.mkdir(parents=True, exist_ok=True)
+            json_file.write_bytes(content)
+            file_paths.append(relative_path)
 
-            # Generate unique filename for this partition
-            json_file = self._generate_json_filename(partition_dir)
+        return file_paths
 
-            # Serialize data to JSON
-            json_data = self._serialize_datetimes(partition_data)
+    def iter_json_files(self, data: List[Dict[str, Any]]) -> Iterator[Tuple[str, bytes]]:
+        """Serialize data to JSON documents partitioned by partition strategy, in memory.
 
-            # Write JSON file
-            with open(json_file, "w", encoding="utf-8") as f:
-                json.dump(json_data, f, indent=2, ensure_ascii=False)
+        Documents are produced one partition at a time, so callers can upload each one
+        without writing it to disk first.
 
-            # Return relative path from base_output_path
-            relative_path = os.path.relpath(str(json_file), base_output_path)
-            file_paths.append(relative_path)
+        Args:
+            data: List of data point dictionaries.
 
-        return file_paths
+        Yields:
+            Tuples of (relative file path, UTF-8 encoded JSON document).
+        """
+        if not data:
+            return
+
+        # Group data by partition
+        grouped = self._partition_strategy.group_by_partition(data)
+
+        for partition_path, partition_data in grouped.items():
+            # Generate unique filename for this partition, relative to the output root
+            json_file = self._generate_json_filename(Path(partition_path))
+
+            content = self._serialize_json(partition_data)
+
+            yield json_file.as_posix(), content
 
     def _generate_json_filename(self, partition_dir: Path) -> Path:
         """Generate a unique filename for JSON file in partition.
@@ -73,25 +79,38 @@ class JSONWriter:
         # Future: could split into multiple parts if needed
         return partition_dir / "data.json"
 
-    def _serialize_datetimes(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Serialize datetime objects to ISO format strings for JSON.
+    def _serialize_json(self, data: List[Dict[str, Any]]) -> bytes:
+        """Serialize data to a UTF-8 encoded JSON document.
+
+        orjson writes datetime values in ISO 8601 format, matching datetime.isoformat(),
+        so rows are serialized as they are instead of being copied first. numpy scalars
+        left over from pandas parsing are written as plain numbers.
 
         Args:
-            data: List of data dictionaries.
+            data: List of data dictionaries to serialize.
 
         Returns:
-            List with datetime objects converted to ISO strings.
+            JSON document bytes.
         """
-        serialized = []
-        for item in data:
-            serialized_item = {}
-            for key, value in item.items():
-                if isinstance(value, datetime):
-                    serialized_item[key] = value.isoformat()
-                elif hasattr(value, "isoformat"):  # Handle pandas Timestamp
-                    serialized_item[key] = value.isoformat()
-                else:
-                    serialized_item[key] = value
-            serialized.append(serialized_item)
-        return serialized
+        return orjson.dumps(
+            data,
+            default=_isoformat,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+        )
+
+
+def _isoformat(value: Any) -> str:
+    """Serialize values orjson does not support natively that have an ISO format.
+
+    Args:
+        value: Value to serialize (e.g., a pandas Timestamp subclass orjson rejects).
+
+    Returns:
+        ISO format string.
 
+    Raises:
+        TypeError: If the value has no isoformat method.
+    """
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
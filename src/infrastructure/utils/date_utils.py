@@ -1,7 +1,9 @@
 """Date utility functions."""
 
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Optional
+from zoneinfo import ZoneInfo
 
 
 def to_naive(date: Optional[datetime]) -> Optional[datetime]:
@@ -33,3 +35,20 @@ def get_window_start_date(window_in_days: Optional[int]) -> Optional[datetime]:
     now = datetime.now(timezone.utc)
     return now - timedelta(days=window_in_days)
 
+
+@lru_cache(maxsize=32)
+def get_timezone(name: str) -> ZoneInfo:
+    """Get a timezone by IANA name, cached per name.
+
+    Unlike pytz zones, ZoneInfo can be attached with datetime.replace(tzinfo=...),
+    which is much cheaper than pytz's localize(). Zone data comes from the system
+    tz database or, where there is none (slim and Lambda images), from the tzdata
+    package in requirements.txt.
+
+    Args:
+        name: IANA timezone name (e.g., "America/Argentina/Buenos_Aires").
+
+    Returns:
+        ZoneInfo instance.
+    """
+    return ZoneInfo(name)
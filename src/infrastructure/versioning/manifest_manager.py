@@ -34,6 +34,7 @@ class ManifestManager:
         json_files: List[str],
         partitions: List[str],
         partition_strategy: str,
+        file_checksums: Optional[Dict[str, str]] = None,
     ) -> Dict[str, Any]:
         """Create a manifest from data and metadata.
 
@@ -44,6 +45,8 @@ class ManifestManager:
             json_files: List of relative paths to JSON files.
             partitions: List of partition paths.
             partition_strategy: Partition strategy name used.
+            file_checksums: Optional mapping of relative JSON file paths to the MD5
+                hex digest of their content.
 
         Returns:
             Manifest dictionary.
@@ -52,15 +55,15 @@ class ManifestManager:
 
         # Extract metadata from data
         data_points_count = len(data)
-        series_codes = sorted(
-            {code for dp in data if (code := dp.get("internal_series_code")) is not None}
-        )
+        unique_codes = {dp.get("internal_series_code") for dp in data}
+        unique_codes.discard(None)
+        series_codes = sorted(unique_codes)
 
-        # Find date range
+        # Find date range over distinct observation times (series share the same dates)
         obs_times: List[datetime] = [
             obs_time
-            for dp in data
-            if (obs_time := dp.get("obs_time")) is not None and isinstance(obs_time, DatetimeType)
+            for obs_time in {dp.get("obs_time") for dp in data}
+            if isinstance(obs_time, DatetimeType)
         ]
         min_obs_time = min(obs_times) if obs_times else None
         max_obs_time = max(obs_times) if obs_times else None
@@ -88,6 +91,8 @@ class ManifestManager:
             "partitions": partitions,
             "partition_strategy": partition_strategy,
         }
+        if file_checksums is not None:
+            manifest["file_checksums"] = file_checksums
 
         return manifest
 
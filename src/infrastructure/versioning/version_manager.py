@@ -2,7 +2,7 @@
 
 import logging
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from botocore.exceptions import ClientError
 
@@ -24,6 +24,8 @@ class VersionManager:
         """
         self._bucket = bucket
         self._s3_client = create_s3_client(aws_region=aws_region, s3_client=s3_client)
+        # dataset_id -> (ETag, version_id) of the last current version pointer read
+        self._current_version_cache: Dict[str, Tuple[str, Optional[str]]] = {}
 
     def create_new_version(self) -> str:
         """Create a new version ID (timestamp-based).
@@ -39,6 +41,9 @@ class VersionManager:
     def get_current_version(self, dataset_id: str) -> Optional[str]:
         """Get the current version ID from the index pointer.
 
+        Repeated reads send the pointer's last ETag, so S3 answers with 304 Not Modified
+        and no body while the pointer is unchanged.
+
         Args:
             dataset_id: Dataset identifier.
 
@@ -46,17 +51,30 @@ class VersionManager:
             Current version ID or None if no version exists.
         """
         key = f"datasets/{dataset_id}/index/current_version.txt"
+        cached = self._current_version_cache.get(dataset_id)
+        params = {"Bucket": self._bucket, "Key": key}
+        if cached is not None:
+            params["IfNoneMatch"] = cached[0]
 
         try:
-            response = self._s3_client.get_object(Bucket=self._bucket, Key=key)
-            with response["Body"] as body:
-                version_id = body.read().decode("utf-8").strip()
-                return version_id if version_id else None
+            response = self._s3_client.get_object(**params)
         except ClientError as e:
-            if e.response["Error"]["Code"] == "NoSuchKey":
+            error_code = e.response["Error"]["Code"]
+            if cached is not None and error_code in ("304", "NotModified"):
+                return cached[1]
+            if error_code == "NoSuchKey":
+                self._current_version_cache.pop(dataset_id, None)
                 return None
             raise
 
+        with response["Body"] as body:
+            version_id = body.read().decode("utf-8").strip() or None
+
+        etag = response.get("ETag")
+        if etag:
+            self._current_version_cache[dataset_id] = (etag, version_id)
+        return version_id
+
     def set_current_version(self, dataset_id: str, version_id: str) -> None:
         """Set the current version pointer (atomic operation).
 
@@ -74,6 +92,9 @@ class VersionManager:
     def list_versions(self, dataset_id: str) -> List[str]:
         """List all version IDs for a dataset.
 
+        Versions are read from the directory-like common prefixes under versions/, so
+        only one key per version is returned by S3 instead of every data file.
+
         Args:
             dataset_id: Dataset identifier.
 
@@ -81,21 +102,15 @@ class VersionManager:
             List of version IDs (sorted, most recent first).
         """
         prefix = f"datasets/{dataset_id}/versions/"
+        paginator = self._s3_client.get_paginator("list_objects_v2")
+        versions = []
 
         try:
-            response = self._s3_client.list_objects_v2(Bucket=self._bucket, Prefix=prefix)
-            if "Contents" not in response:
-                return []
-
-            versions = set()
-            for obj in response["Contents"]:
-                key = obj["Key"]
-                # Extract version ID from path like: datasets/{dataset_id}/versions/{version_id}/manifest.json
-                parts = key.split("/")
-                if len(parts) >= 4 and parts[-1] == "manifest.json":
-                    version_id = parts[-2]
+            for page in paginator.paginate(Bucket=self._bucket, Prefix=prefix, Delimiter="/"):
+                for common_prefix in page.get("CommonPrefixes", ()):
+                    version_id = common_prefix["Prefix"][len(prefix) :].rstrip("/")
                     if version_id.startswith("v"):
-                        versions.add(version_id)
+                        versions.append(version_id)
 
             return sorted(versions, reverse=True)
         except ClientError as e:
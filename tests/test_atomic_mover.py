@@ -1,6 +1,6 @@
 """Tests for AtomicProjectionMover."""
 
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 from botocore.exceptions import ClientError
@@ -14,7 +14,9 @@ class TestAtomicProjectionMover:
     @pytest.fixture
     def mock_s3_client(self):
         """Create a mock S3 client."""
-        return Mock()
+        client = Mock()
+        client.delete_objects.return_value = {}
+        return client
 
     @pytest.fixture
     def atomic_mover(self, mock_s3_client):
@@ -28,14 +30,15 @@ class TestAtomicProjectionMover:
         dataset_id = "test_dataset"
 
         # Mock staging files
-        mock_s3_client.list_objects_v2.return_value = {
-            "Contents": [
-                {"Key": f"datasets/{dataset_id}/staging/SERIES_1/year=2024/month=01/data.json"},
-                {"Key": f"datasets/{dataset_id}/staging/SERIES_2/year=2024/month=02/data.json"},
-            ]
-        }
+        mock_s3_client.get_paginator.return_value.paginate.return_value = [
+            {
+                "Contents": [
+                    {"Key": f"datasets/{dataset_id}/staging/SERIES_1/year=2024/month=01/data.json"},
+                    {"Key": f"datasets/{dataset_id}/staging/SERIES_2/year=2024/month=02/data.json"},
+                ]
+            }
+        ]
         mock_s3_client.copy_object = Mock()
-        mock_s3_client.delete_object = Mock()
 
         atomic_mover.move_staging_to_projections(dataset_id)
 
@@ -57,17 +60,22 @@ class TestAtomicProjectionMover:
             {"Key": f"datasets/{dataset_id}/staging/SERIES_1/year=2024/month=01/data.json"},
         ]
 
-        mock_s3_client.list_objects_v2.return_value = {"Contents": staging_files}
+        mock_s3_client.get_paginator.return_value.paginate.return_value = [
+            {"Contents": staging_files}
+        ]
         mock_s3_client.copy_object = Mock()
-        mock_s3_client.delete_object = Mock()
 
         atomic_mover.move_staging_to_projections(dataset_id)
 
         # Verify delete was called for staging file
-        assert mock_s3_client.delete_object.call_count == 1
-        mock_s3_client.delete_object.assert_called_with(
+        mock_s3_client.delete_objects.assert_called_once_with(
             Bucket="test-bucket",
-            Key=f"datasets/{dataset_id}/staging/SERIES_1/year=2024/month=01/data.json",
+            Delete={
+                "Objects": [
+                    {"Key": f"datasets/{dataset_id}/staging/SERIES_1/year=2024/month=01/data.json"}
+                ],
+                "Quiet": True,
+            },
         )
 
     def test_move_staging_to_projections_handles_empty_staging(
@@ -76,15 +84,14 @@ class TestAtomicProjectionMover:
         """Test that move_staging_to_projections handles empty staging gracefully."""
         dataset_id = "test_dataset"
 
-        mock_s3_client.list_objects_v2.return_value = {"Contents": []}
+        mock_s3_client.get_paginator.return_value.paginate.return_value = [{"Contents": []}]
         mock_s3_client.copy_object = Mock()
-        mock_s3_client.delete_object = Mock()
 
         atomic_mover.move_staging_to_projections(dataset_id)
 
         # Verify no copy or delete operations
         mock_s3_client.copy_object.assert_not_called()
-        mock_s3_client.delete_object.assert_not_called()
+        mock_s3_client.delete_objects.assert_not_called()
 
     def test_move_staging_to_projections_rolls_back_on_copy_failure(
         self, atomic_mover, mock_s3_client
@@ -97,7 +104,9 @@ class TestAtomicProjectionMover:
             {"Key": f"datasets/{dataset_id}/staging/SERIES_2/year=2024/month=02/data.json"},
         ]
 
-        mock_s3_client.list_objects_v2.return_value = {"Contents": staging_files}
+        mock_s3_client.get_paginator.return_value.paginate.return_value = [
+            {"Contents": staging_files}
+        ]
 
         # First copy succeeds, second fails
         copy_call_count = 0
@@ -110,17 +119,19 @@ class TestAtomicProjectionMover:
                 raise ClientError(error_response, "CopyObject")
 
         mock_s3_client.copy_object.side_effect = copy_side_effect
-        mock_s3_client.delete_object = Mock()
 
         with pytest.raises(ClientError):
             atomic_mover.move_staging_to_projections(dataset_id)
 
         # Verify rollback: delete was called for the first copied file
-        assert mock_s3_client.delete_object.call_count == 1
+        assert mock_s3_client.delete_objects.call_count == 1
         # Should delete the projection file that was copied before the failure
-        delete_call = mock_s3_client.delete_object.call_args
-        assert "projections" in delete_call[1]["Key"]
-        assert "staging" not in delete_call[1]["Key"]
+        deleted_keys = [
+            obj["Key"] for obj in mock_s3_client.delete_objects.call_args[1]["Delete"]["Objects"]
+        ]
+        assert len(deleted_keys) == 1
+        assert "projections" in deleted_keys[0]
+        assert "staging" not in deleted_keys[0]
 
     def test_move_staging_to_projections_handles_delete_failure_gracefully(
         self, atomic_mover, mock_s3_client
@@ -134,7 +145,9 @@ class TestAtomicProjectionMover:
             {"Key": f"datasets/{dataset_id}/staging/SERIES_1/year=2024/month=01/data.json"},
         ]
 
-        mock_s3_client.list_objects_v2.return_value = {"Contents": staging_files}
+        mock_s3_client.get_paginator.return_value.paginate.return_value = [
+            {"Contents": staging_files}
+        ]
         mock_s3_client.copy_object = Mock()
 
         # Make _delete_files raise an exception to test error handling in _delete_staging_after_successful_copy
@@ -153,7 +166,7 @@ class TestAtomicProjectionMover:
         self, atomic_mover, mock_s3_client
     ):
         """Test that _list_s3_files handles response without Contents key."""
-        mock_s3_client.list_objects_v2.return_value = {}
+        mock_s3_client.get_paginator.return_value.paginate.return_value = [{}]
 
         result = atomic_mover._list_s3_files("datasets/test_dataset/staging/")  # noqa: SLF001
 
@@ -164,7 +177,7 @@ class TestAtomicProjectionMover:
     ):
         """Test that _list_s3_files handles NoSuchKey ClientError."""
         error_response = {"Error": {"Code": "NoSuchKey"}}
-        mock_s3_client.list_objects_v2.side_effect = ClientError(
+        mock_s3_client.get_paginator.return_value.paginate.side_effect = ClientError(
             error_response, "ListObjectsV2"
         )
 
@@ -179,23 +192,163 @@ class TestAtomicProjectionMover:
         ]
 
         error_response = {"Error": {"Code": "AccessDenied"}}
-        mock_s3_client.delete_object.side_effect = ClientError(
-            error_response, "DeleteObject"
+        mock_s3_client.delete_objects.side_effect = ClientError(
+            error_response, "DeleteObjects"
         )
 
         atomic_mover._delete_files(copied_files)  # noqa: SLF001
 
-        assert mock_s3_client.delete_object.called
+        assert mock_s3_client.delete_objects.called
+
+    def test_delete_files_batches_keys_per_request(self, atomic_mover, mock_s3_client):
+        """Test that _delete_files deletes at most 1000 keys per DeleteObjects request."""
+        keys = [f"datasets/test_dataset/staging/SERIES_{i}/data.json" for i in range(2500)]
+
+        atomic_mover._delete_files(keys)  # noqa: SLF001
+
+        batch_sizes = [
+            len(call[1]["Delete"]["Objects"])
+            for call in mock_s3_client.delete_objects.call_args_list
+        ]
+        assert batch_sizes == [1000, 1000, 500]
+
+    def test_delete_files_logs_per_key_errors(self, atomic_mover, mock_s3_client, caplog):
+        """Test that keys reported in the DeleteObjects Errors field are logged."""
+        key = "datasets/test_dataset/staging/SERIES_1/data.json"
+        mock_s3_client.delete_objects.return_value = {
+            "Errors": [{"Key": key, "Code": "AccessDenied", "Message": "Access Denied"}]
+        }
+
+        atomic_mover._delete_files([key])  # noqa: SLF001
+
+        assert f"Failed to delete file {key}: Access Denied" in caplog.text
 
     def test_list_staging_files_raises_other_client_errors(
         self, atomic_mover, mock_s3_client
     ):
         """Test that _list_s3_files raises non-NoSuchKey ClientErrors."""
         error_response = {"Error": {"Code": "AccessDenied"}}
-        mock_s3_client.list_objects_v2.side_effect = ClientError(
+        mock_s3_client.get_paginator.return_value.paginate.side_effect = ClientError(
             error_response, "ListObjectsV2"
         )
 
         with pytest.raises(ClientError):
             atomic_mover._list_s3_files("datasets/test_dataset/staging/")  # noqa: SLF001
 
+    def test_move_staging_to_projections_copies_in_parallel_when_configured(
+        self, mock_s3_client
+    ):
+        """Test that copy_workers > 1 copies every staging file through the thread pool."""
+        dataset_id = "test_dataset"
+        atomic_mover = AtomicProjectionMover(
+            bucket="test-bucket", s3_client=mock_s3_client, copy_workers=4
+        )
+        mock_s3_client.get_paginator.return_value.paginate.return_value = [
+            {
+                "Contents": [
+                    {"Key": f"datasets/{dataset_id}/staging/SERIES_{i}/year=2024/month=01/data.json"}
+                    for i in range(10)
+                ]
+            }
+        ]
+
+        atomic_mover.move_staging_to_projections(dataset_id)
+
+        copied_keys = sorted(
+            call[1]["Key"] for call in mock_s3_client.copy_object.call_args_list
+        )
+        assert copied_keys == sorted(
+            f"datasets/{dataset_id}/projections/SERIES_{i}/year=2024/month=01/data.json"
+            for i in range(10)
+        )
+
+    def test_parallel_copy_failure_rolls_back_only_copied_files(self, mock_s3_client):
+        """Test that a failed parallel copy deletes only the files that were copied."""
+        dataset_id = "test_dataset"
+        atomic_mover = AtomicProjectionMover(
+            bucket="test-bucket", s3_client=mock_s3_client, copy_workers=4
+        )
+        staging_files = [
+            f"datasets/{dataset_id}/staging/SERIES_{i}/year=2024/month=01/data.json"
+            for i in range(10)
+        ]
+        failing_key = f"datasets/{dataset_id}/projections/SERIES_3/year=2024/month=01/data.json"
+
+        def copy_side_effect(**kwargs):
+            if kwargs["Key"] == failing_key:
+                raise ClientError({"Error": {"Code": "AccessDenied"}}, "CopyObject")
+
+        mock_s3_client.copy_object.side_effect = copy_side_effect
+
+        with pytest.raises(ClientError):
+            atomic_mover._copy_all_to_projections(dataset_id, staging_files)  # noqa: SLF001
+
+        copied_keys = {
+            call[1]["Key"] for call in mock_s3_client.copy_object.call_args_list
+        } - {failing_key}
+        deleted_keys = {
+            obj["Key"]
+            for call in mock_s3_client.delete_objects.call_args_list
+            for obj in call[1]["Delete"]["Objects"]
+        }
+        assert deleted_keys == copied_keys
+
+    def test_list_s3_files_collects_keys_from_every_page(self, atomic_mover, mock_s3_client):
+        """Test that _list_s3_files pages through list_objects_v2 with the paginator."""
+        prefix = "datasets/test_dataset/staging/"
+        mock_s3_client.get_paginator.return_value.paginate.return_value = [
+            {"Contents": [{"Key": f"{prefix}a.json"}, {"Key": f"{prefix}b.json"}]},
+            {"Contents": [{"Key": f"{prefix}c.json"}]},
+        ]
+
+        result = atomic_mover._list_s3_files(prefix)  # noqa: SLF001
+
+        assert result == [f"{prefix}a.json", f"{prefix}b.json", f"{prefix}c.json"]
+        mock_s3_client.get_paginator.assert_called_once_with("list_objects_v2")
+        mock_s3_client.get_paginator.return_value.paginate.assert_called_once_with(
+            Bucket="test-bucket", Prefix=prefix, PaginationConfig={"PageSize": 1000}
+        )
+
+    def test_list_s3_files_parallel_lists_each_sub_prefix(self, mock_s3_client):
+        """Test that _list_s3_files_parallel lists every top-level sub-prefix separately."""
+        prefix = "datasets/test_dataset/staging/"
+        atomic_mover = AtomicProjectionMover(
+            bucket="test-bucket", s3_client=mock_s3_client, copy_workers=4
+        )
+
+        def paginate(**kwargs):
+            if kwargs.get("Delimiter") == "/":
+                return [
+                    {
+                        "CommonPrefixes": [
+                            {"Prefix": f"{prefix}SERIES_1/"},
+                            {"Prefix": f"{prefix}SERIES_2/"},
+                        ]
+                    }
+                ]
+            return [{"Contents": [{"Key": f"{kwargs['Prefix']}year=2024/month=01/data.json"}]}]
+
+        mock_s3_client.get_paginator.return_value.paginate.side_effect = paginate
+
+        result = atomic_mover._list_s3_files_parallel(prefix)  # noqa: SLF001
+
+        assert sorted(result) == [
+            f"{prefix}SERIES_1/year=2024/month=01/data.json",
+            f"{prefix}SERIES_2/year=2024/month=01/data.json",
+        ]
+
+    def test_list_s3_files_parallel_falls_back_without_sub_prefixes(self, mock_s3_client):
+        """Test that _list_s3_files_parallel uses a single listing below two sub-prefixes."""
+        prefix = "datasets/test_dataset/staging/"
+        atomic_mover = AtomicProjectionMover(
+            bucket="test-bucket", s3_client=mock_s3_client, copy_workers=4
+        )
+        mock_s3_client.get_paginator.return_value.paginate.return_value = [
+            {"CommonPrefixes": [{"Prefix": f"{prefix}SERIES_1/"}]}
+        ]
+
+        with patch.object(atomic_mover, "_list_s3_files", return_value=["key"]) as mock_list:
+            result = atomic_mover._list_s3_files_parallel(prefix)  # noqa: SLF001
+
+        assert result == ["key"]
+        mock_list.assert_called_once_with(prefix)
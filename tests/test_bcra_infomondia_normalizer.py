@@ -101,6 +101,19 @@ class TestBcraInfomondiaNormalizer:
         assert len(result) == 1
         assert result[0]["value"] == 100.5
 
+    def test_normalize_filters_non_finite_values(self, normalizer, sample_normalizer_config):
+        """Test that NaN and infinite values are filtered instead of being written to JSON."""
+        data = [
+            {"internal_series_code": "TEST_SERIES", "obs_time": datetime(2025, 1, 15), "value": float("nan")},
+            {"internal_series_code": "TEST_SERIES", "obs_time": datetime(2025, 1, 15), "value": "nan"},
+            {"internal_series_code": "TEST_SERIES", "obs_time": datetime(2025, 1, 15), "value": "-inf"},
+            {"internal_series_code": "TEST_SERIES", "obs_time": datetime(2025, 1, 15), "value": 100.5},
+        ]
+        
+        result = normalizer.normalize(data, sample_normalizer_config)
+        assert len(result) == 1
+        assert result[0]["value"] == 100.5
+
     def test_normalize_value_conversion(self, normalizer, sample_normalizer_config):
         """Test value normalization for different types."""
         data = [
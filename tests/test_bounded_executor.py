@@ -0,0 +1,65 @@
+"""Tests for BoundedExecutor."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.infrastructure.projections.bounded_executor import BoundedExecutor
+
+
+class TestBoundedExecutor:
+    """Tests for BoundedExecutor class."""
+
+    @pytest.fixture
+    def shared_executor(self):
+        """Create a shared pool larger than the limits under test."""
+        executor = ThreadPoolExecutor(max_workers=8)
+        yield executor
+        executor.shutdown(wait=True)
+
+    def test_submit_limits_tasks_in_flight(self, shared_executor):
+        """Test that no more than max_in_flight tasks run at once on the shared pool."""
+        bounded = BoundedExecutor(shared_executor, max_in_flight=2)
+        lock = threading.Lock()
+        running = 0
+        peak = 0
+
+        def task():
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.01)
+            with lock:
+                running -= 1
+
+        futures = [bounded.submit(task) for _ in range(10)]
+        for future in futures:
+            future.result()
+
+        assert peak == 2
+
+    def test_map_returns_results_in_order(self, shared_executor):
+        """Test that map works through the bounded submit."""
+        bounded = BoundedExecutor(shared_executor, max_in_flight=1)
+
+        assert list(bounded.map(lambda x: x * 2, [1, 2, 3])) == [2, 4, 6]
+
+    def test_failed_submit_releases_slot(self):
+        """Test that a submit rejected by the shared executor does not leak its slot."""
+        shared_executor = ThreadPoolExecutor(max_workers=1)
+        shared_executor.shutdown()
+        bounded = BoundedExecutor(shared_executor, max_in_flight=1)
+
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                bounded.submit(print)
+
+    def test_shutdown_leaves_shared_executor_running(self, shared_executor):
+        """Test that shutting down the bounded view does not stop the shared pool."""
+        with BoundedExecutor(shared_executor, max_in_flight=1):
+            pass
+
+        assert shared_executor.submit(lambda: 1).result() == 1
@@ -3,8 +3,23 @@
 from unittest.mock import Mock, patch
 
 import pytest
+import requests
 
-from src.cli import _execute_etl_pipeline, _handle_error, run_etl
+from src.cli import (
+    _execute_etl_pipeline,
+    _get_plugin_registry,
+    _handle_error,
+    _parse_args,
+    run_etl,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_plugin_registry_cache():
+    """Make each test see a freshly created (or patched) plugin registry."""
+    _get_plugin_registry.cache_clear()
+    yield
+    _get_plugin_registry.cache_clear()
 
 
 class TestExecuteETLPipeline:
@@ -43,6 +58,24 @@ class TestExecuteETLPipeline:
         mock_config_loader.load_dataset_config.assert_called_once_with("test_dataset")
         mock_etl_instance.execute.assert_called_once()
 
+    @patch("src.cli.create_plugin_registry")
+    @patch("src.cli.YamlConfigLoader")
+    @patch("src.cli.ETLUseCase")
+    def test_execute_etl_pipeline_creates_registry_once(
+        self, mock_etl_class, mock_config_loader_class, mock_registry
+    ):
+        """Test that repeated pipeline runs reuse the same plugin registry."""
+        mock_config_loader_class.return_value.load_dataset_config.return_value = {
+            "dataset_id": "test_dataset",
+            "source": {"kind": "http", "url": "https://example.com"},
+        }
+        mock_etl_class.return_value.execute.return_value = []
+
+        _execute_etl_pipeline("test_dataset")
+        _execute_etl_pipeline("test_dataset")
+
+        mock_registry.assert_called_once_with()
+
     @patch("src.cli.create_plugin_registry")
     @patch("src.cli.YamlConfigLoader")
     def test_execute_etl_pipeline_file_not_found(self, mock_config_loader_class, mock_registry):
@@ -54,6 +87,18 @@ class TestExecuteETLPipeline:
         with pytest.raises(FileNotFoundError):
             _execute_etl_pipeline("nonexistent")
 
+    @patch("src.cli.build_etl_use_case")
+    def test_execute_etl_pipeline_closes_pipeline_after_failure(self, mock_build):
+        """Test that a one-shot run releases the pipeline's worker pool even on errors."""
+        mock_etl = Mock()
+        mock_etl.execute.side_effect = RuntimeError("boom")
+        mock_build.return_value = (mock_etl, {"dataset_id": "test_dataset"})
+
+        with pytest.raises(RuntimeError):
+            _execute_etl_pipeline("test_dataset")
+
+        mock_etl.close.assert_called_once_with()
+
 
 class TestHandleError:
     """Tests for _handle_error function."""
@@ -86,6 +131,14 @@ class TestHandleError:
         
         assert result == 130
 
+    def test_handle_error_matching_several_types_uses_first_handler(self, capsys):
+        """Test that errors matching several handlers keep the declared precedence."""
+        error = requests.exceptions.InvalidURL("bad url")
+        result = _handle_error(error)
+
+        assert result == 1
+        assert "Configuration error: bad url" in capsys.readouterr().err
+
     def test_handle_unexpected_error(self):
         """Test handling unexpected error type."""
         error = AttributeError("Unexpected error")
@@ -131,3 +184,36 @@ class TestRunETL:
         assert result == 130
         mock_handle.assert_called_once()
 
+    @patch("src.cli.build_etl_use_case")
+    def test_run_etl_reuses_cached_pipeline(self, mock_build):
+        """Test that a provided pipeline cache builds the pipeline only once."""
+        mock_etl = Mock()
+        mock_etl.execute.return_value = [{"data": "test"}]
+        mock_build.return_value = (mock_etl, {"dataset_id": "test_dataset"})
+        pipelines = {}
+
+        assert run_etl("test_dataset", pipelines) == 0
+        assert run_etl("test_dataset", pipelines) == 0
+
+        mock_build.assert_called_once_with("test_dataset")
+        assert mock_etl.execute.call_count == 2
+        assert "test_dataset" in pipelines
+        mock_etl.close.assert_not_called()
+
+
+class TestParseArgs:
+    """Tests for _parse_args function."""
+
+    def test_parse_args_single_dataset_id(self):
+        """Test that a lone dataset id is parsed without flags."""
+        assert _parse_args(["test_dataset"]) == ("test_dataset", False)
+
+    def test_parse_args_verbose_flag(self):
+        """Test that the verbose flag is honoured."""
+        assert _parse_args(["test_dataset", "-v"]) == ("test_dataset", True)
+        assert _parse_args(["--verbose", "test_dataset"]) == ("test_dataset", True)
+
+    def test_parse_args_requires_dataset_id(self):
+        """Test that missing dataset id exits with a usage error."""
+        with pytest.raises(SystemExit):
+            _parse_args([])
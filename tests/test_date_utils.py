@@ -4,7 +4,7 @@ from datetime import datetime
 
 import pytz
 
-from src.infrastructure.utils.date_utils import to_naive
+from src.infrastructure.utils.date_utils import get_timezone, to_naive
 
 
 class TestToNaive:
@@ -36,3 +36,18 @@ class TestToNaive:
         assert result.tzinfo is None
         assert result == datetime(2025, 1, 15, 10, 30, 0)
 
+
+class TestGetTimezone:
+    """Tests for get_timezone function."""
+
+    def test_returns_cached_zone(self):
+        """Test that the same zone object is returned for a name."""
+        assert get_timezone("America/Argentina/Buenos_Aires") is get_timezone(
+            "America/Argentina/Buenos_Aires"
+        )
+
+    def test_replace_applies_offset(self):
+        """Test that attaching the zone to a naive datetime yields the local offset."""
+        tz = get_timezone("America/Argentina/Buenos_Aires")
+        result = datetime(2024, 1, 15, 10, 0, 0).replace(tzinfo=tz)
+        assert result.isoformat() == "2024-01-15T10:00:00-03:00"
@@ -41,7 +41,7 @@ class TestETLWithProjectionIntegration:
     def mock_loader(self, mock_s3_client):
         """Create a mock S3VersionedLoader."""
         loader = Mock()
-        loader._s3_client = mock_s3_client
+        loader.s3_client = mock_s3_client
         loader._bucket = "test-bucket"
         loader._dataset_id = "test_dataset"
         return loader
@@ -148,3 +148,23 @@ class TestETLWithProjectionIntegration:
 
         mock_loader.load.assert_called_once()
 
+    def test_etl_reuses_version_manager_across_runs(
+        self, etl_use_case, mock_loader, projection_use_case
+    ):
+        """Test that the VersionManager is created once and reused across executions."""
+        config = {
+            "dataset_id": "test_dataset",
+            "load": {"bucket": "test-bucket", "aws_region": "us-east-1"},
+        }
+
+        with patch(
+            "src.application.etl_use_case.VersionManager"
+        ) as mock_version_manager_class, patch.object(projection_use_case, "execute_projection"):
+            mock_version_manager_class.return_value.get_current_version.return_value = "v1"
+
+            etl_use_case.execute(config)
+            etl_use_case.execute(config)
+
+            mock_version_manager_class.assert_called_once_with(
+                bucket="test-bucket", s3_client=mock_loader.s3_client, aws_region="us-east-1"
+            )
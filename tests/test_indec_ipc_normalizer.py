@@ -0,0 +1,51 @@
+"""Tests for INDEC IPC normalizer."""
+
+from datetime import datetime
+
+import pytest
+
+from src.infrastructure.plugins.normalizers.indec_ipc_normalizer import IndecIpcNormalizer
+
+
+class TestIndecIpcNormalizer:
+    """Tests for IndecIpcNormalizer class."""
+
+    @pytest.fixture
+    def normalizer(self):
+        """Create a normalizer instance."""
+        return IndecIpcNormalizer()
+
+    @pytest.fixture
+    def config(self):
+        """Normalization configuration for Buenos Aires dates."""
+        return {"normalize": {"timezone": "America/Argentina/Buenos_Aires"}}
+
+    def test_normalize_parses_decimal_comma_values(self, normalizer, config):
+        """Test that string values with a decimal comma are converted to float."""
+        data = [
+            {
+                "internal_series_code": "IPC_NIVEL_GENERAL",
+                "obs_time": datetime(2025, 1, 1),
+                "value": "1 234,5",
+            }
+        ]
+
+        result = normalizer.normalize(data, config)
+
+        assert result[0]["value"] == 1234.5
+        assert result[0]["obs_time"].tzinfo is not None
+
+    def test_normalize_filters_non_finite_values(self, normalizer, config):
+        """Test that NaN and infinite values are filtered instead of being written to JSON."""
+        data = [
+            {
+                "internal_series_code": "IPC_NIVEL_GENERAL",
+                "obs_time": datetime(2025, 1, 1),
+                "value": value,
+            }
+            for value in (float("nan"), "nan", "inf", float("-inf"), 101.5)
+        ]
+
+        result = normalizer.normalize(data, config)
+
+        assert [item["value"] for item in result] == [101.5]
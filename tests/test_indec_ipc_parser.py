@@ -0,0 +1,85 @@
+"""Tests for INDEC IPC parser."""
+
+import io
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import openpyxl
+import pandas as pd
+import pytest
+
+from src.infrastructure.plugins.parsers.indec_ipc_parser import IndecIpcParser
+
+
+class TestIndecIpcParser:
+    """Tests for IndecIpcParser class."""
+
+    @pytest.fixture
+    def parser(self):
+        """Create a parser instance."""
+        return IndecIpcParser()
+
+    @pytest.fixture
+    def workbook_bytes(self):
+        """Create an Excel file with dates in row 2 and two value rows below."""
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.title = "IPC"
+        for offset in range(3):
+            sheet.cell(row=2, column=2 + offset, value=datetime(2024, offset + 1, 1))
+            sheet.cell(row=3, column=2 + offset, value=f"{offset},5")
+            sheet.cell(row=4, column=2 + offset, value=offset * 10)
+        output = io.BytesIO()
+        workbook.save(output)
+        return output.getvalue()
+
+    @pytest.fixture
+    def config(self):
+        """Create a config with two series on the same sheet."""
+        series = {"sheet": "IPC", "fecha_row": 2, "fecha_start_col": "B", "valor_start_col": "B"}
+        return {
+            "parse_config": {
+                "series_map": [
+                    {**series, "internal_series_code": "IPC_A", "valor_row": 3},
+                    {**series, "internal_series_code": "IPC_B", "valor_row": 4},
+                ]
+            }
+        }
+
+    def test_parse_extracts_each_series(self, parser, workbook_bytes, config):
+        """Test that every configured series is read from its row."""
+        result = parser.parse(workbook_bytes, config, {"IPC_A": datetime(2024, 1, 1)})
+
+        assert [(r["internal_series_code"], r["obs_time"], r["value"]) for r in result] == [
+            ("IPC_A", datetime(2024, 2, 1), 1.5),
+            ("IPC_A", datetime(2024, 3, 1), 2.5),
+            ("IPC_B", datetime(2024, 1, 1), 0.0),
+            ("IPC_B", datetime(2024, 2, 1), 10.0),
+            ("IPC_B", datetime(2024, 3, 1), 20.0),
+        ]
+
+    def test_parse_reads_shared_sheet_once(self, parser, workbook_bytes, config):
+        """Test that series on the same sheet reuse one parsed DataFrame."""
+        with patch.object(pd.ExcelFile, "parse", autospec=True, side_effect=pd.ExcelFile.parse) as mock_parse:
+            parser.parse(workbook_bytes, config)
+
+        mock_parse.assert_called_once()
+
+    def test_parse_falls_back_to_openpyxl_per_sheet(self, parser, workbook_bytes, config):
+        """Test that a sheet xlrd opens but fails to read is read with openpyxl instead."""
+        excel_file_class = pd.ExcelFile
+        xlrd_workbook = MagicMock()
+        xlrd_workbook.__enter__.return_value = xlrd_workbook
+        xlrd_workbook.parse.side_effect = ValueError("Unsupported cell format")
+
+        def open_workbook(buffer, engine):
+            if engine == "xlrd":
+                return xlrd_workbook
+            return excel_file_class(buffer, engine=engine)
+
+        with patch.object(pd, "ExcelFile", side_effect=open_workbook):
+            result = parser.parse(workbook_bytes, config)
+
+        assert len(result) == 6
+        xlrd_workbook.parse.assert_called_once()
+        xlrd_workbook.__exit__.assert_called_once()
@@ -0,0 +1,80 @@
+"""Tests for INDEC IPC transformer."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from src.infrastructure.plugins.transformers.indec_ipc_transformer import IndecIpcTransformer
+from tests.builders import ConfigBuilder, DataPointListBuilder
+
+
+class TestIndecIpcTransformer:
+    """Tests for IndecIpcTransformer class."""
+
+    @pytest.fixture
+    def transformer(self):
+        """Create a transformer instance."""
+        return IndecIpcTransformer()
+
+    @pytest.fixture
+    def sample_transformer_config(self):
+        """Sample transformer configuration with series map."""
+        return (
+            ConfigBuilder()
+            .with_series("IPC_NIVEL_GENERAL", unit="index", frequency="M")
+            .with_series("IPC_ALIMENTOS", unit="index", frequency="M")
+            .build()
+        )
+
+    def test_transform_empty_data(self, transformer, sample_transformer_config):
+        """Test transforming empty data."""
+        assert transformer.transform([], sample_transformer_config) == []
+
+    def test_transform_adds_unit_and_frequency_from_config(
+        self, transformer, sample_transformer_config
+    ):
+        """Test that unit and frequency come from config, not from input data."""
+        data = (
+            DataPointListBuilder()
+            .add(
+                "IPC_NIVEL_GENERAL",
+                datetime(2025, 1, 1, tzinfo=UTC),
+                100.5,
+                unit="wrong_unit",
+                frequency="wrong_frequency",
+            )
+            .build()
+        )
+
+        result = transformer.transform(data, sample_transformer_config)
+
+        assert len(result) == 1
+        assert result[0]["internal_series_code"] == "IPC_NIVEL_GENERAL"
+        assert result[0]["value"] == 100.5
+        assert result[0]["unit"] == "index"
+        assert result[0]["frequency"] == "M"
+        assert isinstance(result[0]["collection_date"], datetime)
+
+    def test_transform_series_not_in_config_has_no_metadata(
+        self, transformer, sample_transformer_config
+    ):
+        """Test that series missing from the series map get None unit and frequency."""
+        data = DataPointListBuilder().add("UNKNOWN", datetime(2025, 1, 1, tzinfo=UTC), 1.0).build()
+
+        result = transformer.transform(data, sample_transformer_config)
+
+        assert result[0]["unit"] is None
+        assert result[0]["frequency"] is None
+
+    def test_transform_uses_one_collection_date(self, transformer, sample_transformer_config):
+        """Test that every data point shares the same collection date."""
+        data = (
+            DataPointListBuilder()
+            .add("IPC_NIVEL_GENERAL", datetime(2025, 1, 1, tzinfo=UTC), 100.5)
+            .add("IPC_ALIMENTOS", datetime(2025, 1, 1, tzinfo=UTC), 101.5)
+            .build()
+        )
+
+        result = transformer.transform(data, sample_transformer_config)
+
+        assert result[0]["collection_date"] is result[1]["collection_date"]
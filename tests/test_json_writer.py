@@ -0,0 +1,75 @@
+"""Tests for JSONWriter."""
+
+import json
+from datetime import UTC, datetime
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from src.infrastructure.storage.json.json_writer import JSONWriter
+
+
+class TestJSONWriter:
+    """Tests for JSONWriter class."""
+
+    @pytest.fixture
+    def partition_strategy(self):
+        """Create a mock partition strategy."""
+        return Mock()
+
+    @pytest.fixture
+    def writer(self, partition_strategy):
+        """Create JSONWriter instance."""
+        return JSONWriter(partition_strategy)
+
+    def test_iter_json_files_yields_one_document_per_partition(self, writer, partition_strategy):
+        """Test that each partition is serialized to its own data.json document."""
+        partition_strategy.group_by_partition.return_value = {
+            "SERIES_1/year=2024/month=01": [{"value": 1.0}],
+            "SERIES_2/year=2024/month=01": [{"value": 2.0}],
+        }
+
+        result = list(writer.iter_json_files([{"value": 1.0}, {"value": 2.0}]))
+
+        assert [path for path, _ in result] == [
+            "SERIES_1/year=2024/month=01/data.json",
+            "SERIES_2/year=2024/month=01/data.json",
+        ]
+        assert json.loads(result[0][1]) == [{"value": 1.0}]
+
+    def test_iter_json_files_serializes_datetimes_as_isoformat(self, writer, partition_strategy):
+        """Test that datetime values are written as ISO 8601 strings and text is UTF-8."""
+        obs_time = datetime(2024, 1, 15, 12, 0, 0)
+        collection_date = datetime(2024, 1, 16, 9, 30, 0, tzinfo=UTC)
+        partition_strategy.group_by_partition.return_value = {
+            "SERIES_1/year=2024/month=01": [
+                {"obs_time": obs_time, "collection_date": collection_date, "unit": "índice"}
+            ]
+        }
+
+        [(_, content)] = writer.iter_json_files([{}])
+
+        assert json.loads(content) == [
+            {
+                "obs_time": obs_time.isoformat(),
+                "collection_date": collection_date.isoformat(),
+                "unit": "índice",
+            }
+        ]
+        assert "índice".encode() in content
+
+    def test_iter_json_files_serializes_numpy_scalars(self, writer, partition_strategy):
+        """Test that numpy values coming from pandas are written as plain numbers."""
+        partition_strategy.group_by_partition.return_value = {
+            "SERIES_1/year=2024/month=01": [{"value": np.float64(1.5), "count": np.int64(3)}]
+        }
+
+        [(_, content)] = writer.iter_json_files([{}])
+
+        assert json.loads(content) == [{"value": 1.5, "count": 3}]
+
+    def test_iter_json_files_handles_empty_data(self, writer, partition_strategy):
+        """Test that empty data produces no documents."""
+        assert list(writer.iter_json_files([])) == []
+        partition_strategy.group_by_partition.assert_not_called()
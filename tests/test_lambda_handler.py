@@ -0,0 +1,74 @@
+"""Tests for the Lambda handler."""
+
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+import pytest
+
+import lambda_handler
+from src.infrastructure.plugins.extractors.indec_ipc_http_extractor import IndecIpcHttpExtractor
+
+_EXTRACTOR_MODULE = "src.infrastructure.plugins.extractors.indec_ipc_http_extractor"
+
+
+@pytest.fixture(autouse=True)
+def clear_etl_pipelines():
+    """Make each test start from a cold container."""
+    with patch.dict(lambda_handler._ETL_PIPELINES, clear=True):
+        yield
+
+
+class TestLambdaHandler:
+    """Tests for lambda_handler function."""
+
+    @patch(f"{_EXTRACTOR_MODULE}.datetime")
+    @patch(f"{_EXTRACTOR_MODULE}._get_session")
+    @patch("src.cli.build_etl_use_case")
+    def test_warm_invocation_downloads_file_for_current_month(
+        self, mock_build, mock_get_session, mock_datetime
+    ):
+        """Test that a cached pipeline follows the clock across a month boundary."""
+        extractor = IndecIpcHttpExtractor(
+            {"url_template": "https://example.com/sh_ipc_{MM}_{YY}.xls"}
+        )
+        mock_etl = Mock()
+        mock_etl.execute.side_effect = lambda config: [extractor.extract()]
+        mock_build.return_value = (mock_etl, {})
+        mock_datetime.now.side_effect = [
+            datetime(2025, 1, 31, 23, 59),
+            datetime(2025, 2, 1, 0, 1),
+        ]
+        event = {"dataset_id": "indec_ipc"}
+
+        first = lambda_handler.lambda_handler(event, None)
+        second = lambda_handler.lambda_handler(event, None)
+
+        assert first["statusCode"] == 200
+        assert second["statusCode"] == 200
+        mock_build.assert_called_once_with("indec_ipc")
+        requested_urls = [
+            call.args[0] for call in mock_get_session.return_value.get.call_args_list
+        ]
+        assert requested_urls == [
+            "https://example.com/sh_ipc_01_25.xls",
+            "https://example.com/sh_ipc_02_25.xls",
+        ]
+
+
+class TestExtractDatasetId:
+    """Tests for extract_dataset_id function."""
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            '{"dataset_id": "indec_ipc"}',
+            '"{\\"dataset_id\\": \\"indec_ipc\\"}"',
+            b'"{\\"dataset_id\\": \\"indec_ipc\\"}"',
+            bytearray(b'"{\\"dataset_id\\": \\"indec_ipc\\"}"'),
+        ],
+    )
+    def test_extract_from_sqs_body(self, body):
+        """Test that plain and double-encoded SQS bodies are unwrapped, as text or bytes."""
+        event = {"Records": [{"body": body}]}
+
+        assert lambda_handler.extract_dataset_id(event) == "indec_ipc"
@@ -187,3 +187,22 @@ class TestPartitionStrategy:
         partitions = strategy.get_all_partitions_from_paths([])
 
         assert partitions == set()
+
+    def test_get_all_partitions_from_paths_matches_partition_at_start_of_key(self):
+        """Test that a partition at the start of a key is found without a prefix."""
+        strategy = SeriesYearMonthPartitionStrategy()
+
+        partitions = strategy.get_all_partitions_from_paths(
+            ["SERIES/year=2024/month=03/data.json", "x/prefixSERIES/year=2024/month=04/"]
+        )
+
+        assert partitions == {"SERIES/year=2024/month=03/", "prefixSERIES/year=2024/month=04/"}
+
+    def test_group_by_partition_raises_error_on_invalid_obs_time(self):
+        """Test that group_by_partition validates every data point."""
+        strategy = SeriesYearMonthPartitionStrategy()
+        valid = DataPointBuilder().with_series_code("SERIES_A").with_obs_time(datetime(2024, 1, 15)).build()
+        invalid = dict(valid, obs_time="2024-01-20")
+
+        with pytest.raises(ValueError, match="obs_time must be a datetime object"):
+            strategy.group_by_partition([valid, invalid])
@@ -74,3 +74,7 @@ class TestPartitionStrategyFactory:
         assert hasattr(result, "group_by_partition")
         assert hasattr(result, "parse_partition_path")
         assert hasattr(result, "get_all_partitions_from_paths")
+
+    def test_create_returns_shared_instance(self):
+        """Test that the stateless strategy instance is reused across calls."""
+        assert PartitionStrategyFactory.create({}) is PartitionStrategyFactory.create(None)
@@ -157,3 +157,24 @@ class TestPluginRegistry:
         loader = registry.get_loader("test_loader", config=config)
         assert loader is not None
         mock_loader_class.assert_called_once_with(config=config)
+
+    def test_get_parser_returns_shared_instance(self):
+        """Test that configuration-free plugins are instantiated once and reused."""
+        registry = PluginRegistry()
+        registry.register_parser("bcra_infomondia", BcraInfomondiaParser)
+        registry.register_normalizer("bcra_infomondia", BcraInfomondiaNormalizer)
+
+        assert registry.get_parser("bcra_infomondia") is registry.get_parser("bcra_infomondia")
+        assert registry.get_normalizer("bcra_infomondia") is registry.get_normalizer(
+            "bcra_infomondia"
+        )
+
+    def test_register_by_import_path_resolves_on_get(self):
+        """Test that plugins registered by import path are imported when first requested."""
+        registry = PluginRegistry()
+        registry.register_parser(
+            "bcra_infomondia",
+            "src.infrastructure.plugins.parsers.bcra_infomondia_parser:BcraInfomondiaParser",
+        )
+
+        assert isinstance(registry.get_parser("bcra_infomondia"), BcraInfomondiaParser)
@@ -1,9 +1,10 @@
 """Tests for ProjectionManager."""
 
-from unittest.mock import Mock
+from unittest.mock import ANY, Mock
 
 import pytest
 
+from src.infrastructure.projections.bounded_executor import BoundedExecutor
 from src.infrastructure.projections.projection_manager import ProjectionManager
 
 
@@ -39,6 +40,8 @@ class TestProjectionManager:
         }
 
         with patch.object(
+            projection_manager, "_projection_manifest_manager"
+        ) as mock_projection_manifest_manager, patch.object(
             projection_manager, "_is_version_already_projected"
         ) as mock_is_projected, patch.object(
             projection_manager, "_load_manifest"
@@ -58,12 +61,14 @@ class TestProjectionManager:
 
             projection_manager.project_version(version_id, dataset_id)
 
-            mock_is_projected.assert_called_once_with(version_id, dataset_id)
+            projection_manifest = mock_projection_manifest_manager.load_or_empty.return_value
+            mock_projection_manifest_manager.load_or_empty.assert_called_once_with(dataset_id)
+            mock_is_projected.assert_called_once_with(version_id, projection_manifest)
             mock_load_manifest.assert_called_once_with(version_id, dataset_id)
             mock_copy.assert_called_once_with(version_id, dataset_id, manifest["json_files"])
             mock_merge.assert_called_once_with(dataset_id)
             mock_move.assert_called_once_with(dataset_id)
-            mock_record.assert_called_once_with(version_id, dataset_id)
+            mock_record.assert_called_once_with(version_id, dataset_id, projection_manifest)
             mock_cleanup.assert_called_once_with(dataset_id)
 
     def test_project_version_raises_if_manifest_not_found(
@@ -76,6 +81,8 @@ class TestProjectionManager:
         dataset_id = "test_dataset"
 
         with patch.object(
+            projection_manager, "_projection_manifest_manager"
+        ) as mock_projection_manifest_manager, patch.object(
             projection_manager, "_is_version_already_projected"
         ) as mock_is_projected, patch.object(
             projection_manager, "_load_manifest"
@@ -96,14 +103,10 @@ class TestProjectionManager:
         dataset_id = "test_dataset"
         json_files = ["SERIES_1/year=2024/month=01/data.json"]
 
-        with patch(
-            "src.infrastructure.projections.projection_manager.StagingManager"
-        ) as mock_staging_manager_class:
-            mock_staging_manager = Mock()
+        with patch.object(projection_manager, "_staging_manager") as mock_staging_manager:
             mock_staging_manager.copy_from_version.return_value = [
                 "datasets/test_dataset/staging/SERIES_1/year=2024/month=01/data.json"
             ]
-            mock_staging_manager_class.return_value = mock_staging_manager
 
             projection_manager._copy_version_to_staging(version_id, dataset_id, json_files)  # noqa: SLF001
 
@@ -119,12 +122,7 @@ class TestProjectionManager:
 
         dataset_id = "test_dataset"
 
-        with patch(
-            "src.infrastructure.projections.projection_manager.ProjectionMerger"
-        ) as mock_merger_class:
-            mock_merger = Mock()
-            mock_merger_class.return_value = mock_merger
-
+        with patch.object(projection_manager, "_merger") as mock_merger:
             projection_manager._merge_staging_with_projections(dataset_id)  # noqa: SLF001
 
             mock_merger.merge_all_partitions.assert_called_once_with(dataset_id)
@@ -137,12 +135,7 @@ class TestProjectionManager:
 
         dataset_id = "test_dataset"
 
-        with patch(
-            "src.infrastructure.projections.projection_manager.AtomicProjectionMover"
-        ) as mock_mover_class:
-            mock_mover = Mock()
-            mock_mover_class.return_value = mock_mover
-
+        with patch.object(projection_manager, "_mover") as mock_mover:
             projection_manager._atomic_move_to_projections(dataset_id)  # noqa: SLF001
 
             mock_mover.move_staging_to_projections.assert_called_once_with(dataset_id)
@@ -155,12 +148,7 @@ class TestProjectionManager:
 
         dataset_id = "test_dataset"
 
-        with patch(
-            "src.infrastructure.projections.projection_manager.StagingManager"
-        ) as mock_staging_manager_class:
-            mock_staging_manager = Mock()
-            mock_staging_manager_class.return_value = mock_staging_manager
-
+        with patch.object(projection_manager, "_staging_manager") as mock_staging_manager:
             projection_manager._cleanup_staging(dataset_id)  # noqa: SLF001
 
             mock_staging_manager.clear_staging.assert_called_once_with(dataset_id)
@@ -179,12 +167,8 @@ class TestProjectionManager:
             "json_files": ["SERIES_1/year=2024/month=01/data.json"],
         }
 
-        with patch(
-            "src.infrastructure.projections.projection_manager.ManifestManager"
-        ) as mock_manifest_manager_class:
-            mock_manifest_manager = Mock()
+        with patch.object(projection_manager, "_manifest_manager") as mock_manifest_manager:
             mock_manifest_manager.load_manifest.return_value = expected_manifest
-            mock_manifest_manager_class.return_value = mock_manifest_manager
 
             result = projection_manager._load_manifest(version_id, dataset_id)  # noqa: SLF001
 
@@ -209,6 +193,8 @@ class TestProjectionManager:
         }
 
         with patch.object(
+            projection_manager, "_projection_manifest_manager"
+        ) as mock_projection_manifest_manager, patch.object(
             projection_manager, "_is_version_already_projected"
         ) as mock_is_projected, patch.object(
             projection_manager, "_load_manifest"
@@ -245,6 +231,8 @@ class TestProjectionManager:
         dataset_id = "test_dataset"
 
         with patch.object(
+            projection_manager, "_projection_manifest_manager"
+        ) as mock_projection_manifest_manager, patch.object(
             projection_manager, "_is_version_already_projected"
         ) as mock_is_projected, patch.object(
             projection_manager, "_load_manifest"
@@ -263,7 +251,9 @@ class TestProjectionManager:
 
             projection_manager.project_version(version_id, dataset_id)
 
-            mock_is_projected.assert_called_once_with(version_id, dataset_id)
+            projection_manifest = mock_projection_manifest_manager.load_or_empty.return_value
+            mock_projection_manifest_manager.load_or_empty.assert_called_once_with(dataset_id)
+            mock_is_projected.assert_called_once_with(version_id, projection_manifest)
             mock_load_manifest.assert_not_called()
             mock_copy.assert_not_called()
             mock_merge.assert_not_called()
@@ -271,47 +261,92 @@ class TestProjectionManager:
             mock_record.assert_not_called()
             mock_cleanup.assert_not_called()
 
-    def test_is_version_already_projected_calls_manifest_manager(
+    def test_is_version_already_projected_checks_projected_versions(self, projection_manager):
+        """Test that _is_version_already_projected looks the version up in the manifest."""
+        projection_manifest = {"projected_versions": ["v20240115_143022"]}
+
+        assert projection_manager._is_version_already_projected(  # noqa: SLF001
+            "v20240115_143022", projection_manifest
+        )
+        assert not projection_manager._is_version_already_projected(  # noqa: SLF001
+            "v20240116_143022", projection_manifest
+        )
+
+    def test_record_projected_version_calls_manifest_manager(
         self, projection_manager, mock_s3_client
     ):
-        """Test that _is_version_already_projected calls ProjectionManifestManager."""
+        """Test that _record_projected_version updates the already loaded manifest."""
         from unittest.mock import patch
 
         version_id = "v20240115_143022"
         dataset_id = "test_dataset"
+        projection_manifest = {"projected_versions": []}
 
-        with patch(
-            "src.infrastructure.projections.projection_manager.ProjectionManifestManager"
-        ) as mock_manifest_manager_class:
-            mock_manifest_manager = Mock()
-            mock_manifest_manager.is_version_projected.return_value = True
-            mock_manifest_manager_class.return_value = mock_manifest_manager
-
-            result = projection_manager._is_version_already_projected(version_id, dataset_id)  # noqa: SLF001
+        with patch.object(projection_manager, "_projection_manifest_manager") as mock_manifest_manager:
+            projection_manager._record_projected_version(  # noqa: SLF001
+                version_id, dataset_id, projection_manifest
+            )
 
-            mock_manifest_manager.is_version_projected.assert_called_once_with(
-                dataset_id, version_id
+            mock_manifest_manager.add_projected_version.assert_called_once_with(
+                dataset_id, version_id, projection_manifest
             )
-            assert result is True
 
-    def test_record_projected_version_calls_manifest_manager(
-        self, projection_manager, mock_s3_client
-    ):
-        """Test that _record_projected_version calls ProjectionManifestManager."""
+    def test_init_builds_collaborators_once(self, mock_s3_client):
+        """Test that collaborators are built once, each limited to its own worker count."""
         from unittest.mock import patch
 
-        version_id = "v20240115_143022"
-        dataset_id = "test_dataset"
-
-        with patch(
-            "src.infrastructure.projections.projection_manager.ProjectionManifestManager"
-        ) as mock_manifest_manager_class:
-            mock_manifest_manager = Mock()
-            mock_manifest_manager_class.return_value = mock_manifest_manager
+        module = "src.infrastructure.projections.projection_manager"
+        with patch(f"{module}.StagingManager") as mock_staging_manager_class, patch(
+            f"{module}.ProjectionMerger"
+        ) as mock_merger_class, patch(f"{module}.AtomicProjectionMover") as mock_mover_class:
+            projection_manager = ProjectionManager(
+                bucket="test-bucket", s3_client=mock_s3_client, copy_workers=1, merge_workers=4
+            )
 
-            projection_manager._record_projected_version(version_id, dataset_id)  # noqa: SLF001
+            for dataset_id in ("dataset_1", "dataset_2"):
+                projection_manager._cleanup_staging(dataset_id)  # noqa: SLF001
+                projection_manager._merge_staging_with_projections(dataset_id)  # noqa: SLF001
+                projection_manager._atomic_move_to_projections(dataset_id)  # noqa: SLF001
+
+        assert projection_manager._executor._max_workers == 4  # noqa: SLF001
+        mock_staging_manager_class.assert_called_once_with(
+            bucket="test-bucket",
+            s3_client=mock_s3_client,
+            copy_workers=1,
+            executor=ANY,
+        )
+        mock_merger_class.assert_called_once_with(
+            bucket="test-bucket",
+            s3_client=mock_s3_client,
+            merge_workers=4,
+            executor=ANY,
+            staging_manager=mock_staging_manager_class.return_value,
+        )
+        mock_mover_class.assert_called_once_with(
+            bucket="test-bucket",
+            s3_client=mock_s3_client,
+            copy_workers=1,
+            executor=ANY,
+        )
+        for mock_class in (mock_staging_manager_class, mock_merger_class, mock_mover_class):
+            executor = mock_class.call_args.kwargs["executor"]
+            assert isinstance(executor, BoundedExecutor)
+            assert executor._executor is projection_manager._executor  # noqa: SLF001
+        assert mock_mover_class.return_value.move_staging_to_projections.call_count == 2
+
+    def test_close_shuts_down_shared_executor(self, projection_manager):
+        """Test that close shuts down the worker pool shared by the phases."""
+        projection_manager.close()
+
+        with pytest.raises(RuntimeError):
+            projection_manager._executor.submit(print)  # noqa: SLF001
+
+    def test_init_sizes_s3_connection_pool_for_workers(self):
+        """Test that a created S3 client has at least one pooled connection per worker."""
+        from unittest.mock import patch
 
-            mock_manifest_manager.add_projected_version.assert_called_once_with(
-                dataset_id, version_id
-            )
+        with patch("src.infrastructure.projections.projection_manager.boto3") as mock_boto3:
+            ProjectionManager(bucket="test-bucket", copy_workers=8, merge_workers=80)
 
+        config = mock_boto3.client.call_args[1]["config"]
+        assert config.max_pool_connections == 80
@@ -221,3 +221,96 @@ class TestProjectionManifestManager:
         assert saved_manifest["last_projection_date"] is not None
         assert saved_manifest["last_projection_date"] != "2024-01-14T12:00:00Z"
 
+    def test_load_or_empty_returns_empty_manifest_when_not_exists(
+        self, manifest_manager, mock_s3_client
+    ):
+        """Test that load_or_empty returns an empty manifest when it doesn't exist."""
+        error_response = {"Error": {"Code": "NoSuchKey"}}
+        mock_s3_client.get_object.side_effect = ClientError(error_response, "GetObject")
+
+        manifest = manifest_manager.load_or_empty("test_dataset")
+
+        assert manifest["projected_versions"] == []
+        assert manifest["last_projected_version"] is None
+
+    def test_add_projected_version_updates_given_manifest_without_reading(
+        self, manifest_manager, mock_s3_client
+    ):
+        """Test that add_projected_version saves a passed-in manifest without reloading it."""
+        manifest = {
+            "projected_versions": ["v20240114_120000"],
+            "last_projection_date": "2024-01-14T12:00:00Z",
+            "last_projected_version": "v20240114_120000",
+        }
+
+        manifest_manager.add_projected_version("test_dataset", "v20240115_143022", manifest)
+
+        mock_s3_client.get_object.assert_not_called()
+        saved_manifest = json.loads(mock_s3_client.put_object.call_args[1]["Body"].decode("utf-8"))
+        assert saved_manifest["projected_versions"] == ["v20240114_120000", "v20240115_143022"]
+
+    def test_unchanged_manifest_is_revalidated_without_download(self, mock_s3_client):
+        """Test that cached manifests are revalidated with their ETag instead of re-read."""
+        s3 = _FakeS3()
+        mock_s3_client.get_object.side_effect = s3.get_object
+        mock_s3_client.put_object.side_effect = s3.put_object
+        manifest_manager = ProjectionManifestManager(bucket="test-bucket", s3_client=mock_s3_client)
+
+        manifest_manager.add_projected_version("test_dataset", "v20240115_143022")
+        assert manifest_manager.is_version_projected("test_dataset", "v20240115_143022") is True
+
+        assert mock_s3_client.get_object.call_args.kwargs["IfNoneMatch"] == s3.etag
+        assert s3.bodies_served == 0
+
+    def test_load_or_empty_sees_writes_from_another_instance(self, mock_s3_client):
+        """Test that a manifest saved by another run replaces the cached copy."""
+        s3 = _FakeS3()
+        mock_s3_client.get_object.side_effect = s3.get_object
+        mock_s3_client.put_object.side_effect = s3.put_object
+        first = ProjectionManifestManager(bucket="test-bucket", s3_client=mock_s3_client)
+        second = ProjectionManifestManager(bucket="test-bucket", s3_client=mock_s3_client)
+        first.add_projected_version("test_dataset", "v20240114_120000")
+
+        assert first.load_or_empty("test_dataset")["projected_versions"] == ["v20240114_120000"]
+        second.add_projected_version("test_dataset", "v20240115_143022")
+        manifest = first.load_or_empty("test_dataset")
+
+        assert manifest["projected_versions"] == ["v20240114_120000", "v20240115_143022"]
+
+    def test_cached_manifest_is_not_changed_by_callers(self, manifest_manager, mock_s3_client):
+        """Test that modifying a loaded manifest does not alter the cached copy."""
+        error_response = {"Error": {"Code": "NoSuchKey"}}
+        mock_s3_client.get_object.side_effect = ClientError(error_response, "GetObject")
+
+        manifest = manifest_manager.load_or_empty("test_dataset")
+        manifest["projected_versions"].append("v20240115_143022")
+
+        assert manifest_manager.is_version_projected("test_dataset", "v20240115_143022") is False
+
+
+class _FakeS3:
+    """Single-object S3 stand-in that honours ETags and IfNoneMatch."""
+
+    def __init__(self):
+        self.body = None
+        self.etag = None
+        self.version = 0
+        self.bodies_served = 0
+
+    def put_object(self, **kwargs):
+        self.version += 1
+        self.body = kwargs["Body"]
+        self.etag = f'"etag-{self.version}"'
+        return {"ETag": self.etag}
+
+    def get_object(self, **kwargs):
+        if self.body is None:
+            raise ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+        if kwargs.get("IfNoneMatch") == self.etag:
+            raise ClientError({"Error": {"Code": "304", "Message": "Not Modified"}}, "GetObject")
+        self.bodies_served += 1
+        body = Mock()
+        body.read.return_value = self.body
+        body.__enter__ = Mock(return_value=body)
+        body.__exit__ = Mock(return_value=None)
+        return {"Body": body, "ETag": self.etag}
@@ -1,12 +1,12 @@
 """Tests for ProjectionMerger."""
 
-import tempfile
+import io
+import json
 from datetime import datetime
-from pathlib import Path
 from unittest.mock import Mock, patch
 
-import json
 import pytest
+from botocore.exceptions import ClientError
 
 from src.infrastructure.projections.projection_merger import ProjectionMerger
 from tests.builders import DataPointBuilder
@@ -72,21 +72,23 @@ class TestProjectionMerger:
             },
         ]
 
-    def _create_json_file(self, data: list, file_path: Path) -> None:
-        """Helper to create a JSON file from data."""
-        # Serialize datetime objects to ISO format strings
-        json_data = []
-        for item in data:
-            json_item = {}
-            for key, value in item.items():
-                if isinstance(value, datetime):
-                    json_item[key] = value.isoformat()
-                else:
-                    json_item[key] = value
-            json_data.append(json_item)
-        
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(json_data, f, indent=2, ensure_ascii=False)
+    def _json_body(self, data: list) -> bytes:
+        """Helper to serialize data the way it is stored in S3."""
+        return json.dumps(data, default=datetime.isoformat, ensure_ascii=False).encode("utf-8")
+
+    def _mock_s3_objects(self, mock_s3_client, objects: dict) -> None:
+        """Helper to serve the given {key: data} objects from the mock S3 client."""
+
+        def get_object(**kwargs):  # noqa: N803
+            if kwargs["Key"] not in objects:
+                raise ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+            return {"Body": io.BytesIO(self._json_body(objects[kwargs["Key"]]))}
+
+        mock_s3_client.get_object.side_effect = get_object
+
+    def _uploaded_json(self, mock_s3_client) -> list:
+        """Helper to parse every document uploaded with put_object."""
+        return [json.loads(call[1]["Body"]) for call in mock_s3_client.put_object.call_args_list]
 
     def test_merge_partition_with_no_existing_projection(
         self, projection_merger, mock_s3_client, sample_data_staging
@@ -98,36 +100,14 @@ class TestProjectionMerger:
         staging_key = f"datasets/{dataset_id}/staging/{partition_path}/data.json"
 
         # Mock S3: staging exists, projections don't
-        with tempfile.TemporaryDirectory() as tmpdir:
-            staging_file = Path(tmpdir) / "staging.json"
-            self._create_json_file(sample_data_staging, staging_file)
-
-            def download_file(_Bucket, Key, Filename):  # noqa: N803
-                if Key == staging_key:
-                    import shutil
-
-                    shutil.copy(staging_file, Filename)
-
-            mock_s3_client.download_file.side_effect = download_file
-
-            def head_object(**kwargs):  # noqa: N803
-                Key = kwargs.get("Key")
-                if Key == staging_key:
-                    return {}
-                from botocore.exceptions import ClientError
-
-                error_response = {"Error": {"Code": "404"}}
-                raise ClientError(error_response, "HeadObject")
+        self._mock_s3_objects(mock_s3_client, {staging_key: sample_data_staging})
 
-            mock_s3_client.head_object.side_effect = head_object
-
-            # Mock upload
-            mock_s3_client.upload_file = Mock()
-
-            projection_merger.merge_partition(dataset_id, partition_path)
+        projection_merger.merge_partition(dataset_id, partition_path)
 
-            # Verify upload was called (merged data written back to staging)
-            assert mock_s3_client.upload_file.called
+        # Staging already holds the merged result: it is neither read nor rewritten
+        read_keys = [call[1]["Key"] for call in mock_s3_client.get_object.call_args_list]
+        assert staging_key not in read_keys
+        mock_s3_client.put_object.assert_not_called()
 
     def test_merge_partition_removes_duplicates(
         self, projection_merger, mock_s3_client, sample_data_staging, sample_data_projections
@@ -154,62 +134,32 @@ class TestProjectionMerger:
         ]
         staging_with_duplicate = sample_data_staging + duplicate_data
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            staging_file = Path(tmpdir) / "staging.json"
-            projections_file = Path(tmpdir) / "projections.json"
-            self._create_json_file(staging_with_duplicate, staging_file)
-            self._create_json_file(sample_data_projections, projections_file)
-
-            def download_file(_Bucket, Key, Filename):  # noqa: N803
-                import shutil
-
-                if Key == staging_key:
-                    shutil.copy(staging_file, Filename)
-                elif Key == projections_key:
-                    shutil.copy(projections_file, Filename)
-
-            mock_s3_client.download_file.side_effect = download_file
-            mock_s3_client.head_object.return_value = {}
-
-            uploaded_files = []
-            uploaded_content = []
-
-            def capture_upload(LocalFilename, _Bucket, Key):  # noqa: N803
-                uploaded_files.append((LocalFilename, Key))
-                # Read file content before it's deleted
-                if Path(LocalFilename).exists():
-                    with open(LocalFilename, encoding="utf-8") as f:
-                        data = json.load(f)
-                        uploaded_content.append(data)
-
-            mock_s3_client.upload_file.side_effect = capture_upload
-
-            projection_merger.merge_partition(dataset_id, partition_path)
+        self._mock_s3_objects(
+            mock_s3_client,
+            {staging_key: staging_with_duplicate, projections_key: sample_data_projections},
+        )
 
-            # Verify upload was called
-            assert mock_s3_client.upload_file.called
-            assert len(uploaded_files) == 1
-            assert len(uploaded_content) == 1
+        projection_merger.merge_partition(dataset_id, partition_path)
 
-            # Verify duplicate was removed by reading the captured content
-            data = uploaded_content[0]
-            # Should have 3 rows: 1 from projections + 2 from staging (duplicate removed)
-            assert len(data) == 3
+        uploaded_content = self._uploaded_json(mock_s3_client)
+        assert len(uploaded_content) == 1
 
-            # Verify the original value (99.0) is kept, not the duplicate (999.0)
-            # Find row with obs_time = 2024-01-14
-            target_time_str = datetime(2024, 1, 14, 12, 0, 0).isoformat()
+        # Verify duplicate was removed by reading the uploaded content
+        data = uploaded_content[0]
+        # Should have 3 rows: 1 from projections + 2 from staging (duplicate removed)
+        assert len(data) == 3
 
-            found_value = None
-            for item in data:
-                obs_time = item.get("obs_time")
-                if isinstance(obs_time, str):
-                    obs_time_dt = datetime.fromisoformat(obs_time.replace("Z", "+00:00"))
-                    if obs_time_dt.replace(tzinfo=None) == datetime(2024, 1, 14, 12, 0, 0) and item.get("internal_series_code") == "SERIES_1":
-                        found_value = item.get("value")
-                        break
+        # Verify the original value (99.0) is kept, not the duplicate (999.0)
+        found_value = None
+        for item in data:
+            obs_time = item.get("obs_time")
+            if isinstance(obs_time, str):
+                obs_time_dt = datetime.fromisoformat(obs_time.replace("Z", "+00:00"))
+                if obs_time_dt.replace(tzinfo=None) == datetime(2024, 1, 14, 12, 0, 0) and item.get("internal_series_code") == "SERIES_1":
+                    found_value = item.get("value")
+                    break
 
-            assert found_value == 99.0  # Original value, not 999.0
+        assert found_value == 99.0  # Original value, not 999.0
 
     def test_merge_partition_appends_new_data(
         self, projection_merger, mock_s3_client, sample_data_staging, sample_data_projections
@@ -221,91 +171,47 @@ class TestProjectionMerger:
         staging_key = f"datasets/{dataset_id}/staging/{partition_path}/data.json"
         projections_key = f"datasets/{dataset_id}/projections/{partition_path}/data.json"
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            staging_file = Path(tmpdir) / "staging.json"
-            projections_file = Path(tmpdir) / "projections.json"
-            self._create_json_file(sample_data_staging, staging_file)
-            self._create_json_file(sample_data_projections, projections_file)
-
-            def download_file(_Bucket, Key, Filename):  # noqa: N803
-                import shutil
-
-                if Key == staging_key:
-                    shutil.copy(staging_file, Filename)
-                elif Key == projections_key:
-                    shutil.copy(projections_file, Filename)
-
-            mock_s3_client.download_file.side_effect = download_file
-            mock_s3_client.head_object.return_value = {}
-
-            uploaded_content = []
-
-            def capture_upload(LocalFilename, _Bucket, _Key):  # noqa: N803
-                # Read file content before it's deleted
-                if Path(LocalFilename).exists():
-                    with open(LocalFilename, encoding="utf-8") as f:
-                        data = json.load(f)
-                        uploaded_content.append(data)
-
-            mock_s3_client.upload_file.side_effect = capture_upload
+        self._mock_s3_objects(
+            mock_s3_client,
+            {staging_key: sample_data_staging, projections_key: sample_data_projections},
+        )
 
-            projection_merger.merge_partition(dataset_id, partition_path)
+        projection_merger.merge_partition(dataset_id, partition_path)
 
-            # Verify merged data contains both old and new
-            assert len(uploaded_content) > 0
-            data = uploaded_content[0]
-            # Should have 3 rows: 1 from projections + 2 from staging
-            assert len(data) == 3
+        # Verify merged data contains both old and new
+        assert mock_s3_client.put_object.call_args[1]["Key"] == staging_key
+        assert mock_s3_client.put_object.call_args[1]["ContentType"] == "application/json"
+        uploaded_content = self._uploaded_json(mock_s3_client)
+        assert len(uploaded_content) == 1
+        # Should have 3 rows: 1 from projections + 2 from staging
+        assert len(uploaded_content[0]) == 3
 
     def test_merge_partition_handles_empty_staging(self, projection_merger, mock_s3_client):
         """Test merge when staging is empty (should keep projections as-is)."""
         dataset_id = "test_dataset"
         partition_path = "SERIES_1/year=2024/month=01"
 
-        staging_key = f"datasets/{dataset_id}/staging/{partition_path}/data.json"
         projections_key = f"datasets/{dataset_id}/projections/{partition_path}/data.json"
 
         # Mock: staging doesn't exist, projections exist
-        def head_object(**kwargs):  # noqa: N803
-            Key = kwargs.get("Key")
-            if Key == staging_key:
-                from botocore.exceptions import ClientError
-
-                error_response = {"Error": {"Code": "404"}}
-                raise ClientError(error_response, "HeadObject")
-            return {}
-
-        mock_s3_client.head_object.side_effect = head_object
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            projections_file = Path(tmpdir) / "projections.json"
-            sample_data = [
-                {
-                    **DataPointBuilder()
-                    .with_series_code("SERIES_1")
-                    .with_obs_time(datetime(2024, 1, 14, 12, 0, 0))
-                    .with_value(99.0)
-                    .with_unit("unit1")
-                    .with_frequency("D")
-                    .build(),
-                    "collection_date": datetime(2024, 1, 14, 14, 25, 0),
-                },
-            ]
-            self._create_json_file(sample_data, projections_file)
-
-            def download_file(_Bucket, Key, Filename):  # noqa: N803
-                import shutil
-
-                if Key == projections_key:
-                    shutil.copy(projections_file, Filename)
-
-            mock_s3_client.download_file.side_effect = download_file
-            mock_s3_client.upload_file = Mock()
+        sample_data = [
+            {
+                **DataPointBuilder()
+                .with_series_code("SERIES_1")
+                .with_obs_time(datetime(2024, 1, 14, 12, 0, 0))
+                .with_value(99.0)
+                .with_unit("unit1")
+                .with_frequency("D")
+                .build(),
+                "collection_date": datetime(2024, 1, 14, 14, 25, 0),
+            },
+        ]
+        self._mock_s3_objects(mock_s3_client, {projections_key: sample_data})
 
-            projection_merger.merge_partition(dataset_id, partition_path)
+        projection_merger.merge_partition(dataset_id, partition_path)
 
-            # Should still upload (projections data written to staging)
-            assert mock_s3_client.upload_file.called
+        # Should still upload (projections data written to staging)
+        assert mock_s3_client.put_object.called
 
     def test_merge_all_partitions_calls_merge_for_each_partition(
         self, projection_merger
@@ -339,21 +245,50 @@ class TestProjectionMerger:
                     dataset_id, "SERIES_2/year=2024/month=02"
                 )
 
-    def test_s3_object_exists_raises_non_404_errors(
+    def test_download_and_read_json_raises_non_404_errors(
         self, projection_merger, mock_s3_client
     ):
-        """Test that _s3_object_exists raises non-404 ClientErrors."""
-        from botocore.exceptions import ClientError
-
+        """Test that _download_and_read_json raises non-404 ClientErrors."""
         s3_key = "test-key"
         error_response = {"Error": {"Code": "AccessDenied"}}
 
-        mock_s3_client.head_object.side_effect = ClientError(
-            error_response, "HeadObject"
+        mock_s3_client.get_object.side_effect = ClientError(
+            error_response, "GetObject"
         )
 
         with pytest.raises(ClientError):
-            projection_merger._s3_object_exists(s3_key)  # noqa: SLF001
+            projection_merger._download_and_read_json(s3_key)  # noqa: SLF001
+
+    def test_download_and_read_json_returns_none_for_missing_key(
+        self, projection_merger, mock_s3_client
+    ):
+        """Test that a missing object is detected from the GET without a HEAD request."""
+        self._mock_s3_objects(mock_s3_client, {})
+
+        assert projection_merger._download_and_read_json("test-key") is None  # noqa: SLF001
+        mock_s3_client.head_object.assert_not_called()
+
+    def test_merge_partition_reads_legacy_nan_values(self, projection_merger, mock_s3_client):
+        """Test that projections written with NaN literals merge, dropping those rows."""
+        dataset_id = "test_dataset"
+        partition_path = "SERIES_1/year=2024/month=01"
+        staging_key = f"datasets/{dataset_id}/staging/{partition_path}/data.json"
+        projections_key = f"datasets/{dataset_id}/projections/{partition_path}/data.json"
+        self._mock_s3_objects(
+            mock_s3_client,
+            {
+                projections_key: [
+                    {"obs_time": "2024-01-01T00:00:00", "value": float("nan")},
+                    {"obs_time": "2024-01-02T00:00:00", "value": 1.0},
+                ],
+                staging_key: [{"obs_time": "2024-01-03T00:00:00", "value": 2.0}],
+            },
+        )
+
+        projection_merger.merge_partition(dataset_id, partition_path)
+
+        [merged] = self._uploaded_json(mock_s3_client)
+        assert [item["value"] for item in merged] == [1.0, 2.0]
 
     def test_merge_partition_handles_both_files_missing(
         self, projection_merger, mock_s3_client
@@ -363,20 +298,13 @@ class TestProjectionMerger:
         partition_path = "SERIES_1/year=2024/month=01"
 
         # Mock: both files don't exist
-        def head_object(**_kwargs):  # noqa: N803
-            from botocore.exceptions import ClientError
-
-            error_response = {"Error": {"Code": "404"}}
-            raise ClientError(error_response, "HeadObject")
-
-        mock_s3_client.head_object.side_effect = head_object
-        mock_s3_client.upload_file = Mock()
+        self._mock_s3_objects(mock_s3_client, {})
 
         # Should not raise, should complete without uploading
         projection_merger.merge_partition(dataset_id, partition_path)
 
         # Verify upload was not called (no data to merge)
-        mock_s3_client.upload_file.assert_not_called()
+        mock_s3_client.put_object.assert_not_called()
 
     def test_merge_all_partitions_uses_parallel_workers(
         self, projection_merger_parallel
@@ -458,3 +386,68 @@ class TestProjectionMerger:
             assert mock_merge_partition.call_count == 2
             mock_merge_partition.assert_any_call(dataset_id, "SERIES_1/year=2024/month=01")
             mock_merge_partition.assert_any_call(dataset_id, "SERIES_2/year=2024/month=02")
+
+    def test_merge_json_data_matches_datetimes_with_their_iso_strings(self, projection_merger):
+        """Test that a datetime obs_time deduplicates against the same ISO string."""
+        projections_data = [
+            {"obs_time": "2024-01-14T12:00:00", "internal_series_code": "SERIES_1", "value": 99.0}
+        ]
+        staging_data = [
+            {
+                "obs_time": datetime(2024, 1, 14, 12, 0, 0),
+                "internal_series_code": "SERIES_1",
+                "value": 999.0,
+            },
+            {"obs_time": "2024-01-15T12:00:00", "internal_series_code": "SERIES_1", "value": 100.0},
+        ]
+
+        merged = projection_merger._merge_json_data(projections_data, staging_data)  # noqa: SLF001
+
+        assert [item["value"] for item in merged] == [99.0, 100.0]
+
+    def test_merge_all_partitions_runs_on_shared_executor(self, mock_s3_client):
+        """Test that a shared executor is used for merges and left running afterwards."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        partitions = ["SERIES_1/year=2024/month=01", "SERIES_2/year=2024/month=02"]
+        mock_staging_manager = Mock()
+        mock_staging_manager.list_staging_partitions.return_value = partitions
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            projection_merger = ProjectionMerger(
+                bucket="test-bucket", s3_client=mock_s3_client, executor=executor
+            )
+            with patch(
+                "src.infrastructure.projections.projection_merger.StagingManager",
+                return_value=mock_staging_manager,
+            ), patch(
+                "src.infrastructure.projections.projection_merger.ThreadPoolExecutor"
+            ) as mock_executor_class, patch.object(
+                projection_merger, "merge_partition"
+            ) as mock_merge_partition:
+                projection_merger.merge_all_partitions("test_dataset")
+
+            mock_executor_class.assert_not_called()
+            assert mock_merge_partition.call_count == 2
+            # Still usable: the merger does not shut down an executor it does not own
+            assert executor.submit(lambda: 1).result() == 1
+
+    def test_merge_all_partitions_lists_with_injected_staging_manager(self, mock_s3_client):
+        """Test that an injected staging manager is reused instead of creating one per merge."""
+        mock_staging_manager = Mock()
+        mock_staging_manager.list_staging_partitions.return_value = ["SERIES_1/year=2024/month=01"]
+        projection_merger = ProjectionMerger(
+            bucket="test-bucket", s3_client=mock_s3_client, staging_manager=mock_staging_manager
+        )
+
+        with patch(
+            "src.infrastructure.projections.projection_merger.StagingManager"
+        ) as mock_staging_manager_class, patch.object(
+            projection_merger, "merge_partition"
+        ) as mock_merge_partition:
+            projection_merger.merge_all_partitions("test_dataset")
+            projection_merger.merge_all_partitions("test_dataset")
+
+        mock_staging_manager_class.assert_not_called()
+        assert mock_staging_manager.list_staging_partitions.call_count == 2
+        assert mock_merge_partition.call_count == 2
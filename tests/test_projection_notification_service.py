@@ -93,3 +93,11 @@ class TestProjectionNotificationService:
             mock_boto3_client.assert_called_once_with("sns", region_name="us-east-1")
             mock_sns.publish.assert_called_once()
 
+    def test_sns_client_not_created_until_first_notification(self):
+        """Test that the SNS client is only created when a notification is published."""
+        topic_arn = "arn:aws:sns:us-east-1:123456789012:projection-updates"
+
+        with patch("boto3.client") as mock_boto3_client:
+            ProjectionNotificationService(topic_arn=topic_arn)
+
+            mock_boto3_client.assert_not_called()
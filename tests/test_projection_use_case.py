@@ -45,3 +45,23 @@ class TestProjectionUseCase:
         with pytest.raises(ValueError, match="Manifest not found"):
             projection_use_case.execute_projection(version_id, dataset_id)
 
+    def test_execute_projection_notifies_with_dataset_paths(self, mock_projection_manager):
+        """Test that notifications carry the version manifest and projections paths."""
+        notification_service = Mock()
+        projection_use_case = ProjectionUseCase(
+            projection_manager=mock_projection_manager,
+            notification_service=notification_service,
+            bucket="test-bucket",
+        )
+        mock_projection_manager.project_version.return_value = True
+
+        projection_use_case.execute_projection("v1", "test_dataset")
+        projection_use_case.execute_projection("v2", "test_dataset")
+
+        notification_service.notify_projection_update.assert_called_with(
+            dataset_id="test_dataset",
+            bucket="test-bucket",
+            version_manifest_path="datasets/test_dataset/versions/v2/manifest.json",
+            projections_path="datasets/test_dataset/projections/",
+        )
+
@@ -3,6 +3,7 @@
 # Access to protected members is necessary for testing internal components
 # pylint: disable=protected-access
 
+import hashlib
 from datetime import datetime
 from unittest.mock import Mock, patch
 
@@ -57,13 +58,13 @@ class TestS3VersionedLoader:
         """Test that load creates a new version."""
         with (
             patch.object(loader._version_manager, "create_new_version") as mock_create_version,
-            patch.object(loader._json_writer, "write_to_json") as mock_write,
+            patch.object(loader._json_writer, "iter_json_files") as mock_write,
             patch.object(loader._manifest_manager, "create_manifest"),
             patch.object(loader._manifest_manager, "save_manifest"),
-            patch.object(loader._s3_client, "upload_file"),
+            patch.object(loader._s3_client, "put_object"),
         ):
             mock_create_version.return_value = "v20240115_143022"
-            mock_write.return_value = ["SERIES_1/year=2024/month=01/data.json"]
+            mock_write.return_value = [("SERIES_1/year=2024/month=01/data.json", b"[]")]
 
             loader.load(sample_data, config)
 
@@ -73,13 +74,13 @@ class TestS3VersionedLoader:
         """Test that load writes JSON files."""
         with (
             patch.object(loader._version_manager, "create_new_version") as mock_create_version,
-            patch.object(loader._json_writer, "write_to_json") as mock_write,
+            patch.object(loader._json_writer, "iter_json_files") as mock_write,
             patch.object(loader._manifest_manager, "create_manifest"),
             patch.object(loader._manifest_manager, "save_manifest"),
-            patch.object(loader._s3_client, "upload_file"),
+            patch.object(loader._s3_client, "put_object"),
         ):
             mock_create_version.return_value = "v20240115_143022"
-            mock_write.return_value = ["SERIES_1/year=2024/month=01/data.json"]
+            mock_write.return_value = [("SERIES_1/year=2024/month=01/data.json", b"[]")]
 
             loader.load(sample_data, config)
 
@@ -89,46 +90,52 @@ class TestS3VersionedLoader:
         """Test that load uploads JSON files to S3."""
         with (
             patch.object(loader._version_manager, "create_new_version") as mock_create_version,  # type: ignore[attr-defined]
-            patch.object(loader._json_writer, "write_to_json") as mock_write,  # type: ignore[attr-defined]
+            patch.object(loader._json_writer, "iter_json_files") as mock_write,  # type: ignore[attr-defined]
             patch.object(loader._manifest_manager, "create_manifest"),  # type: ignore[attr-defined]
             patch.object(loader._manifest_manager, "save_manifest"),  # type: ignore[attr-defined]
         ):
             mock_create_version.return_value = "v20240115_143022"
-            mock_write.return_value = ["SERIES_1/year=2024/month=01/data.json"]
+            mock_write.return_value = [("SERIES_1/year=2024/month=01/data.json", b"[]")]
 
             loader.load(sample_data, config)
 
-            assert mock_s3_client.upload_file.called
+            mock_s3_client.put_object.assert_any_call(
+                Bucket="test-bucket",
+                Key="datasets/test_dataset/versions/v20240115_143022/data/SERIES_1/year=2024/month=01/data.json",
+                Body=b"[]",
+            )
 
     def test_load_creates_and_saves_manifest(self, loader, config, sample_data):
         """Test that load creates and saves manifest."""
         with (
             patch.object(loader._version_manager, "create_new_version") as mock_create_version,
-            patch.object(loader._json_writer, "write_to_json") as mock_write,
+            patch.object(loader._json_writer, "iter_json_files") as mock_write,
             patch.object(loader._manifest_manager, "create_manifest") as mock_create_manifest,
             patch.object(loader._manifest_manager, "save_manifest") as mock_save_manifest,
-            patch.object(loader._s3_client, "upload_file"),
+            patch.object(loader._s3_client, "put_object"),
         ):
             mock_create_version.return_value = "v20240115_143022"
-            mock_write.return_value = ["SERIES_1/year=2024/month=01/data.json"]
+            mock_write.return_value = [("SERIES_1/year=2024/month=01/data.json", b"[]")]
 
             loader.load(sample_data, config)
 
             assert mock_create_manifest.called
             assert mock_save_manifest.called
+            # Checksums are only recorded for skip_unchanged_files
+            assert mock_create_manifest.call_args.kwargs["file_checksums"] is None
 
     def test_load_updates_current_version(self, loader, config, sample_data):
         """Test that load updates current version pointer."""
         with (
             patch.object(loader._version_manager, "create_new_version") as mock_create_version,
             patch.object(loader._version_manager, "set_current_version") as mock_set_version,
-            patch.object(loader._json_writer, "write_to_json") as mock_write,
+            patch.object(loader._json_writer, "iter_json_files") as mock_write,
             patch.object(loader._manifest_manager, "create_manifest"),
             patch.object(loader._manifest_manager, "save_manifest"),
-            patch.object(loader._s3_client, "upload_file"),
+            patch.object(loader._s3_client, "put_object"),
         ):
             mock_create_version.return_value = "v20240115_143022"
-            mock_write.return_value = ["SERIES_1/year=2024/month=01/data.json"]
+            mock_write.return_value = [("SERIES_1/year=2024/month=01/data.json", b"[]")]
 
             loader.load(sample_data, config)
 
@@ -138,10 +145,10 @@ class TestS3VersionedLoader:
         """Test that load skips version creation when data is empty."""
         with (
             patch.object(loader._version_manager, "create_new_version") as mock_create_version,  # type: ignore[attr-defined]
-            patch.object(loader._json_writer, "write_to_json") as mock_write,  # type: ignore[attr-defined]
+            patch.object(loader._json_writer, "iter_json_files") as mock_write,  # type: ignore[attr-defined]
             patch.object(loader._manifest_manager, "create_manifest") as mock_create_manifest,  # type: ignore[attr-defined]
             patch.object(loader._manifest_manager, "save_manifest"),  # type: ignore[attr-defined]
-            patch.object(loader._s3_client, "upload_file"),  # type: ignore[attr-defined]
+            patch.object(loader._s3_client, "put_object"),  # type: ignore[attr-defined]
         ):
             loader.load([], config)
 
@@ -165,3 +172,109 @@ class TestS3VersionedLoader:
         config = {"dataset_id": "test_dataset", "load": {}}
         with pytest.raises(ValueError, match="must include 'load.bucket'"):
             S3VersionedLoader(config=config)
+
+    def test_s3_client_exposes_client_in_use(self, loader, mock_s3_client):
+        """Test that the s3_client property returns the client the loader writes with."""
+        assert loader.s3_client is mock_s3_client
+
+    def test_load_uploads_files_in_parallel_when_configured(self, mock_s3_client, config, sample_data):
+        """Test that upload_workers > 1 uploads every file through the thread pool."""
+        config["load"]["upload_workers"] = 4
+        loader = S3VersionedLoader(s3_client=mock_s3_client, config=config)
+        json_files = [f"SERIES_{i}/year=2024/month=01/data.json" for i in range(5)]
+
+        with (
+            patch.object(loader._version_manager, "create_new_version") as mock_create_version,
+            patch.object(loader._json_writer, "iter_json_files") as mock_write,
+            patch.object(loader._manifest_manager, "create_manifest"),
+            patch.object(loader._manifest_manager, "save_manifest"),
+        ):
+            mock_create_version.return_value = "v20240115_143022"
+            mock_write.return_value = [(rel_path, b"[]") for rel_path in json_files]
+
+            loader.load(sample_data, config)
+
+        uploaded_keys = sorted(
+            call.kwargs["Key"]
+            for call in mock_s3_client.put_object.call_args_list
+            if "/data/" in call.kwargs["Key"]
+        )
+        assert uploaded_keys == sorted(
+            f"datasets/test_dataset/versions/v20240115_143022/data/{rel_path}" for rel_path in json_files
+        )
+
+    def test_init_shares_default_s3_client_per_region(self, config):
+        """Test that loaders without an injected client share one S3 client per region."""
+        with patch("src.infrastructure.plugins.loaders.s3_versioned_loader.boto3") as mock_boto3:
+            from src.infrastructure.plugins.loaders.s3_versioned_loader import _get_default_s3_client
+
+            _get_default_s3_client.cache_clear()
+            try:
+                first = S3VersionedLoader(config=config)
+                second = S3VersionedLoader(config=config)
+            finally:
+                _get_default_s3_client.cache_clear()
+
+        assert first.s3_client is second.s3_client
+        mock_boto3.client.assert_called_once()
+
+    def test_init_sizes_default_client_pool_for_workers(self, config):
+        """Test that the default client has a connection per worker beyond the minimum."""
+        config["load"]["upload_workers"] = 80
+        config["load"]["projection"] = {"copy_workers": 120, "merge_workers": 10}
+        with patch("src.infrastructure.plugins.loaders.s3_versioned_loader.boto3") as mock_boto3:
+            from src.infrastructure.plugins.loaders.s3_versioned_loader import _get_default_s3_client
+
+            _get_default_s3_client.cache_clear()
+            try:
+                S3VersionedLoader(config=config)
+            finally:
+                _get_default_s3_client.cache_clear()
+
+        client_config = mock_boto3.client.call_args.kwargs["config"]
+        assert client_config.max_pool_connections == 120
+
+    def test_load_copies_unchanged_files_when_configured(self, mock_s3_client, config, sample_data):
+        """Test that skip_unchanged_files copies files unchanged since the current version."""
+        config["load"]["skip_unchanged_files"] = True
+        loader = S3VersionedLoader(s3_client=mock_s3_client, config=config)
+        unchanged = "SERIES_1/year=2024/month=01/data.json"
+        changed = "SERIES_1/year=2024/month=02/data.json"
+
+        with (
+            patch.object(loader._version_manager, "create_new_version") as mock_create_version,
+            patch.object(loader._version_manager, "get_current_version") as mock_current_version,
+            patch.object(loader._manifest_manager, "load_manifest") as mock_load_manifest,
+            patch.object(loader._json_writer, "iter_json_files") as mock_write,
+            patch.object(loader._manifest_manager, "create_manifest") as mock_create_manifest,
+            patch.object(loader._manifest_manager, "save_manifest"),
+        ):
+            mock_create_version.return_value = "v20240215_143022"
+            mock_current_version.return_value = "v20240115_143022"
+            mock_load_manifest.return_value = {
+                "file_checksums": {
+                    unchanged: hashlib.md5(b"[1]").hexdigest(),
+                    changed: hashlib.md5(b"[2]").hexdigest(),
+                }
+            }
+            mock_write.return_value = [(unchanged, b"[1]"), (changed, b"[3]")]
+
+            loader.load(sample_data, config)
+
+        mock_s3_client.copy_object.assert_called_once_with(
+            Bucket="test-bucket",
+            Key=f"datasets/test_dataset/versions/v20240215_143022/data/{unchanged}",
+            CopySource={
+                "Bucket": "test-bucket",
+                "Key": f"datasets/test_dataset/versions/v20240115_143022/data/{unchanged}",
+            },
+        )
+        mock_s3_client.put_object.assert_any_call(
+            Bucket="test-bucket",
+            Key=f"datasets/test_dataset/versions/v20240215_143022/data/{changed}",
+            Body=b"[3]",
+        )
+        assert mock_create_manifest.call_args.kwargs["file_checksums"] == {
+            unchanged: hashlib.md5(b"[1]").hexdigest(),
+            changed: hashlib.md5(b"[3]").hexdigest(),
+        }
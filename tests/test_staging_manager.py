@@ -74,14 +74,16 @@ class TestStagingManager:
         dataset_id = "test_dataset"
 
         # Mock empty S3 response
-        mock_s3_client.list_objects_v2.return_value = {"Contents": []}
+        mock_s3_client.get_paginator.return_value.paginate.return_value = [{"Contents": []}]
 
         result = staging_manager.list_staging_partitions(dataset_id)
 
         assert result == []
-        mock_s3_client.list_objects_v2.assert_called_once_with(
+        mock_s3_client.get_paginator.assert_called_once_with("list_objects_v2")
+        mock_s3_client.get_paginator.return_value.paginate.assert_called_once_with(
             Bucket="test-bucket",
             Prefix=f"datasets/{dataset_id}/staging/",
+            PaginationConfig={"PageSize": 1000},
         )
 
     def test_list_staging_partitions_extracts_partitions(self, staging_manager, mock_s3_client):
@@ -89,15 +91,17 @@ class TestStagingManager:
         dataset_id = "test_dataset"
 
         # Mock S3 response with multiple files in same partition
-        mock_s3_client.list_objects_v2.return_value = {
-            "Contents": [
-                {"Key": f"datasets/{dataset_id}/staging/SERIES_1/year=2024/month=01/data.json"},
-                {
-                    "Key": f"datasets/{dataset_id}/staging/SERIES_1/year=2024/month=01/part-00001.json"
-                },
-                {"Key": f"datasets/{dataset_id}/staging/SERIES_2/year=2024/month=02/data.json"},
-            ]
-        }
+        mock_s3_client.get_paginator.return_value.paginate.return_value = [
+            {
+                "Contents": [
+                    {"Key": f"datasets/{dataset_id}/staging/SERIES_1/year=2024/month=01/data.json"},
+                    {
+                        "Key": f"datasets/{dataset_id}/staging/SERIES_1/year=2024/month=01/part-00001.json"
+                    },
+                    {"Key": f"datasets/{dataset_id}/staging/SERIES_2/year=2024/month=02/data.json"},
+                ]
+            }
+        ]
 
         result = staging_manager.list_staging_partitions(dataset_id)
 
@@ -113,31 +117,72 @@ class TestStagingManager:
         dataset_id = "test_dataset"
 
         # Mock S3 response with files
-        mock_s3_client.list_objects_v2.return_value = {
-            "Contents": [
-                {"Key": f"datasets/{dataset_id}/staging/SERIES_1/year=2024/month=01/data.json"},
-                {"Key": f"datasets/{dataset_id}/staging/SERIES_2/year=2024/month=02/data.json"},
-            ]
-        }
-        mock_s3_client.delete_object = Mock()
+        mock_s3_client.get_paginator.return_value.paginate.return_value = [
+            {
+                "Contents": [
+                    {"Key": f"datasets/{dataset_id}/staging/SERIES_1/year=2024/month=01/data.json"},
+                    {"Key": f"datasets/{dataset_id}/staging/SERIES_2/year=2024/month=02/data.json"},
+                ]
+            }
+        ]
+        mock_s3_client.delete_objects.return_value = {}
+
+        staging_manager.clear_staging(dataset_id)
+
+        # Verify all files were deleted in a single batch request
+        mock_s3_client.delete_objects.assert_called_once_with(
+            Bucket="test-bucket",
+            Delete={
+                "Objects": [
+                    {"Key": f"datasets/{dataset_id}/staging/SERIES_1/year=2024/month=01/data.json"},
+                    {"Key": f"datasets/{dataset_id}/staging/SERIES_2/year=2024/month=02/data.json"},
+                ],
+                "Quiet": True,
+            },
+        )
+
+    def test_clear_staging_deletes_in_batches_of_1000(self, staging_manager, mock_s3_client):
+        """Test that clear_staging splits large staging areas into 1000-key requests."""
+        dataset_id = "test_dataset"
+        keys = [f"datasets/{dataset_id}/staging/SERIES_{i}/data.json" for i in range(2500)]
+        mock_s3_client.get_paginator.return_value.paginate.return_value = [
+            {"Contents": [{"Key": k} for k in keys]}
+        ]
+        mock_s3_client.delete_objects.return_value = {}
 
         staging_manager.clear_staging(dataset_id)
 
-        # Verify delete was called for each file
-        assert mock_s3_client.delete_object.call_count == 2
+        batch_sizes = sorted(
+            len(call.kwargs["Delete"]["Objects"])
+            for call in mock_s3_client.delete_objects.call_args_list
+        )
+        assert batch_sizes == [500, 1000, 1000]
+
+    def test_clear_staging_raises_when_files_fail_to_delete(self, staging_manager, mock_s3_client):
+        """Test that clear_staging raises when S3 reports keys it could not delete."""
+        dataset_id = "test_dataset"
+        key = f"datasets/{dataset_id}/staging/SERIES_1/year=2024/month=01/data.json"
+        mock_s3_client.get_paginator.return_value.paginate.return_value = [
+            {"Contents": [{"Key": key}]}
+        ]
+        mock_s3_client.delete_objects.return_value = {
+            "Errors": [{"Key": key, "Code": "AccessDenied", "Message": "Access Denied"}]
+        }
+
+        with pytest.raises(RuntimeError, match="Failed to delete 1 file"):
+            staging_manager.clear_staging(dataset_id)
 
     def test_clear_staging_handles_empty_staging(self, staging_manager, mock_s3_client):
         """Test that clear_staging handles empty staging gracefully."""
         dataset_id = "test_dataset"
 
         # Mock empty S3 response
-        mock_s3_client.list_objects_v2.return_value = {"Contents": []}
-        mock_s3_client.delete_object = Mock()
+        mock_s3_client.get_paginator.return_value.paginate.return_value = [{"Contents": []}]
 
         staging_manager.clear_staging(dataset_id)
 
         # Verify delete was not called
-        mock_s3_client.delete_object.assert_not_called()
+        mock_s3_client.delete_objects.assert_not_called()
 
     def test_list_staging_partitions_handles_response_without_contents_key(
         self, staging_manager, mock_s3_client
@@ -146,7 +191,7 @@ class TestStagingManager:
         dataset_id = "test_dataset"
 
         # Mock S3 response without Contents key
-        mock_s3_client.list_objects_v2.return_value = {}
+        mock_s3_client.get_paginator.return_value.paginate.return_value = [{}]
 
         result = staging_manager.list_staging_partitions(dataset_id)
 
@@ -158,7 +203,9 @@ class TestStagingManager:
 
         # Mock ClientError with NoSuchKey
         error_response = {"Error": {"Code": "NoSuchKey"}}
-        mock_s3_client.list_objects_v2.side_effect = ClientError(error_response, "ListObjectsV2")
+        mock_s3_client.get_paginator.return_value.paginate.side_effect = ClientError(
+            error_response, "ListObjectsV2"
+        )
 
         result = staging_manager.list_staging_partitions(dataset_id)
 
@@ -172,7 +219,9 @@ class TestStagingManager:
 
         # Mock ClientError with different error code
         error_response = {"Error": {"Code": "AccessDenied"}}
-        mock_s3_client.list_objects_v2.side_effect = ClientError(error_response, "ListObjectsV2")
+        mock_s3_client.get_paginator.return_value.paginate.side_effect = ClientError(
+            error_response, "ListObjectsV2"
+        )
 
         with pytest.raises(ClientError):
             staging_manager.list_staging_partitions(dataset_id)
@@ -183,7 +232,9 @@ class TestStagingManager:
 
         # Mock ClientError with NoSuchKey
         error_response = {"Error": {"Code": "NoSuchKey"}}
-        mock_s3_client.list_objects_v2.side_effect = ClientError(error_response, "ListObjectsV2")
+        mock_s3_client.get_paginator.return_value.paginate.side_effect = ClientError(
+            error_response, "ListObjectsV2"
+        )
 
         # Should not raise, should return gracefully
         staging_manager.clear_staging(dataset_id)
@@ -195,12 +246,14 @@ class TestStagingManager:
         dataset_id = "test_dataset"
 
         # Mock S3 response with a key that doesn't match the prefix
-        mock_s3_client.list_objects_v2.return_value = {
-            "Contents": [
-                {"Key": f"datasets/{dataset_id}/staging/SERIES_1/year=2024/month=01/data.json"},
-                {"Key": f"datasets/{dataset_id}/other/SERIES_2/year=2024/month=02/data.json"},
-            ]
-        }
+        mock_s3_client.get_paginator.return_value.paginate.return_value = [
+            {
+                "Contents": [
+                    {"Key": f"datasets/{dataset_id}/staging/SERIES_1/year=2024/month=01/data.json"},
+                    {"Key": f"datasets/{dataset_id}/other/SERIES_2/year=2024/month=02/data.json"},
+                ]
+            }
+        ]
 
         result = staging_manager.list_staging_partitions(dataset_id)
 
@@ -275,3 +328,34 @@ class TestStagingManager:
         # Verify all files were copied (sequential or parallel, result should be same)
         assert mock_s3_client.copy_object.call_count == 2
         assert len(result) == 2
+
+    def test_list_staging_partitions_lists_sub_prefixes_in_parallel(
+        self, staging_manager_parallel, mock_s3_client
+    ):
+        """Test that parallel workers list every top-level staging sub-prefix separately."""
+        dataset_id = "test_dataset"
+        prefix = f"datasets/{dataset_id}/staging/"
+
+        def paginate(**kwargs):
+            if kwargs.get("Delimiter") == "/":
+                return [
+                    {
+                        "CommonPrefixes": [
+                            {"Prefix": f"{prefix}SERIES_1/"},
+                            {"Prefix": f"{prefix}SERIES_2/"},
+                        ]
+                    }
+                ]
+            return [{"Contents": [{"Key": f"{kwargs['Prefix']}year=2024/month=01/data.json"}]}]
+
+        mock_s3_client.get_paginator.return_value.paginate.side_effect = paginate
+
+        result = staging_manager_parallel.list_staging_partitions(dataset_id)
+
+        assert result == ["SERIES_1/year=2024/month=01", "SERIES_2/year=2024/month=01"]
+        listed_prefixes = sorted(
+            call.kwargs["Prefix"]
+            for call in mock_s3_client.get_paginator.return_value.paginate.call_args_list
+            if "Delimiter" not in call.kwargs
+        )
+        assert listed_prefixes == [f"{prefix}SERIES_1/", f"{prefix}SERIES_2/"]
@@ -70,6 +70,29 @@ class TestVersionManager:
             Bucket="test-bucket", Key="datasets/test_dataset/index/current_version.txt"
         )
 
+    def test_get_current_version_uses_cached_value_when_not_modified(
+        self, version_manager, mock_s3_client
+    ):
+        """Test that repeated reads send the ETag and reuse the cached pointer on 304."""
+        mock_body = Mock()
+        mock_body.read.return_value = b"v20240115_143022"
+        mock_body.__enter__ = Mock(return_value=mock_body)
+        mock_body.__exit__ = Mock(return_value=None)
+        mock_s3_client.get_object.side_effect = [
+            {"Body": mock_body, "ETag": '"abc123"'},
+            ClientError({"Error": {"Code": "304", "Message": "Not Modified"}}, "GetObject"),
+        ]
+
+        first = version_manager.get_current_version("test_dataset")
+        second = version_manager.get_current_version("test_dataset")
+
+        assert first == second == "v20240115_143022"
+        mock_s3_client.get_object.assert_called_with(
+            Bucket="test-bucket",
+            Key="datasets/test_dataset/index/current_version.txt",
+            IfNoneMatch='"abc123"',
+        )
+
     def test_set_current_version_writes_to_index(self, version_manager, mock_s3_client):
         """Test that set_current_version writes version to index file."""
         version_manager.set_current_version("test_dataset", "v20240115_143022")
@@ -82,29 +105,29 @@ class TestVersionManager:
 
     def test_list_versions_returns_all_versions(self, version_manager, mock_s3_client):
         """Test that list_versions returns all version IDs from S3."""
-        mock_s3_client.list_objects_v2.return_value = {
-            "Contents": [
-                {"Key": "datasets/test_dataset/versions/v20240115_143022/manifest.json"},
-                {"Key": "datasets/test_dataset/versions/v20240114_120000/manifest.json"},
-                {"Key": "datasets/test_dataset/versions/v20240113_100000/manifest.json"},
-            ]
-        }
+        mock_s3_client.get_paginator.return_value.paginate.return_value = [
+            {
+                "CommonPrefixes": [
+                    {"Prefix": "datasets/test_dataset/versions/v20240114_120000/"},
+                    {"Prefix": "datasets/test_dataset/versions/v20240113_100000/"},
+                ]
+            },
+            {"CommonPrefixes": [{"Prefix": "datasets/test_dataset/versions/v20240115_143022/"}]},
+        ]
 
         versions = version_manager.list_versions("test_dataset")
 
-        assert len(versions) == 3
-        assert "v20240115_143022" in versions
-        assert "v20240114_120000" in versions
-        assert "v20240113_100000" in versions
-        mock_s3_client.list_objects_v2.assert_called_once_with(
-            Bucket="test-bucket", Prefix="datasets/test_dataset/versions/"
+        assert versions == ["v20240115_143022", "v20240114_120000", "v20240113_100000"]
+        mock_s3_client.get_paginator.assert_called_once_with("list_objects_v2")
+        mock_s3_client.get_paginator.return_value.paginate.assert_called_once_with(
+            Bucket="test-bucket", Prefix="datasets/test_dataset/versions/", Delimiter="/"
         )
 
     def test_list_versions_returns_empty_list_when_no_versions_exist(
         self, version_manager, mock_s3_client
     ):
         """Test that list_versions returns empty list when no versions exist."""
-        mock_s3_client.list_objects_v2.return_value = {"Contents": []}
+        mock_s3_client.get_paginator.return_value.paginate.return_value = [{"KeyCount": 0}]
 
         versions = version_manager.list_versions("test_dataset")
 
@@ -113,7 +136,7 @@ class TestVersionManager:
     def test_list_versions_handles_missing_prefix(self, version_manager, mock_s3_client):
         """Test that list_versions handles case when prefix doesn't exist."""
         error = ClientError({"Error": {"Code": "NoSuchKey"}}, "ListObjectsV2")
-        mock_s3_client.list_objects_v2.side_effect = error
+        mock_s3_client.get_paginator.return_value.paginate.side_effect = error
 
         versions = version_manager.list_versions("test_dataset")
 
@@ -130,8 +153,8 @@ class TestVersionManager:
             version_manager.get_current_version("test_dataset")
 
     def test_list_versions_returns_empty_when_no_contents(self, version_manager, mock_s3_client):
-        """Test that list_versions returns empty list when response has no Contents."""
-        mock_s3_client.list_objects_v2.return_value = {}  # No "Contents" key
+        """Test that list_versions returns empty list when response has no CommonPrefixes."""
+        mock_s3_client.get_paginator.return_value.paginate.return_value = [{}]
 
         versions = version_manager.list_versions("test_dataset")
 
@@ -142,7 +165,7 @@ class TestVersionManager:
     ):
         """Test that list_versions raises error on non-NoSuchKey ClientError."""
         error = ClientError({"Error": {"Code": "AccessDenied"}}, "ListObjectsV2")
-        mock_s3_client.list_objects_v2.side_effect = error
+        mock_s3_client.get_paginator.return_value.paginate.side_effect = error
 
         with pytest.raises(ClientError):
             version_manager.list_versions("test_dataset")
@@ -78,3 +78,24 @@ class TestYamlConfigLoader:
         result = config_loader.load_dataset_config("test")
         assert result["source"] == "yml"
 
+    def test_load_dataset_config_returns_independent_copies(self, config_loader, temp_config_dir):
+        """Test that mutating a loaded config does not affect later loads."""
+        with open(temp_config_dir / "test.yml", "w", encoding="utf-8") as f:
+            yaml.dump({"dataset_id": "test", "source": {"kind": "http"}}, f)
+
+        first = config_loader.load_dataset_config("test")
+        first["source"]["kind"] = "mutated"
+
+        second = config_loader.load_dataset_config("test")
+        assert second["source"]["kind"] == "http"
+
+    def test_load_dataset_config_reloads_modified_file(self, config_loader, temp_config_dir):
+        """Test that a modified file is parsed again instead of served from cache."""
+        config_file = temp_config_dir / "test.yml"
+        with open(config_file, "w", encoding="utf-8") as f:
+            yaml.dump({"dataset_id": "test", "source": "old"}, f)
+        assert config_loader.load_dataset_config("test")["source"] == "old"
+
+        with open(config_file, "w", encoding="utf-8") as f:
+            yaml.dump({"dataset_id": "test", "source": "updated"}, f)
+        assert config_loader.load_dataset_config("test")["source"] == "updated"